@@ -1,25 +1,22 @@
 # rubiks_solver/cube/cube.py
 
-from .moves import MOVE_FUNCS, VALID_MOVES
-import copy
+from .moves import MOVE_FUNCS
+from .state import CubeState, as_state
+from .validation import validate_state
 
 class Cube:
     def __init__(self, state=None):
-        # Default state: Solved cube, faces listed as [U, R, F, D, L, B]
-        self.state = copy.deepcopy(state) if state else [
-            ['W']*9,  # Up
-            ['R']*9,  # Right
-            ['G']*9,  # Front
-            ['Y']*9,  # Down
-            ['O']*9,  # Left
-            ['B']*9   # Back
-        ]
+        # Default state: Solved cube, faces listed as [U, R, F, D, L, B].
+        # Any nested list (colour ints or 'W', 'R', ... letters) is converted
+        # once to an immutable CubeState, so it is never copied again.
+        self.state = as_state(state) if state is not None else CubeState.solved()
 
     def copy(self):
-        return Cube(copy.deepcopy(self.state))
+        # CubeState is immutable, so the copy can share it
+        return Cube(self.state)
 
     def apply_move(self, move):
-        assert move in VALID_MOVES, f"Invalid move: {move}"
+        assert move in MOVE_FUNCS, f"Invalid move: {move}"
         self.state = MOVE_FUNCS[move](self.state)
 
     def apply_moves(self, moves):
@@ -27,4 +24,12 @@ class Cube:
             self.apply_move(m)
 
     def is_solved(self):
-        return all(all(sticker == face[0] for sticker in face) for face in self.state)
+        return self.state.is_solved()
+
+    def to_letters(self):
+        # Faces as colour letters (W, R, G, Y, O, B)
+        return self.state.to_letters()
+
+    def validate(self):
+        # Structured check that this state can be reached by legal moves
+        return validate_state(self.state)
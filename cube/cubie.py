@@ -0,0 +1,295 @@
+# rubiks_solver/cube/cubie.py
+
+"""
+Cubie-level cube model
+Describes a cube by the permutation and orientation of its 8 corners and
+12 edges, and maps it to and from the 54-sticker face layout used by
+cube/moves.py. Coordinates (twist, flip, permutation ranks) built on top
+of this model are what table-driven solvers and scramblers work with.
+"""
+
+from math import factorial
+
+from .moves import MOVE_FUNCS
+from .state import CubeState, SOLVED_STATE
+
+# Corner and edge names, in position order (Kociemba convention)
+CORNERS = ['URF', 'UFL', 'ULB', 'UBR', 'DFR', 'DLF', 'DBL', 'DRB']
+EDGES = ['UR', 'UF', 'UL', 'UB', 'DR', 'DF', 'DL', 'DB', 'FR', 'FL', 'BL', 'BR']
+
+# Face order of the sticker state: [U, R, F, D, L, B], 9 stickers each
+FACES = 'URFDLB'
+
+# Sticker indices (face * 9 + sticker) of each corner/edge position.
+# The first sticker of each piece is its U/D (or F/B for slice edges) sticker,
+# which is the reference for orientation.
+CORNER_FACELETS = [
+    [8, 9, 20],    # URF
+    [6, 18, 38],   # UFL
+    [0, 36, 47],   # ULB
+    [2, 45, 11],   # UBR
+    [29, 26, 15],  # DFR
+    [27, 44, 24],  # DLF
+    [33, 53, 42],  # DBL
+    [35, 17, 51],  # DRB
+]
+
+EDGE_FACELETS = [
+    [5, 10],   # UR
+    [7, 19],   # UF
+    [3, 37],   # UL
+    [1, 46],   # UB
+    [32, 16],  # DR
+    [28, 25],  # DF
+    [30, 43],  # DL
+    [34, 52],  # DB
+    [23, 12],  # FR
+    [21, 41],  # FL
+    [50, 39],  # BL
+    [48, 14],  # BR
+]
+
+# Face colours of each piece in its home position
+CORNER_COLORS = [[f // 9 for f in facelets] for facelets in CORNER_FACELETS]
+EDGE_COLORS = [[f // 9 for f in facelets] for facelets in EDGE_FACELETS]
+
+N_TWIST = 3 ** 7        # corner orientations
+N_FLIP = 2 ** 11        # edge orientations
+N_CORNER_PERM = factorial(8)
+N_EDGE_PERM = factorial(12)
+
+
+def _rank_permutation(perm):
+    """Lehmer rank of a permutation of range(len(perm))"""
+    n = len(perm)
+    rank = 0
+    for i in range(n):
+        smaller = 0
+        for j in range(i + 1, n):
+            if perm[j] < perm[i]:
+                smaller += 1
+        rank = rank * (n - i) + smaller
+    return rank
+
+
+def _unrank_permutation(rank, n):
+    """Inverse of _rank_permutation"""
+    digits = []
+    for base in range(1, n + 1):
+        digits.append(rank % base)
+        rank //= base
+    digits.reverse()
+    available = list(range(n))
+    return [available.pop(d) for d in digits]
+
+
+def permutation_parity(perm):
+    """Return 0 for an even permutation, 1 for an odd one"""
+    parity = 0
+    seen = [False] * len(perm)
+    for i in range(len(perm)):
+        if seen[i]:
+            continue
+        j = i
+        length = 0
+        while not seen[j]:
+            seen[j] = True
+            j = perm[j]
+            length += 1
+        parity ^= (length - 1) & 1
+    return parity
+
+
+class CubieCube:
+    """
+    Cube described at piece level
+
+    cp[i]: corner sitting in corner position i
+    co[i]: twist of that corner (0-2, clockwise)
+    ep[i]: edge sitting in edge position i
+    eo[i]: flip of that edge (0-1)
+    """
+
+    def __init__(self, cp=None, co=None, ep=None, eo=None):
+        self.cp = list(cp) if cp is not None else list(range(8))
+        self.co = list(co) if co is not None else [0] * 8
+        self.ep = list(ep) if ep is not None else list(range(12))
+        self.eo = list(eo) if eo is not None else [0] * 12
+
+    def copy(self):
+        return CubieCube(self.cp, self.co, self.ep, self.eo)
+
+    def __eq__(self, other):
+        return (isinstance(other, CubieCube) and self.cp == other.cp and self.co == other.co
+                and self.ep == other.ep and self.eo == other.eo)
+
+    def __repr__(self):
+        return f"CubieCube(cp={self.cp}, co={self.co}, ep={self.ep}, eo={self.eo})"
+
+    # ------------------------------------------------------------------
+    # Group operations
+    # ------------------------------------------------------------------
+
+    def multiply(self, other):
+        """Return self * other (apply self, then other)"""
+        cp = [self.cp[other.cp[i]] for i in range(8)]
+        co = [(self.co[other.cp[i]] + other.co[i]) % 3 for i in range(8)]
+        ep = [self.ep[other.ep[i]] for i in range(12)]
+        eo = [(self.eo[other.ep[i]] + other.eo[i]) % 2 for i in range(12)]
+        return CubieCube(cp, co, ep, eo)
+
+    def inverse(self):
+        cp = [0] * 8
+        co = [0] * 8
+        ep = [0] * 12
+        eo = [0] * 12
+        for i in range(8):
+            cp[self.cp[i]] = i
+        for i in range(8):
+            co[i] = (3 - self.co[cp[i]]) % 3
+        for i in range(12):
+            ep[self.ep[i]] = i
+        for i in range(12):
+            eo[i] = self.eo[ep[i]]
+        return CubieCube(cp, co, ep, eo)
+
+    def apply_move(self, move):
+        """Return the cube after a single move (e.g. "R", "U'", "F2")"""
+        return self.multiply(MOVE_CUBES[move])
+
+    def apply_moves(self, moves):
+        result = self
+        for move in moves:
+            result = result.multiply(MOVE_CUBES[move])
+        return result
+
+    def is_solved(self):
+        return self == SOLVED
+
+    # ------------------------------------------------------------------
+    # Coordinates
+    # ------------------------------------------------------------------
+
+    def get_twist(self):
+        twist = 0
+        for i in range(7):
+            twist = twist * 3 + self.co[i]
+        return twist
+
+    def set_twist(self, twist):
+        total = 0
+        for i in range(6, -1, -1):
+            self.co[i] = twist % 3
+            total += self.co[i]
+            twist //= 3
+        self.co[7] = (3 - total % 3) % 3
+
+    def get_flip(self):
+        flip = 0
+        for i in range(11):
+            flip = flip * 2 + self.eo[i]
+        return flip
+
+    def set_flip(self, flip):
+        total = 0
+        for i in range(10, -1, -1):
+            self.eo[i] = flip % 2
+            total += self.eo[i]
+            flip //= 2
+        self.eo[11] = total % 2
+
+    def get_corner_perm(self):
+        return _rank_permutation(self.cp)
+
+    def set_corner_perm(self, index):
+        self.cp = _unrank_permutation(index, 8)
+
+    def get_edge_perm(self):
+        return _rank_permutation(self.ep)
+
+    def set_edge_perm(self, index):
+        self.ep = _unrank_permutation(index, 12)
+
+    def corner_parity(self):
+        return permutation_parity(self.cp)
+
+    def edge_parity(self):
+        return permutation_parity(self.ep)
+
+    # ------------------------------------------------------------------
+    # Sticker conversion
+    # ------------------------------------------------------------------
+
+    def to_facelets(self):
+        """Return the 54 sticker colours (0-5 in URFDLB order) as a flat list"""
+        facelets = [i // 9 for i in range(54)]
+        for i in range(8):
+            corner, twist = self.cp[i], self.co[i]
+            for k in range(3):
+                facelets[CORNER_FACELETS[i][(k + twist) % 3]] = CORNER_COLORS[corner][k]
+        for i in range(12):
+            edge, flip = self.ep[i], self.eo[i]
+            for k in range(2):
+                facelets[EDGE_FACELETS[i][(k + flip) % 2]] = EDGE_COLORS[edge][k]
+        return facelets
+
+    def to_state(self):
+        """Return the sticker state as a CubeState"""
+        return CubeState(self.to_facelets())
+
+    @classmethod
+    def from_facelets(cls, facelets):
+        """
+        Build a CubieCube from 54 sticker colours (0-5, URFDLB order)
+
+        Raises ValueError if a corner or edge has a colour combination
+        that does not exist on a real cube.
+        """
+        cube = cls()
+        for i in range(8):
+            colors = [facelets[f] for f in CORNER_FACELETS[i]]
+            for twist in range(3):
+                if colors[twist] in (0, 3):
+                    break
+            else:
+                raise ValueError(f"Corner position {CORNERS[i]} has no U/D sticker")
+            key = (colors[twist], colors[(twist + 1) % 3], colors[(twist + 2) % 3])
+            for corner in range(8):
+                if tuple(CORNER_COLORS[corner]) == key:
+                    cube.cp[i] = corner
+                    cube.co[i] = twist
+                    break
+            else:
+                raise ValueError(f"Corner position {CORNERS[i]} holds unknown piece {key}")
+        for i in range(12):
+            colors = [facelets[f] for f in EDGE_FACELETS[i]]
+            for edge in range(12):
+                if EDGE_COLORS[edge] == colors:
+                    cube.ep[i] = edge
+                    cube.eo[i] = 0
+                    break
+                if EDGE_COLORS[edge] == colors[::-1]:
+                    cube.ep[i] = edge
+                    cube.eo[i] = 1
+                    break
+            else:
+                raise ValueError(f"Edge position {EDGES[i]} holds unknown piece {tuple(colors)}")
+        return cube
+
+    @classmethod
+    def from_state(cls, state):
+        """Build a CubieCube from a CubeState (or nested [U, R, F, D, L, B] lists)"""
+        if isinstance(state, CubeState):
+            return cls.from_facelets(state.stickers)
+        return cls.from_facelets([sticker for face in state for sticker in face])
+
+
+SOLVED = CubieCube()
+
+
+def _build_move_cubes():
+    """Derive the cubie form of every move from the sticker moves"""
+    return {move: CubieCube.from_state(func(SOLVED_STATE)) for move, func in MOVE_FUNCS.items()}
+
+
+MOVE_CUBES = _build_move_cubes()
@@ -1,9 +1,18 @@
 # rubiks_solver/cube/moves.py
 
-import copy
+from .state import as_state, make_permuter
 
 VALID_MOVES = ['U', "U'", 'D', "D'", 'R', "R'", 'L', "L'", 'F', "F'", 'B', "B'"]
 
+# Half turns used by pattern algorithms and scrambles (not expanded by BFS search)
+HALF_TURN_MOVES = ['U2', 'D2', 'R2', 'L2', 'F2', 'B2']
+ALL_MOVES = VALID_MOVES + HALF_TURN_MOVES
+
+# Middle-layer turns used by some patterns (M follows L, E follows D, S
+# follows F). They move centres, so solvers never use them; apply_moves
+# accepts them.
+SLICE_MOVES = ['M', "M'", 'M2', 'E', "E'", 'E2', 'S', "S'", 'S2']
+
 def rotate_face(face, times=1):
     # Rotate a face (list of 9) clockwise (times times)
     for _ in range(times % 4):
@@ -12,39 +21,23 @@ def rotate_face(face, times=1):
                 face[8], face[5], face[2]]
     return face
 
-# Helper to swap slices among the affected edge stickers for each move:
-def move_U(state):
-    s = copy.deepcopy(state)
+# Clockwise quarter turns on a nested [U, R, F, D, L, B] list, in place.
+# They define the cube geometry and are only run once, on index-labelled
+# stickers, to derive the sticker permutation of every move below.
+def turn_U(s):
     s[0] = rotate_face(s[0])  # Up
     # U layer: swap edge triplets among F, R, B, L
     F, R, B, L = s[2], s[1], s[5], s[4]
     F0, R0, B0, L0 = F[:3], R[:3], B[:3], L[:3]
     F[:3], R[:3], B[:3], L[:3] = R0, B0, L0, F0
-    return s
-
-def move_Uprime(state):
-    # U' = U x3
-    s = copy.deepcopy(state)
-    for _ in range(3):
-        s = move_U(s)
-    return s
 
-def move_D(state):
-    s = copy.deepcopy(state)
+def turn_D(s):
     s[3] = rotate_face(s[3])
     F, R, B, L = s[2], s[1], s[5], s[4]
     F3, R3, B3, L3 = F[6:], R[6:], B[6:], L[6:]
     F[6:], R[6:], B[6:], L[6:] = L3, F3, R3, B3
-    return s
 
-def move_Dprime(state):
-    s = copy.deepcopy(state)
-    for _ in range(3):
-        s = move_D(s)
-    return s
-
-def move_R(state):
-    s = copy.deepcopy(state)
+def turn_R(s):
     s[1] = rotate_face(s[1])
     U, F, D, B = s[0], s[2], s[3], s[5]
     # right column: U2-5-8, F2-5-8, D2-5-8, B6-3-0 (order reversed due to orientation)
@@ -52,40 +45,24 @@ def move_R(state):
     F2, F5, F8 = F[2], F[5], F[8]
     D2, D5, D8 = D[2], D[5], D[8]
     B6, B3, B0 = B[6], B[3], B[0]
-    U[2], U[5], U[8] = B6, B3, B0
-    F[2], F[5], F[8] = U2, U5, U8
-    D[2], D[5], D[8] = F2, F5, F8
-    B[6], B[3], B[0] = D2, D5, D8
-    return s
-
-def move_Rprime(state):
-    s = copy.deepcopy(state)
-    for _ in range(3):
-        s = move_R(s)
-    return s
-
-def move_L(state):
-    s = copy.deepcopy(state)
+    U[2], U[5], U[8] = F2, F5, F8
+    B[6], B[3], B[0] = U2, U5, U8
+    D[2], D[5], D[8] = B6, B3, B0
+    F[2], F[5], F[8] = D2, D5, D8
+
+def turn_L(s):
     s[4] = rotate_face(s[4])
     U, F, D, B = s[0], s[2], s[3], s[5]
     U0, U3, U6 = U[0], U[3], U[6]
     F0, F3, F6 = F[0], F[3], F[6]
     D0, D3, D6 = D[0], D[3], D[6]
     B8, B5, B2 = B[8], B[5], B[2]
-    U[0], U[3], U[6] = F0, F3, F6
-    F[0], F[3], F[6] = D0, D3, D6
-    D[0], D[3], D[6] = B8, B5, B2
-    B[8], B[5], B[2] = U0, U3, U6
-    return s
-
-def move_Lprime(state):
-    s = copy.deepcopy(state)
-    for _ in range(3):
-        s = move_L(s)
-    return s
-
-def move_F(state):
-    s = copy.deepcopy(state)
+    F[0], F[3], F[6] = U0, U3, U6
+    D[0], D[3], D[6] = F0, F3, F6
+    B[8], B[5], B[2] = D0, D3, D6
+    U[0], U[3], U[6] = B8, B5, B2
+
+def turn_F(s):
     s[2] = rotate_face(s[2])
     U, R, D, L = s[0], s[1], s[3], s[4]
     U6, U7, U8 = U[6], U[7], U[8]
@@ -96,16 +73,8 @@ def move_F(state):
     R[0], R[3], R[6] = U6, U7, U8
     D[2], D[1], D[0] = R0, R3, R6
     L[8], L[5], L[2] = D2, D1, D0
-    return s
-
-def move_Fprime(state):
-    s = copy.deepcopy(state)
-    for _ in range(3):
-        s = move_F(s)
-    return s
 
-def move_B(state):
-    s = copy.deepcopy(state)
+def turn_B(s):
     s[5] = rotate_face(s[5])
     U, R, D, L = s[0], s[1], s[3], s[4]
     U0, U1, U2 = U[0], U[1], U[2]
@@ -116,15 +85,91 @@ def move_B(state):
     R[2], R[5], R[8] = D8, D7, D6
     D[8], D[7], D[6] = L6, L3, L0
     L[6], L[3], L[0] = U0, U1, U2
-    return s
 
-def move_Bprime(state):
-    s = copy.deepcopy(state)
-    for _ in range(3):
-        s = move_B(s)
-    return s
+def turn_M(s):
+    U, F, D, B = s[0], s[2], s[3], s[5]
+    U1, U4, U7 = U[1], U[4], U[7]
+    F1, F4, F7 = F[1], F[4], F[7]
+    D1, D4, D7 = D[1], D[4], D[7]
+    B7, B4, B1 = B[7], B[4], B[1]
+    F[1], F[4], F[7] = U1, U4, U7
+    D[1], D[4], D[7] = F1, F4, F7
+    B[7], B[4], B[1] = D1, D4, D7
+    U[1], U[4], U[7] = B7, B4, B1
+
+def turn_E(s):
+    F, R, B, L = s[2], s[1], s[5], s[4]
+    F3, R3, B3, L3 = F[3:6], R[3:6], B[3:6], L[3:6]
+    F[3:6], R[3:6], B[3:6], L[3:6] = L3, F3, R3, B3
 
-# Map the move names to functions
+def turn_S(s):
+    U, R, D, L = s[0], s[1], s[3], s[4]
+    U3, U4, U5 = U[3], U[4], U[5]
+    R1, R4, R7 = R[1], R[4], R[7]
+    D5, D4, D3 = D[5], D[4], D[3]
+    L7, L4, L1 = L[7], L[4], L[1]
+    U[3], U[4], U[5] = L7, L4, L1
+    R[1], R[4], R[7] = U3, U4, U5
+    D[5], D[4], D[3] = R1, R4, R7
+    L[7], L[4], L[1] = D5, D4, D3
+
+FACE_TURNS = {'U': turn_U, 'D': turn_D, 'R': turn_R, 'L': turn_L, 'F': turn_F, 'B': turn_B}
+SLICE_TURNS = {'M': turn_M, 'E': turn_E, 'S': turn_S}
+
+def sticker_permutation(turn, times=1):
+    # Label every sticker with its index, turn, and read the labels back:
+    # after the move, sticker i holds what was at position perm[i]
+    s = [list(range(f * 9, f * 9 + 9)) for f in range(6)]
+    for _ in range(times):
+        turn(s)
+    return tuple(label for face in s for label in face)
+
+# Sticker permutation of every move: X (clockwise), X' (= X x3), X2 (= X x2)
+MOVE_PERMS = {}
+for _face, _turn in list(FACE_TURNS.items()) + list(SLICE_TURNS.items()):
+    MOVE_PERMS[_face] = sticker_permutation(_turn, 1)
+    MOVE_PERMS[_face + "'"] = sticker_permutation(_turn, 3)
+    MOVE_PERMS[_face + '2'] = sticker_permutation(_turn, 2)
+
+_PERMUTERS = {move: make_permuter(perm) for move, perm in MOVE_PERMS.items()}
+
+def _make_move(move):
+    permute = _PERMUTERS[move]
+
+    def apply(state):
+        # Nested lists are converted once; CubeStates go straight through
+        return permute(as_state(state))
+
+    apply.__name__ = 'move_' + move.replace("'", 'prime')
+    return apply
+
+move_U = _make_move('U')
+move_Uprime = _make_move("U'")
+move_D = _make_move('D')
+move_Dprime = _make_move("D'")
+move_R = _make_move('R')
+move_Rprime = _make_move("R'")
+move_L = _make_move('L')
+move_Lprime = _make_move("L'")
+move_F = _make_move('F')
+move_Fprime = _make_move("F'")
+move_B = _make_move('B')
+move_Bprime = _make_move("B'")
+move_U2 = _make_move('U2')
+move_D2 = _make_move('D2')
+move_R2 = _make_move('R2')
+move_L2 = _make_move('L2')
+move_F2 = _make_move('F2')
+move_B2 = _make_move('B2')
+
+def apply_moves(state, moves):
+    """Apply a sequence of moves to a state; returns a new CubeState"""
+    state = as_state(state)
+    for move in moves:
+        state = _PERMUTERS[move](state)
+    return state
+
+# Map the move names to functions (each takes and returns a CubeState)
 MOVE_FUNCS = {
     'U': move_U,
     "U'": move_Uprime,
@@ -138,4 +183,10 @@ MOVE_FUNCS = {
     "F'": move_Fprime,
     'B': move_B,
     "B'": move_Bprime,
+    'U2': move_U2,
+    'D2': move_D2,
+    'R2': move_R2,
+    'L2': move_L2,
+    'F2': move_F2,
+    'B2': move_B2,
 }
@@ -0,0 +1,153 @@
+# rubiks_solver/cube/pocket.py
+
+"""
+2x2x2 (pocket cube) model
+A pocket cube is the 8 corners of a 3x3x3 cube, so its sticker moves are
+derived from the 3x3x3 ones in cube/moves.py by keeping only the corner
+stickers. States hold 24 stickers in [U, R, F, D, L, B] face order, 4 per
+face in reading order (same orientation as the 3x3x3 net). Without
+centres the colour scheme is read from the DBL corner, which every
+2x2x2 solver keeps fixed.
+"""
+
+from collections import Counter
+
+from .cube import Cube
+from .cubie import CubieCube, CORNER_FACELETS, CORNER_COLORS
+from .moves import MOVE_PERMS, ALL_MOVES
+from .state import StickerState
+from .validation import ValidationResult, SHAPE, STICKER_COUNT, PIECE, TWIST
+
+# 3x3x3 sticker (within a face) shown by each of the 4 pocket stickers
+FACE_CORNERS = (0, 2, 6, 8)
+
+_SOLVED_STICKERS = bytes(i // 4 for i in range(24))
+
+
+def _pocket_index(index):
+    """3x3x3 sticker index -> pocket sticker index (corner stickers only)"""
+    return index // 9 * 4 + FACE_CORNERS.index(index % 9)
+
+
+# Pocket sticker indices of each corner position, reference sticker first
+POCKET_CORNER_FACELETS = [[_pocket_index(f) for f in facelets] for facelets in CORNER_FACELETS]
+
+# Corner kept in place by 2x2x2 solvers (only U, R and F are turned)
+FIXED_CORNER = 6    # DBL
+
+# Sticker permutation of every move, restricted to the corners
+POCKET_MOVE_PERMS = {
+    move: tuple(_pocket_index(MOVE_PERMS[move][f * 9 + k]) for f in range(6) for k in FACE_CORNERS)
+    for move in ALL_MOVES
+}
+
+# Colour tuple (as face indices) -> (piece, twist), for every rotation
+_CORNER_LOOKUP = {}
+for _corner, _colors in enumerate(CORNER_COLORS):
+    for _twist in range(3):
+        _CORNER_LOOKUP[tuple(_colors[(k - _twist) % 3] for k in range(3))] = (_corner, _twist)
+
+
+class PocketState(StickerState):
+    """Immutable 24-sticker pocket cube state (hashable, shares the CubeState API)"""
+
+    __slots__ = ()
+
+    FACE_SIZE = 4
+
+    @classmethod
+    def solved(cls):
+        return SOLVED_POCKET_STATE
+
+    @classmethod
+    def from_cube_state(cls, state):
+        """Corner stickers of a 3x3x3 CubeState"""
+        stickers = state.stickers
+        return cls(bytes(stickers[f * 9 + k] for f in range(6) for k in FACE_CORNERS))
+
+    def is_solved(self):
+        """Every face shows a single colour (in any orientation of the whole cube)"""
+        s = self._stickers
+        return all(s[i] == s[i + 1] == s[i + 2] == s[i + 3] for i in range(0, 24, 4))
+
+
+SOLVED_POCKET_STATE = PocketState(_SOLVED_STICKERS)
+
+
+def as_pocket_state(state):
+    """Return state as a PocketState (accepts nested/flat lists and 3x3x3 CubeStates)"""
+    if isinstance(state, PocketState):
+        return state
+    if hasattr(state, 'stickers') and len(state.stickers) == 54:
+        return PocketState.from_cube_state(state)
+    return PocketState.from_faces(state)
+
+
+def pocket_apply_moves(state, moves):
+    """Apply a sequence of moves to a pocket state; returns a new PocketState"""
+    state = as_pocket_state(state)
+    for move in moves:
+        state = state.permute(POCKET_MOVE_PERMS[move])
+    return state
+
+
+def validate_pocket_state(state):
+    """
+    Check that a pocket cube state is reachable, reading the colour scheme
+    from the DBL corner
+
+    Returns:
+        ValidationResult; for valid states cubie is a CubieCube whose
+        corners describe the state with DBL solved (edges are unused)
+    """
+    try:
+        stickers = list(as_pocket_state(state).stickers)
+    except (ValueError, KeyError, TypeError):
+        return ValidationResult(SHAPE, "Expected 6 faces of 4 stickers")
+
+    counts = Counter(stickers)
+    if len(counts) != 6 or any(count != 4 for count in counts.values()):
+        return ValidationResult(STICKER_COUNT, f"Expected 6 colours, 4 stickers each: {dict(counts)}")
+
+    # Colours on the fixed corner name their faces; the opposite faces
+    # follow from the standard scheme (colour c is opposite (c + 3) % 6)
+    face_of = {}
+    for position, face in zip(POCKET_CORNER_FACELETS[FIXED_CORNER], CORNER_COLORS[FIXED_CORNER]):
+        color = stickers[position]
+        face_of[color] = face
+        face_of[(color + 3) % 6] = (face + 3) % 6
+    if len(face_of) != 6:
+        return ValidationResult(PIECE, "The DBL corner shows opposite colours")
+    facelets = [face_of.get(color) for color in stickers]
+
+    cube = CubieCube()
+    seen = [False] * 8
+    for i, positions in enumerate(POCKET_CORNER_FACELETS):
+        key = tuple(facelets[p] for p in positions)
+        piece = _CORNER_LOOKUP.get(key)
+        if piece is None:
+            return ValidationResult(PIECE, f"Corner position {i} has impossible colours {key}")
+        if seen[piece[0]]:
+            return ValidationResult(PIECE, f"Corner {piece[0]} appears twice")
+        seen[piece[0]] = True
+        cube.cp[i], cube.co[i] = piece
+    if sum(cube.co) % 3:
+        return ValidationResult(TWIST, "A corner is twisted")
+    return ValidationResult(cubie=cube)
+
+
+class PocketCube(Cube):
+    """Cube interface for the 2x2x2: same methods, 24-sticker PocketState"""
+
+    def __init__(self, state=None):
+        self.state = as_pocket_state(state) if state is not None else PocketState.solved()
+
+    def copy(self):
+        return PocketCube(self.state)
+
+    def apply_move(self, move):
+        assert move in POCKET_MOVE_PERMS, f"Invalid move: {move}"
+        self.state = self.state.permute(POCKET_MOVE_PERMS[move])
+
+    def validate(self):
+        return validate_pocket_state(self.state)
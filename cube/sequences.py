@@ -0,0 +1,97 @@
+# rubiks_solver/cube/sequences.py
+
+"""
+Bulk evaluation of move sequences
+Sequences that start the same way (pattern algorithms opening with
+R U R', replayed scrambles, corpus jobs) are stored in a trie whose nodes
+are their distinct prefixes. Each node's state is computed once from its
+parent's with a single sticker permutation, so evaluating the whole set
+costs one move per trie node instead of one per move of every sequence.
+"""
+
+from .moves import MOVE_PERMS, _PERMUTERS
+from .state import CubeState, as_state
+
+
+class MoveTrie:
+    def __init__(self, sequences=()):
+        """
+        Trie over move sequences
+        sequences: Initial sequences (lists of move names); more can be added
+
+        Node 0 is the empty prefix. Nodes are numbered in creation order,
+        so a parent always comes before its children.
+        """
+        self.parents = [-1]
+        self.moves = [None]
+        self.depths = [0]
+        self._children = [{}]
+        self.ends = []              # node of each added sequence
+        for moves in sequences:
+            self.add(moves)
+
+    def add(self, moves):
+        """
+        Add a sequence; returns its index
+        Raises ValueError for moves apply_moves does not know
+        """
+        unsupported = [move for move in moves if move not in MOVE_PERMS]
+        if unsupported:
+            raise ValueError(f"Unsupported moves {unsupported}")
+        node = 0
+        for move in moves:
+            child = self._children[node].get(move)
+            if child is None:
+                child = len(self.parents)
+                self._children[node][move] = child
+                self._children.append({})
+                self.parents.append(node)
+                self.moves.append(move)
+                self.depths.append(self.depths[node] + 1)
+            node = child
+        self.ends.append(node)
+        return len(self.ends) - 1
+
+    def __len__(self):
+        return len(self.ends)
+
+    @property
+    def node_count(self):
+        """Number of distinct non-empty prefixes (moves applied by evaluate)"""
+        return len(self.parents) - 1
+
+    def path(self, node):
+        """Nodes from the first move down to node (the empty prefix excluded)"""
+        nodes = []
+        while node > 0:
+            nodes.append(node)
+            node = self.parents[node]
+        nodes.reverse()
+        return nodes
+
+    def evaluate(self, start=None, intermediate=False):
+        """
+        Apply every sequence to a start state (solved if None)
+
+        Returns:
+            One entry per sequence, in the order they were added: its final
+            CubeState, or with intermediate=True the list of states after
+            each of its moves (empty for an empty sequence)
+        """
+        states = [as_state(start) if start is not None else CubeState.solved()]
+        parents, moves = self.parents, self.moves
+        # Parents precede children, so one forward pass sees every parent
+        # state before it is needed
+        for node in range(1, len(parents)):
+            states.append(_PERMUTERS[moves[node]](states[parents[node]]))
+        if not intermediate:
+            return [states[node] for node in self.ends]
+        return [[states[n] for n in self.path(node)] for node in self.ends]
+
+
+def apply_many(sequences, start=None, intermediate=False):
+    """
+    Apply many move sequences to one start state, sharing common prefixes
+    See MoveTrie.evaluate for the result
+    """
+    return MoveTrie(sequences).evaluate(start, intermediate)
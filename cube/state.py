@@ -0,0 +1,198 @@
+# rubiks_solver/cube/state.py
+
+"""
+Immutable cube state
+A CubeState holds the 54 sticker colours as bytes in [U, R, F, D, L, B]
+face order (9 stickers per face, colours 0-5 = the face they belong to
+when solved). It is hashable with a precomputed hash and never changes,
+so states can be shared, cached and put in sets without copying.
+"""
+
+from operator import itemgetter
+
+# Colour letters used by Cube, in face order (U=White ... B=Blue)
+LETTER_COLORS = 'WRGYOB'
+_LETTER_TO_COLOR = {letter: color for color, letter in enumerate(LETTER_COLORS)}
+
+_SOLVED_STICKERS = bytes(i // 9 for i in range(54))
+
+# Solved sticker pattern for a given set of centre colours
+_SOLVED_BY_CENTRES = {}
+
+
+class StickerState:
+    """
+    Shared implementation of the immutable sticker states (CubeState and
+    cube/pocket.PocketState): 6 faces of FACE_SIZE stickers as bytes
+    """
+
+    __slots__ = ('_stickers', '_hash')
+
+    FACE_SIZE = 9
+
+    def __init__(self, stickers):
+        """
+        stickers: 6 * FACE_SIZE colour codes (bytes, bytearray or any int sequence)
+        Use from_faces() for nested face lists or colour letters.
+        """
+        stickers = bytes(stickers)
+        if len(stickers) != 6 * self.FACE_SIZE:
+            raise ValueError(f"A {type(self).__name__} needs {6 * self.FACE_SIZE} stickers, "
+                             f"got {len(stickers)}")
+        object.__setattr__(self, '_stickers', stickers)
+        object.__setattr__(self, '_hash', hash(stickers))
+
+    @classmethod
+    def _from_bytes(cls, stickers):
+        # Trusted fast path for move application: no length check or copy
+        state = object.__new__(cls)
+        object.__setattr__(state, '_stickers', stickers)
+        object.__setattr__(state, '_hash', hash(stickers))
+        return state
+
+    @classmethod
+    def from_faces(cls, faces):
+        """
+        Build a state from 6 faces (or all stickers flat), using colour
+        ints 0-5 or the letters W, R, G, Y, O, B
+        """
+        if len(faces) == 6:
+            stickers = [sticker for face in faces for sticker in face]
+        else:
+            stickers = list(faces)
+        if stickers and isinstance(stickers[0], str):
+            stickers = [_LETTER_TO_COLOR[s] for s in stickers]
+        return cls(stickers)
+
+    # ------------------------------------------------------------------
+    # Read access
+    # ------------------------------------------------------------------
+
+    @property
+    def stickers(self):
+        """The sticker colours as bytes"""
+        return self._stickers
+
+    def face(self, index):
+        """Stickers of one face as a tuple of ints"""
+        size = self.FACE_SIZE
+        return tuple(self._stickers[index * size:index * size + size])
+
+    def __getitem__(self, index):
+        # state[face][sticker] keeps working for code written for nested lists
+        return self.face(index)
+
+    def __len__(self):
+        return 6
+
+    def __iter__(self):
+        for index in range(6):
+            yield self.face(index)
+
+    def to_faces(self):
+        """Nested [U, R, F, D, L, B] lists of colour ints"""
+        size = self.FACE_SIZE
+        return [list(self._stickers[i * size:i * size + size]) for i in range(6)]
+
+    def to_letters(self):
+        """Nested face lists using the colour letters of Cube"""
+        size = self.FACE_SIZE
+        return [[LETTER_COLORS[c] for c in self._stickers[i * size:i * size + size]] for i in range(6)]
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+
+    def permute(self, perm):
+        """New state whose sticker i is this state's sticker perm[i]"""
+        return self._from_bytes(bytes(itemgetter(*perm)(self._stickers)))
+
+    # ------------------------------------------------------------------
+    # Value semantics
+    # ------------------------------------------------------------------
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._hash == other._hash and self._stickers == other._stickers
+        return NotImplemented
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (type(self), (self._stickers,))
+
+    def __repr__(self):
+        size = self.FACE_SIZE
+        faces = (''.join(str(c) for c in self._stickers[i * size:i * size + size]) for i in range(6))
+        return f"<{type(self).__name__} {' '.join(faces)}>"
+
+
+class CubeState(StickerState):
+    """54 stickers, 9 per face"""
+
+    __slots__ = ()
+
+    @classmethod
+    def solved(cls):
+        return SOLVED_STATE
+
+    def is_solved(self):
+        """Every face shows a single colour"""
+        stickers = self._stickers
+        centres = stickers[4::9]
+        solved = _SOLVED_BY_CENTRES.get(centres)
+        if solved is None:
+            solved = bytes(c for c in centres for _ in range(9))
+            _SOLVED_BY_CENTRES[centres] = solved
+        return stickers == solved
+
+
+SOLVED_STATE = CubeState(_SOLVED_STICKERS)
+
+
+def make_permuter(perm):
+    """
+    Return a function applying a fixed sticker permutation to a CubeState
+    (the hot path of every move: one itemgetter call and one bytes object)
+    """
+    getter = itemgetter(*perm)
+    new_state = CubeState._from_bytes
+
+    def permuter(state):
+        return new_state(bytes(getter(state._stickers)))
+
+    return permuter
+
+
+def as_state(state):
+    """Return state as a CubeState, converting nested/flat lists if needed"""
+    if isinstance(state, CubeState):
+        return state
+    return CubeState.from_faces(state)
+
+
+def standard_colors(state):
+    """
+    Relabel a state's colours so its centres read 0-5 in face order
+    Returns (CubeState, table) where table maps old colour -> new colour
+    (bytes usable with bytes.translate). Face turns do not care what the
+    colours are called, so any solution of the relabelled state solves
+    the original one.
+    Raises ValueError if the centre colours are not distinct
+    """
+    state = as_state(state)
+    centres = state.stickers[4::9]
+    if len(set(centres)) != 6:
+        raise ValueError(f"Centre colours are not distinct: {list(centres)}")
+    table = bytearray(range(256))
+    for face, color in enumerate(centres):
+        table[color] = face
+    table = bytes(table)
+    return CubeState._from_bytes(state.stickers.translate(table)), table
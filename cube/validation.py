@@ -0,0 +1,187 @@
+# rubiks_solver/cube/validation.py
+
+"""
+Cube state validation
+Rejects states that no sequence of moves can produce (mis-scans, flipped
+edges, twisted corners, swapped pieces) before any search is started.
+Colours are arbitrary symbols: the centre stickers say which colour
+belongs to which face, so both the 0-5 solver encoding and the 'W'/'R'/...
+letters used by Cube are accepted. For those two encodings the centres
+must also be a rotation of the standard colour scheme; a mirror-image
+scheme cannot be built from real pieces.
+"""
+
+from collections import Counter
+
+from .cubie import CubieCube, CORNER_FACELETS, EDGE_FACELETS, CORNER_COLORS, EDGE_COLORS
+from .cubie import permutation_parity
+from .moves import MOVE_PERMS, SLICE_MOVES
+from .state import CubeState, _LETTER_TO_COLOR
+
+# Failure reasons, cheapest checks first
+SHAPE = 'shape'                 # not 6 faces of 9 stickers
+CENTRES = 'centres'             # centre colours are not 6 distinct colours, or mirrored
+STICKER_COUNT = 'sticker_count' # a colour does not appear exactly 9 times
+PIECE = 'piece'                 # a corner/edge has impossible colours or appears twice
+TWIST = 'twist'                 # corner twists do not sum to 0 mod 3
+FLIP = 'flip'                   # edge flips do not sum to 0 mod 2
+PARITY = 'parity'               # corner and edge permutation parities differ
+
+# Colour tuple (as face indices) -> (piece, orientation), for every rotation
+_CORNER_LOOKUP = {}
+for _corner, _colors in enumerate(CORNER_COLORS):
+    for _twist in range(3):
+        _rotated = tuple(_colors[(k - _twist) % 3] for k in range(3))
+        _CORNER_LOOKUP[_rotated] = (_corner, _twist)
+
+_EDGE_LOOKUP = {}
+for _edge, _colors in enumerate(EDGE_COLORS):
+    _EDGE_LOOKUP[tuple(_colors)] = (_edge, 0)
+    _EDGE_LOOKUP[tuple(_colors[::-1])] = (_edge, 1)
+
+
+def _centre_schemes():
+    """The 24 centre arrangements (colour per face) of a rotated standard cube"""
+    schemes = {tuple(range(6))}
+    queue = list(schemes)
+    for scheme in queue:
+        stickers = [scheme[i // 9] for i in range(54)]
+        for move in SLICE_MOVES:
+            centres = tuple(stickers[MOVE_PERMS[move][face * 9 + 4]] for face in range(6))
+            if centres not in schemes:
+                schemes.add(centres)
+                queue.append(centres)
+    return frozenset(schemes)
+
+
+_CENTRE_SCHEMES = _centre_schemes()
+
+
+def _standard_colors(centres):
+    """Centre colours as 0-5 codes if they use the 0-5 or letter encoding, else None"""
+    if all(isinstance(c, int) and 0 <= c <= 5 for c in centres):
+        return tuple(centres)
+    if all(isinstance(c, str) and c in _LETTER_TO_COLOR for c in centres):
+        return tuple(_LETTER_TO_COLOR[c] for c in centres)
+    return None
+
+
+class ValidationResult:
+    """
+    Outcome of validate_state
+
+    reason is None for a valid state, otherwise one of the module-level
+    reason codes; message explains it. For valid states cubie holds the
+    decoded CubieCube so callers need not parse the stickers again.
+    """
+
+    def __init__(self, reason=None, message="", cubie=None):
+        self.reason = reason
+        self.message = message
+        self.cubie = cubie
+
+    @property
+    def valid(self):
+        return self.reason is None
+
+    def __bool__(self):
+        return self.valid
+
+    def __repr__(self):
+        if self.valid:
+            return "ValidationResult(valid)"
+        return f"ValidationResult({self.reason}: {self.message})"
+
+
+class InvalidStateError(ValueError):
+    """Raised by solvers for states that cannot be solved"""
+
+    def __init__(self, result):
+        super().__init__(f"Invalid cube state ({result.reason}): {result.message}")
+        self.result = result
+
+
+def _flatten(state):
+    """CubeState, nested [U, R, F, D, L, B] faces or a flat sequence -> flat list, or None"""
+    if isinstance(state, CubeState):
+        return list(state.stickers)
+    if len(state) == 6:
+        if not all(len(face) == 9 for face in state):
+            return None
+        return [sticker for face in state for sticker in face]
+    if len(state) == 54:
+        return list(state)
+    return None
+
+
+def validate_state(state):
+    """
+    Check that a sticker state is reachable from the solved cube
+
+    Args:
+        state: CubeState, 6 faces of 9 stickers in [U, R, F, D, L, B]
+               order, or a flat sequence of 54 stickers
+
+    Returns:
+        ValidationResult (truthy when the state is valid)
+    """
+    stickers = _flatten(state)
+    if stickers is None:
+        return ValidationResult(SHAPE, "Expected 6 faces of 9 stickers")
+
+    # 1. CENTRES - they define the colour scheme
+    centres = stickers[4::9]
+    if len(set(centres)) != 6:
+        return ValidationResult(CENTRES, f"Centre colours are not distinct: {centres}")
+    codes = _standard_colors(centres)
+    if codes is not None and codes not in _CENTRE_SCHEMES:
+        return ValidationResult(CENTRES, f"Centre colours {centres} form a mirror-image colour scheme")
+    face_of = {color: face for face, color in enumerate(centres)}
+
+    # 2. STICKER COUNTS
+    counts = Counter(stickers)
+    for color, count in counts.items():
+        if color not in face_of:
+            return ValidationResult(STICKER_COUNT, f"Colour {color!r} is not a centre colour")
+        if count != 9:
+            return ValidationResult(STICKER_COUNT, f"Colour {color!r} appears {count} times")
+    facelets = [face_of[color] for color in stickers]
+
+    # 3. PIECE IDENTITY
+    cube = CubieCube()
+    seen = [False] * 8
+    for i, positions in enumerate(CORNER_FACELETS):
+        key = (facelets[positions[0]], facelets[positions[1]], facelets[positions[2]])
+        piece = _CORNER_LOOKUP.get(key)
+        if piece is None:
+            return ValidationResult(PIECE, f"Corner position {i} has impossible colours {key}")
+        if seen[piece[0]]:
+            return ValidationResult(PIECE, f"Corner {piece[0]} appears twice")
+        seen[piece[0]] = True
+        cube.cp[i], cube.co[i] = piece
+    seen = [False] * 12
+    for i, positions in enumerate(EDGE_FACELETS):
+        key = (facelets[positions[0]], facelets[positions[1]])
+        piece = _EDGE_LOOKUP.get(key)
+        if piece is None:
+            return ValidationResult(PIECE, f"Edge position {i} has impossible colours {key}")
+        if seen[piece[0]]:
+            return ValidationResult(PIECE, f"Edge {piece[0]} appears twice")
+        seen[piece[0]] = True
+        cube.ep[i], cube.eo[i] = piece
+
+    # 4. ORIENTATION SUMS
+    if sum(cube.co) % 3:
+        return ValidationResult(TWIST, "A corner is twisted")
+    if sum(cube.eo) % 2:
+        return ValidationResult(FLIP, "An edge is flipped")
+
+    # 5. PERMUTATION PARITY
+    if permutation_parity(cube.cp) != permutation_parity(cube.ep):
+        return ValidationResult(PARITY, "Two pieces are swapped")
+
+    return ValidationResult(cubie=cube)
+
+
+def is_valid_state(state):
+    return validate_state(state).valid
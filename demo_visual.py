@@ -40,7 +40,11 @@ def quick_demo():
     viz.plot_3d_cube(sune_cube, "3D Sune Pattern")
     
     print("5️⃣ Solving the Sune pattern...")
-    solution = solver.solve_bfs(sune_cube)
+    # The pattern's moves are known: their inverse is an instant solution
+    # and bounds the optimal search
+    solution = None
+    for solution in solver.solve_from_history(sune_cube, sune_moves):
+        print(f"   {len(solution)} moves: {' '.join(solution)}")
     if solution:
         print(f"✅ Solution found: {' '.join(solution)} ({len(solution)} moves)")
         solved_again = solver.apply_moves(sune_cube, solution)
@@ -17,6 +17,22 @@ from solver.simple_solver import SimpleCubeSolver, create_solved_cube
 from utils.visual import CubeVisualizer
 from utils.patterns import get_pattern_algorithm, get_pattern_info, list_available_patterns
 
+def solve_with_history(solver, state, history):
+    """
+    Solve a state whose scramble is known: the simplified inverse of the
+    scramble is printed at once, then a shorter optimal solution if the
+    search (bounded by that length) finds one
+    Returns the shortest solution found
+    """
+    solution = None
+    for i, solution in enumerate(solver.solve_from_history(state, history)):
+        if i == 0:
+            print(f"⚡ From scramble history: {' '.join(solution) or '(already solved)'} "
+                  f"({len(solution)} moves)")
+        else:
+            print(f"🎯 Shorter optimal solution: {' '.join(solution)} ({len(solution)} moves)")
+    return solution
+
 def main():
     """
     Main function to demonstrate the Rubik's cube solver
@@ -50,9 +66,10 @@ def main():
     viz.compare_states(solved_cube, scrambled_cube, 
                       ["Solved State", f"Scrambled - {' '.join(scramble_moves)}"])
     
-    # Solve the cube
+    # Solve the cube: the scramble is known, so its inverse is an instant
+    # solution and bounds the optimal search
     print("\n🧠 Solving cube...")
-    solution = solver.solve_bfs(scrambled_cube)
+    solution = solve_with_history(solver, scrambled_cube, scramble_moves)
     
     if solution:
         print(f"✅ Solution found: {' '.join(solution)}")
@@ -175,12 +192,12 @@ def interactive_mode():
             # Auto-show visualization for new scramble
             viz.plot_2d_net(scrambled_cube, f"Current State - {' '.join(current_scramble)}")
             
-            # Try to solve
-            solution = solver.solve_bfs(scrambled_cube)
-            if solution:
-                print(f"✅ Solution: {' '.join(solution)} ({len(solution)} moves)")
+            # Solve from the known history: instant, and never worse than it
+            solution = solve_with_history(solver, scrambled_cube, current_scramble)
+            if solution is not None:
+                print(f"✅ Solution: {' '.join(solution) or '(already solved)'} ({len(solution)} moves)")
             else:
-                print("❌ No solution found within depth limit")
+                print(f"❌ No solution found within {solver.max_depth} moves")
                 
         except KeyboardInterrupt:
             break
@@ -213,16 +230,17 @@ def visualization_demo():
     print("📊 1. Solved Cube")
     viz.plot_2d_net(solved_cube, "Solved Rubik's Cube")
     
+    # The scrambles share their openings: evaluate them in one trie pass
+    scrambled_states = solver.apply_many(solved_cube, [moves for moves, _ in scrambles])
+    
     # Show each scramble
-    for i, (moves, description) in enumerate(scrambles, 2):
-        scrambled = solver.apply_moves(solved_cube, moves)
+    for i, ((moves, description), scrambled) in enumerate(zip(scrambles, scrambled_states), 2):
         print(f"📊 {i}. {description}")
         viz.plot_2d_net(scrambled, f"{description} - {' '.join(moves)}")
     
     # Show comparison
     print("📊 5. State Comparison")
-    scrambled1 = solver.apply_moves(solved_cube, scrambles[0][0])
-    scrambled2 = solver.apply_moves(solved_cube, scrambles[1][0])
+    scrambled1, scrambled2 = scrambled_states[0], scrambled_states[1]
     viz.compare_states(scrambled1, scrambled2, 
                       [scrambles[0][1], scrambles[1][1]])
     
@@ -230,8 +248,7 @@ def visualization_demo():
     try:
         print("📊 6. 3D Visualization")
         viz.plot_3d_cube(solved_cube, "3D Solved Cube")
-        scrambled_3d = solver.apply_moves(solved_cube, scrambles[0][0])
-        viz.plot_3d_cube(scrambled_3d, f"3D {scrambles[0][1]}")
+        viz.plot_3d_cube(scrambled1, f"3D {scrambles[0][1]}")
     except Exception as e:
         print(f"3D visualization not available: {e}")
 
@@ -251,10 +268,12 @@ def pattern_demo():
     
     print(f"📊 Showing {len(patterns)} patterns...")
     
-    for i, pattern_name in enumerate(patterns, 1):
-        pattern_info = get_pattern_info(pattern_name)
+    # Evaluate all algorithms at once; shared openings are applied once
+    infos = [get_pattern_info(pattern_name) for pattern_name in patterns]
+    pattern_cubes = solver.apply_many(solved_cube, [info["algorithm"] if info else [] for info in infos])
+    
+    for i, (pattern_name, pattern_info, pattern_cube) in enumerate(zip(patterns, infos, pattern_cubes), 1):
         if pattern_info and pattern_info["algorithm"]:
-            pattern_cube = solver.apply_moves(solved_cube, pattern_info["algorithm"])
             print(f"📊 {i}. {pattern_info['name']}")
             viz.plot_2d_net(pattern_cube, 
                            f"{pattern_info['name']} - {' '.join(pattern_info['algorithm'])}")
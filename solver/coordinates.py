@@ -0,0 +1,169 @@
+# rubiks_solver/solver/coordinates.py
+
+"""
+Coordinate move tables
+A coordinate is an integer summarising one aspect of the cube (corner
+twist, slice edge positions, a permutation rank, ...). Move tables give
+the coordinate after each of the 18 face turns, for every coordinate
+value at once; they are built with NumPy on arrays of all values.
+"""
+
+from itertools import combinations, permutations
+from math import factorial
+import sys
+import os
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import MOVE_CUBES, N_TWIST, N_FLIP
+
+# The 18 face turns, grouped by face (URFDLB): X, X2, X'
+MOVES = [face + suffix for face in 'URFDLB' for suffix in ('', '2', "'")]
+MOVE_FACE = [i // 3 for i in range(len(MOVES))]
+
+N_SLICE = 495           # positions of the 4 slice edges (FR, FL, BL, BR)
+N_UD_EDGE_PERM = factorial(8)
+N_SLICE_PERM = factorial(4)
+N_CORNER_PERM = factorial(8)
+
+
+def rank_permutations(perms):
+    """Vectorized lexicographic rank of each row of an (N, n) permutation array"""
+    n = perms.shape[1]
+    ranks = np.zeros(len(perms), dtype=np.int64)
+    for i in range(n):
+        smaller = (perms[:, i + 1:] < perms[:, i:i + 1]).sum(axis=1)
+        ranks += smaller * factorial(n - 1 - i)
+    return ranks
+
+
+def all_permutations(n):
+    """All permutations of range(n), row index == lexicographic rank"""
+    return np.array(list(permutations(range(n))), dtype=np.int8)
+
+
+def _slice_rank(occupied):
+    """Rank of a 4-subset of the 12 edge positions (combinatorial number system)"""
+    return sum(_comb(pos, k + 1) for k, pos in enumerate(sorted(occupied)))
+
+
+def _comb(n, k):
+    if k > n:
+        return 0
+    return factorial(n) // (factorial(k) * factorial(n - k))
+
+
+def get_slice(cube):
+    """Slice coordinate: which positions hold the 4 slice edges (494 = solved)"""
+    return _slice_rank([i for i in range(12) if cube.ep[i] >= 8])
+
+
+def get_ud_edge_perm(cube):
+    """Permutation of the 8 U/D edges (meaningful when they are in the U/D layers)"""
+    return int(rank_permutations(np.array([cube.ep[:8]]))[0])
+
+
+def get_slice_perm(cube):
+    """Permutation of the 4 slice edges (meaningful when they are in the slice)"""
+    return int(rank_permutations(np.array([[e - 8 for e in cube.ep[8:]]]))[0])
+
+
+def move_arrays(move):
+    cube = MOVE_CUBES[move]
+    return np.array(cube.cp), np.array(cube.co), np.array(cube.ep), np.array(cube.eo)
+
+
+def twist_move_table():
+    """Corner orientation coordinate (0..2186) under every move"""
+    digits = np.zeros((N_TWIST, 8), dtype=np.int64)
+    values = np.arange(N_TWIST)
+    for i in range(6, -1, -1):
+        digits[:, i] = values % 3
+        values = values // 3
+    digits[:, 7] = (3 - digits[:, :7].sum(axis=1) % 3) % 3
+    table = np.zeros((N_TWIST, len(MOVES)), dtype=np.int32)
+    for m, move in enumerate(MOVES):
+        cp, co, _, _ = move_arrays(move)
+        new = (digits[:, cp] + co) % 3
+        table[:, m] = (new[:, :7] * 3 ** np.arange(6, -1, -1)).sum(axis=1)
+    return table
+
+
+def flip_move_table():
+    """Edge orientation coordinate (0..2047) under every move"""
+    digits = np.zeros((N_FLIP, 12), dtype=np.int64)
+    values = np.arange(N_FLIP)
+    for i in range(10, -1, -1):
+        digits[:, i] = values % 2
+        values = values // 2
+    digits[:, 11] = digits[:, :11].sum(axis=1) % 2
+    table = np.zeros((N_FLIP, len(MOVES)), dtype=np.int32)
+    for m, move in enumerate(MOVES):
+        _, _, ep, eo = move_arrays(move)
+        new = (digits[:, ep] + eo) % 2
+        table[:, m] = (new[:, :11] * 2 ** np.arange(10, -1, -1)).sum(axis=1)
+    return table
+
+
+def slice_move_table():
+    """Slice edge position coordinate (0..494) under every move"""
+    occupancy = np.zeros((N_SLICE, 12), dtype=bool)
+    for combo in combinations(range(12), 4):
+        occupancy[_slice_rank(combo), list(combo)] = True
+    binomials = np.array([[_comb(pos, k) for k in range(5)] for pos in range(12)])
+    table = np.zeros((N_SLICE, len(MOVES)), dtype=np.int32)
+    for m, move in enumerate(MOVES):
+        _, _, ep, _ = move_arrays(move)
+        new = occupancy[:, ep]
+        # k-th occupied position (in ascending order) contributes C(pos, k)
+        order = np.cumsum(new, axis=1) * new
+        table[:, m] = (binomials[np.arange(12), order] * new).sum(axis=1)
+    return table
+
+
+def perm_move_table(perms, position_map, move_ids=None):
+    """
+    Move table for a permutation coordinate
+    perms: all permutations (row == rank), position_map(move): which old
+    position each new position takes its piece from
+    """
+    if move_ids is None:
+        move_ids = range(len(MOVES))
+    move_ids = list(move_ids)
+    table = np.zeros((len(perms), len(move_ids)), dtype=np.int32)
+    for k, m in enumerate(move_ids):
+        table[:, k] = rank_permutations(perms[:, position_map(MOVES[m])])
+    return table
+
+
+def corner_perm_move_table(move_ids=None):
+    """Corner permutation coordinate (0..40319) under the given moves"""
+    return perm_move_table(all_permutations(8), lambda mv: MOVE_CUBES[mv].cp, move_ids)
+
+
+def piece_destinations(move, pieces):
+    """Where each position goes under a move, and the orientation it gains"""
+    cube = MOVE_CUBES[move]
+    perm, orient = (cube.cp, cube.co) if pieces == 'corner' else (cube.ep, cube.eo)
+    dest = [0] * len(perm)
+    gain = [0] * len(perm)
+    for i, p in enumerate(perm):
+        dest[p] = i
+        gain[p] = orient[i]
+    return np.array(dest), np.array(gain)
+
+
+def piece_move_table(pieces):
+    """(position, orientation) of a single corner or edge under every face turn"""
+    n, twists = (8, 3) if pieces == 'corner' else (12, 2)
+    values = np.arange(n * twists)
+    table = np.zeros((len(values), len(MOVES)), dtype=np.int64)
+    for m, move in enumerate(MOVES):
+        dest, gain = piece_destinations(move, pieces)
+        pos, twist = values // twists, values % twists
+        table[:, m] = dest[pos] * twists + (twist + gain[pos]) % twists
+    return table
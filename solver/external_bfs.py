@@ -0,0 +1,368 @@
+# rubiks_solver/solver/external_bfs.py
+
+"""
+External-memory (disk-based) breadth-first search
+For levels too large for RAM. Every level is a file of sorted, unique
+state keys in a work directory, and a new level is built in two passes:
+
+    1. the previous level is streamed in chunks; each chunk's successors
+       are sorted, deduplicated and written as a sorted run
+    2. the runs are combined by a streaming k-way merge that also drops
+       every key found in the previous two levels (with a move set closed
+       under inverses, all neighbours of level d lie in levels d-1, d, d+1)
+
+Only one chunk and one merge window are ever in memory. A JSON checkpoint
+records the finished levels and every run file is renamed into place once
+complete, so an interrupted search resumes where it stopped: finished
+levels and runs are kept, anything half-written is redone. No parent
+pointers are stored; a path is recovered afterwards by walking back
+through the level files with binary searches.
+
+Spaces define the keys: CubeStateSpace uses 18-byte packed sticker states,
+IndexSpace the int64 indices of a solver.bfs_engine.CoordinateSpace.
+"""
+
+import hashlib
+import json
+import sys
+import os
+import time
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import MOVE_PERMS
+from cube.state import as_state
+from solver.coordinates import MOVES
+from utils.dataset import pack_states, unpack_states, PACKED_STATE_SIZE
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_FILE = 'checkpoint.json'
+DEFAULT_MEMORY = 256 << 20      # bytes for one chunk of successors
+MERGE_BLOCK = 1 << 16           # keys read per run per merge step
+
+
+class CubeStateSpace:
+    """Full 3x3x3 sticker states under face turns, as packed 18-byte keys"""
+
+    def __init__(self, moves=MOVES):
+        self.moves = list(moves)
+        self.dtype = np.dtype(f'S{PACKED_STATE_SIZE}')
+        self._perms = [np.array(MOVE_PERMS[move]) for move in self.moves]
+        self.name = f"cube:{','.join(self.moves)}"
+
+    def keys(self, states):
+        """Keys of CubeStates (or anything as_state accepts)"""
+        stickers = np.array([np.frombuffer(as_state(s).stickers, dtype=np.uint8) for s in states])
+        return np.ascontiguousarray(pack_states(stickers)).view(self.dtype).ravel()
+
+    def expand(self, keys, move=None):
+        """Successor keys of every key (for all moves, or just one)"""
+        states = unpack_states(keys.view(np.uint8).reshape(-1, PACKED_STATE_SIZE))
+        perms = self._perms if move is None else [self._perms[move]]
+        return np.concatenate([np.ascontiguousarray(pack_states(states[:, perm])).view(self.dtype).ravel()
+                               for perm in perms])
+
+
+class IndexSpace:
+    """A solver.bfs_engine.CoordinateSpace, keyed by state index"""
+
+    def __init__(self, space, name='coordinates'):
+        self.space = space
+        self.moves = list(range(space.num_moves))
+        self.dtype = np.dtype('<i8')
+        self.name = f"index:{name}:{'x'.join(str(n) for n in space.sizes)}"
+
+    def keys(self, indices):
+        return np.asarray(indices, dtype=self.dtype)
+
+    def expand(self, keys, move=None):
+        coords = self.space.decode(keys)
+        moves = range(self.space.num_moves) if move is None else [move]
+        return np.concatenate([self.space.apply(coords, m) for m in moves]).astype(self.dtype)
+
+
+def _read_keys(path, dtype):
+    """Memory-mapped view of a key file (empty files give an empty array)"""
+    if not os.path.getsize(path):
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def _contains_sorted(sorted_keys, keys):
+    if not len(sorted_keys) or not len(keys):
+        return np.zeros(len(keys), dtype=bool)
+    index = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return sorted_keys[index] == keys
+
+
+class _SortedReader:
+    """Block-wise cursor over a sorted key file"""
+
+    def __init__(self, keys, block=MERGE_BLOCK):
+        self.keys = keys
+        self.block = block
+        self.position = 0
+        self.buffer = keys[:block]
+
+    @property
+    def exhausted(self):
+        return not len(self.buffer)
+
+    @property
+    def last(self):
+        """Largest key currently buffered"""
+        return self.buffer[-1]
+
+    def take_until(self, cutoff):
+        """All remaining keys <= cutoff, reading further blocks as needed"""
+        parts = []
+        while len(self.buffer):
+            count = int(np.searchsorted(self.buffer, cutoff, side='right'))
+            parts.append(np.asarray(self.buffer[:count]))
+            if count < len(self.buffer):
+                self.buffer = self.buffer[count:]
+                break
+            self.position += self.block
+            self.buffer = self.keys[self.position:self.position + self.block]
+        return np.concatenate(parts) if parts else self.keys[:0]
+
+
+class ExternalBFS:
+    def __init__(self, work_dir, space, start_keys, memory_bytes=DEFAULT_MEMORY):
+        """
+        Disk-based BFS from start states, resumable from work_dir
+        work_dir: Directory for level files, runs and the checkpoint
+        space: CubeStateSpace or IndexSpace
+        start_keys: Keys of the depth-0 states
+        memory_bytes: Budget for one chunk of successors (sets the chunk size;
+                      runs left by a resumed search with another chunk
+                      size are discarded and rebuilt)
+
+        Raises ValueError if work_dir holds a search of another space or start
+        """
+        self.work_dir = work_dir
+        self.space = space
+        self.dtype = space.dtype
+        start = np.unique(space.keys(start_keys) if not isinstance(start_keys, np.ndarray)
+                          else start_keys.astype(self.dtype))
+        per_state = self.dtype.itemsize * len(space.moves) * 3     # successors, sort copy, unique
+        self.chunk_size = max(1, memory_bytes // per_state)
+        self.start_id = hashlib.sha1(start.tobytes()).hexdigest()
+        os.makedirs(work_dir, exist_ok=True)
+
+        self.checkpoint = self._load_checkpoint()
+        if self.checkpoint is None:
+            self._write_keys(self.level_path(0), start)
+            self.checkpoint = {
+                'version': CHECKPOINT_VERSION,
+                'space': space.name,
+                'dtype': self.dtype.str,
+                'start': self.start_id,
+                'sizes': [len(start)],
+                'complete': False,
+                'chunk_size': self.chunk_size,
+            }
+            self._save_checkpoint()
+        elif self.checkpoint.get('chunk_size') != self.chunk_size:
+            # Runs are named by chunk index, so runs cut at another chunk
+            # size would be mixed up with new ones: start the level over
+            self._remove_runs()
+            self.checkpoint['chunk_size'] = self.chunk_size
+            self._save_checkpoint()
+        else:
+            # A crash after a level's checkpoint but before its runs were
+            # removed leaves them behind: they are never read again
+            self._remove_runs(max_depth=self.depth)
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def level_path(self, depth):
+        return os.path.join(self.work_dir, f"level_{depth:03d}.keys")
+
+    def _run_path(self, depth, index):
+        return os.path.join(self.work_dir, f"run_{depth:03d}_{index:06d}.keys")
+
+    def _remove_runs(self, max_depth=None):
+        """Remove the run files (only those of depths up to max_depth if given)"""
+        for name in os.listdir(self.work_dir):
+            if not (name.startswith('run_') and name.endswith('.keys')):
+                continue
+            if max_depth is None or int(name.split('_')[1]) <= max_depth:
+                os.remove(os.path.join(self.work_dir, name))
+
+    def _write_keys(self, path, keys):
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(keys.tobytes())
+        os.replace(temporary, path)
+
+    def _load_checkpoint(self):
+        path = os.path.join(self.work_dir, CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {checkpoint.get('version')}")
+        if checkpoint['space'] != self.space.name or checkpoint['start'] != self.start_id:
+            raise ValueError(f"{self.work_dir} holds a search of another space or start state")
+        return checkpoint
+
+    def _save_checkpoint(self):
+        path = os.path.join(self.work_dir, CHECKPOINT_FILE)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.checkpoint, f, indent=1)
+        os.replace(path + '.tmp', path)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    @property
+    def depth(self):
+        """Deepest finished level"""
+        return len(self.checkpoint['sizes']) - 1
+
+    @property
+    def distribution(self):
+        """Number of states at each finished depth"""
+        sizes = self.checkpoint['sizes']
+        return sizes[:-1] if self.checkpoint['complete'] and len(sizes) > 1 else list(sizes)
+
+    def level(self, depth):
+        """Sorted keys of one finished level (memory-mapped)"""
+        return _read_keys(self.level_path(depth), self.dtype)
+
+    def run(self, max_depth=None, stop_keys=None, verbose=False):
+        """
+        Build levels until the space is exhausted, max_depth is reached or
+        a level contains one of stop_keys; resumes from the checkpoint
+
+        Returns:
+            The depth distribution
+        """
+        stop = None if stop_keys is None else np.unique(np.asarray(stop_keys, dtype=self.dtype))
+        start_time = time.monotonic()
+        while not self.checkpoint['complete'] and (max_depth is None or self.depth < max_depth):
+            if stop is not None and self._level_hits(self.depth, stop):
+                break
+            depth = self.depth + 1
+            runs = self._write_runs(depth)
+            size = self._merge(depth, runs)
+            self.checkpoint['sizes'].append(size)
+            self.checkpoint['complete'] = size == 0
+            self._save_checkpoint()
+            for path in runs:
+                os.remove(path)
+            if verbose:
+                print(f"  depth {depth:>2}: {size:>12,} states ({len(runs)} runs, "
+                      f"{time.monotonic() - start_time:.1f}s)")
+        return self.distribution
+
+    def _level_hits(self, depth, keys):
+        return bool(_contains_sorted(self.level(depth), keys).any())
+
+    def _write_runs(self, depth):
+        """Sorted, deduplicated successor runs of level depth - 1 (existing runs are reused)"""
+        previous = self.level(depth - 1)
+        runs = []
+        for index, offset in enumerate(range(0, len(previous), self.chunk_size)):
+            path = self._run_path(depth, index)
+            if not os.path.exists(path):
+                successors = np.unique(self.space.expand(np.asarray(previous[offset:offset + self.chunk_size])))
+                self._write_keys(path, successors)
+            runs.append(path)
+        return runs
+
+    def _merge(self, depth, runs):
+        """k-way merge of the runs minus the two previous levels into level depth"""
+        readers = [_SortedReader(_read_keys(path, self.dtype)) for path in runs]
+        exclude = [_SortedReader(self.level(d)) for d in (depth - 1, depth - 2) if d >= 0]
+        path = self.level_path(depth)
+        size = 0
+        with open(path + '.tmp', 'wb') as out:
+            readers = [reader for reader in readers if not reader.exhausted]
+            while readers:
+                # Everything up to the smallest buffered maximum is complete
+                cutoff = min(reader.last for reader in readers)
+                keys = np.unique(np.concatenate([reader.take_until(cutoff) for reader in readers]))
+                for reader in exclude:
+                    keys = keys[~_contains_sorted(reader.take_until(cutoff), keys)]
+                out.write(keys.tobytes())
+                size += len(keys)
+                readers = [reader for reader in readers if not reader.exhausted]
+        os.replace(path + '.tmp', path)
+        return size
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def distance(self, key):
+        """Depth of a key, or None if it is in no finished level"""
+        key = np.asarray([key], dtype=self.dtype)
+        for depth in range(len(self.checkpoint['sizes'])):
+            if os.path.exists(self.level_path(depth)) and self._level_hits(depth, key):
+                return depth
+        return None
+
+    def path_to(self, key):
+        """
+        Moves leading from a start state to key, found by stepping back
+        through the levels (move sets are closed under inverses, so a
+        neighbour one level down is a predecessor)
+        Returns None if the key was not reached
+        """
+        depth = self.distance(key)
+        if depth is None:
+            return None
+        moves = []
+        current = np.asarray([key], dtype=self.dtype)
+        for d in range(depth, 0, -1):
+            neighbours = self.space.expand(current)
+            below = self.level(d - 1)
+            m = int(np.flatnonzero(_contains_sorted(below, neighbours))[0])
+            previous = neighbours[m:m + 1]
+            # Find the move that leads from the predecessor back to current
+            forward = self.space.expand(previous)
+            moves.append(self.space.moves[int(np.flatnonzero(forward == current[0])[0])])
+            current = previous
+        return moves[::-1]
+
+    def clean(self):
+        """Remove every file of this search from work_dir"""
+        for name in os.listdir(self.work_dir):
+            if name.endswith(('.keys', '.tmp')) or name == CHECKPOINT_FILE:
+                os.remove(os.path.join(self.work_dir, name))
+
+
+def demo_external_bfs():
+    """Distance distribution of the cube to depth 4, interrupted and resumed"""
+    import tempfile
+    from cube.moves import apply_moves
+    from cube.state import CubeState
+
+    print("💾 External-memory BFS")
+    print("=" * 45)
+    space = CubeStateSpace()
+    with tempfile.TemporaryDirectory() as work_dir:
+        bfs = ExternalBFS(work_dir, space, [CubeState.solved()], memory_bytes=4 << 20)
+        bfs.run(max_depth=2)
+        print(f"⏸️  Stopped after depth {bfs.depth}")
+        resumed = ExternalBFS(work_dir, space, [CubeState.solved()], memory_bytes=4 << 20)
+        distribution = resumed.run(max_depth=4, verbose=True)
+        print(f"📊 States per depth: {distribution}")
+
+        state = apply_moves(CubeState.solved(), ["R", "U2", "F'"])
+        key = space.keys([state])[0]
+        print(f"🧭 Path to R U2 F': {' '.join(resumed.path_to(key))} (depth {resumed.distance(key)})")
+
+
+if __name__ == "__main__":
+    demo_external_bfs()
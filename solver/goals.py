@@ -0,0 +1,284 @@
+# rubiks_solver/solver/goals.py
+
+"""
+Partial goals and state-to-state search
+A Goal is a target state plus a mask of the stickers that have to match
+it, so "cross solved", "everything but the last layer" or "reach this
+pattern" are all goals. GoalSolver runs IDA* towards a goal, guided by
+pruning tables over the pieces the mask pins down completely. The tables
+are small (at most 4 pieces each, 24^4 states), built by the BFS engine
+on first use and cached by what they track, so goals that pin the same
+pieces to the same places share them.
+"""
+
+from operator import itemgetter
+import threading
+import sys
+import os
+import time
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import CORNERS, EDGES, CORNER_FACELETS, EDGE_FACELETS
+from cube.moves import MOVE_FUNCS, apply_moves
+from cube.state import CubeState, as_state
+from cube.validation import validate_state, InvalidStateError
+from solver.coordinates import MOVES, piece_move_table
+from solver.bfs_engine import CoordinateSpace, bfs_enumerate
+from solver.move_automaton import get_automaton
+from utils.patterns import PATTERNS, SIMPLE_PATTERNS
+
+# Pieces per pruning table (24 positions x orientations each)
+PIECES_PER_TABLE = 4
+
+_CENTRES = {face * 9 + 4 for face in range(6)}
+
+
+class _Timeout(Exception):
+    pass
+
+
+class Goal:
+    def __init__(self, target=None, mask=None, name=None):
+        """
+        Stickers that must match a target state
+        target: Target state (solved if None)
+        mask: Sticker indices (face * 9 + sticker, URFDLB) that must match;
+              None means all 54, i.e. reaching the target exactly
+        """
+        self.target = as_state(target) if target is not None else CubeState.solved()
+        stickers = range(54) if mask is None else mask
+        # Centres never move, so they need no checking
+        self.mask = tuple(sorted(set(stickers) - _CENTRES))
+        self.name = name or ("state" if mask is None else f"{len(self.mask)} stickers")
+        self._select = itemgetter(*self.mask) if self.mask else (lambda stickers: ())
+        self._wanted = self._select(self.target.stickers)
+
+        masked = set(self.mask)
+        self.corners = [p for p, facelets in enumerate(CORNER_FACELETS) if masked.issuperset(facelets)]
+        self.edges = [p for p, facelets in enumerate(EDGE_FACELETS) if masked.issuperset(facelets)]
+
+    @classmethod
+    def pieces(cls, corners=(), edges=(), target=None, name=None):
+        """Goal pinning whole pieces (by position name like 'DFR' or index)"""
+        mask = []
+        for corner in corners:
+            mask += CORNER_FACELETS[CORNERS.index(corner) if isinstance(corner, str) else corner]
+        for edge in edges:
+            mask += EDGE_FACELETS[EDGES.index(edge) if isinstance(edge, str) else edge]
+        return cls(target, mask, name)
+
+    def is_reached(self, state):
+        return self._select(as_state(state).stickers) == self._wanted
+
+    def __repr__(self):
+        return f"Goal({self.name!r}, {len(self.corners)} corners, {len(self.edges)} edges pinned)"
+
+
+def cross_goal():
+    return Goal.pieces(edges=['DR', 'DF', 'DL', 'DB'], name='cross')
+
+
+def first_two_layers_goal():
+    """Only the last (U) layer may differ"""
+    return Goal.pieces(corners=['DFR', 'DLF', 'DBL', 'DRB'],
+                       edges=['DR', 'DF', 'DL', 'DB', 'FR', 'FL', 'BL', 'BR'], name='f2l')
+
+
+def pattern_goal(name):
+    """Goal of reaching a pattern from utils/patterns.py (face turns only)"""
+    info = SIMPLE_PATTERNS.get(name) or PATTERNS.get(name)
+    if info is None:
+        raise ValueError(f"Unknown pattern {name!r}")
+    moves = info['algorithm']
+    unsupported = [move for move in moves if move not in MOVE_FUNCS]
+    if unsupported:
+        raise ValueError(f"Pattern {name!r} uses unsupported moves {unsupported}")
+    return Goal(apply_moves(CubeState.solved(), moves), name=name)
+
+
+_MOVE_TABLES = {}
+_PRUNE_TABLES = {}
+# Guards the caches above; tables are read-only once cached, so only
+# building them needs the lock (re-entrant: prune tables need move tables)
+_TABLES_LOCK = threading.RLock()
+
+
+def _move_table(kind):
+    table = _MOVE_TABLES.get(kind)
+    if table is None:
+        with _TABLES_LOCK:
+            table = _MOVE_TABLES.get(kind)
+            if table is None:
+                table = _MOVE_TABLES[kind] = piece_move_table(kind)
+    return table
+
+
+def get_prune_table(kinds, goals):
+    """
+    Exact distance table for a few pieces, cached
+    kinds: 'corner' or 'edge' for each piece
+    goals: (position * orientations + orientation) each piece must reach
+    """
+    key = (tuple(kinds), tuple(goals))
+    table = _PRUNE_TABLES.get(key)
+    if table is None:
+        with _TABLES_LOCK:
+            table = _PRUNE_TABLES.get(key)
+            if table is None:
+                space = CoordinateSpace([_move_table(kind) for kind in kinds])
+                goal = space.encode([np.array([g]) for g in goals])
+                table = _PRUNE_TABLES[key] = bfs_enumerate(space, goal, exact=True).exact.tobytes()
+    return table
+
+
+def _faces(kind, position):
+    facelets = CORNER_FACELETS[position] if kind == 'corner' else EDGE_FACELETS[position]
+    return {f // 9 for f in facelets}
+
+
+def _group(pieces):
+    """
+    Split pinned pieces into pruning-table groups of up to PIECES_PER_TABLE,
+    keeping each corner with its neighbouring edges (an F2L pair shares a
+    table) so the tables bound the distance as tightly as possible
+    """
+    remaining = list(pieces)
+    groups = []
+    for corner in [piece for piece in pieces if piece[0] == 'corner']:
+        if corner not in remaining:
+            continue
+        remaining.remove(corner)
+        group = [corner]
+        faces = _faces('corner', corner[1])
+        for piece in list(remaining):
+            if len(group) == PIECES_PER_TABLE:
+                break
+            if piece[0] == 'edge' and _faces('edge', piece[1]) <= faces:
+                group.append(piece)
+                remaining.remove(piece)
+        groups.append(group)
+    for i in range(0, len(remaining), PIECES_PER_TABLE):
+        groups.append(remaining[i:i + PIECES_PER_TABLE])
+    return groups
+
+
+class GoalSolver:
+    def __init__(self, max_length=16, timeout=10.0):
+        """
+        IDA* towards partial goals or arbitrary target states (face-turn metric)
+        max_length: Longest solution searched for
+        timeout: Seconds to search before giving up
+        """
+        self.max_length = max_length
+        self.timeout = timeout
+        self.corner_move = _move_table('corner').tolist()
+        self.edge_move = _move_table('edge').tolist()
+        self.automaton = get_automaton(MOVES)
+
+    def solve(self, state, goal=None):
+        """
+        Shortest move sequence taking state to the goal (solved if None)
+        Returns the moves, or None if nothing was found within max_length or in time
+        Raises InvalidStateError for states no move sequence can solve
+        """
+        goal = goal or Goal()
+        validation = validate_state(state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+        target_validation = validate_state(goal.target)
+        if not target_validation.valid:
+            raise InvalidStateError(target_validation)
+        cube, target = validation.cubie, target_validation.cubie
+
+        # Track the pieces the target has at the pinned positions
+        pieces = []
+        for kind, positions, twists in (('corner', goal.corners, 3), ('edge', goal.edges, 2)):
+            perm, orient = (target.cp, target.co) if kind == 'corner' else (target.ep, target.eo)
+            now_perm, now_orient = (cube.cp, cube.co) if kind == 'corner' else (cube.ep, cube.eo)
+            for p in positions:
+                at = now_perm.index(perm[p])
+                pieces.append((kind, p, at * twists + now_orient[at], p * twists + orient[p]))
+        tracked = []
+        for chunk in _group(pieces):
+            kinds = [kind for kind, _, _, _ in chunk]
+            tracked.append(([self.corner_move if kind == 'corner' else self.edge_move for kind in kinds],
+                            [value for _, _, value, _ in chunk],
+                            get_prune_table(kinds, [g for _, _, _, g in chunk])))
+
+        # The goal and deadline are passed down the search rather than kept
+        # on the solver, so one solver can be shared between threads
+        deadline = time.monotonic() + self.timeout
+        state = as_state(state)
+        values = [values for _, values, _ in tracked]
+        tables = [(move_tables, table) for move_tables, _, table in tracked]
+        h = self._bound(tables, values)
+        path = []
+        try:
+            for depth in range(h, self.max_length + 1):
+                if self._search(goal, deadline, state, tables, values, depth, self.automaton.start, path):
+                    return path
+        except _Timeout:
+            pass
+        return None
+
+    def solve_to(self, start, target):
+        """State-to-state search: shortest moves turning start into target"""
+        return self.solve(start, Goal(target))
+
+    @staticmethod
+    def _bound(tables, values):
+        h = 0
+        for (_, table), chunk in zip(tables, values):
+            index = 0
+            for value in chunk:
+                index = index * 24 + value
+            h = max(h, table[index])
+        return h
+
+    def _search(self, goal, deadline, state, tables, values, depth, node, path):
+        if depth == 0:
+            return goal.is_reached(state)
+        if time.monotonic() > deadline:
+            raise _Timeout()
+        for m, nxt in self.automaton.successors[node]:
+            new_values = [[move_table[v][m] for move_table, v in zip(move_tables, chunk)]
+                          for (move_tables, _), chunk in zip(tables, values)]
+            if self._bound(tables, new_values) >= depth:
+                continue
+            move = MOVES[m]
+            path.append(move)
+            if self._search(goal, deadline, MOVE_FUNCS[move](state), tables, new_values,
+                            depth - 1, nxt, path):
+                return True
+            path.pop()
+        return False
+
+
+def demo_goals():
+    """Solve partial goals and a state-to-state search"""
+    from utils.scramble import Scrambler
+
+    print("🎯 Partial-goal search")
+    print("=" * 45)
+    solver = GoalSolver()
+    state = Scrambler(seed=6).random_state()
+    for goal in (cross_goal(), Goal.pieces(corners=['DFR'], edges=['DR', 'DF', 'DL', 'DB', 'FR'],
+                                           name='cross + 1 pair')):
+        start = time.monotonic()
+        moves = solver.solve(state, goal)
+        print(f"✅ {goal.name}: {' '.join(moves)} ({len(moves)} moves, "
+              f"{(time.monotonic() - start) * 1000:.0f}ms)")
+
+    goal = pattern_goal('t_pattern')
+    start = time.monotonic()
+    moves = solver.solve(CubeState.solved(), goal)
+    print(f"✅ solved -> {goal.name}: {' '.join(moves)} ({(time.monotonic() - start) * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    demo_goals()
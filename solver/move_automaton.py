@@ -0,0 +1,220 @@
+# rubiks_solver/solver/move_automaton.py
+
+"""
+Redundant-sequence pruning automaton
+Searches waste most of their time on move sequences that equal shorter or
+earlier ones: "R R'", "R R R", "L R" after "R L". Instead of hand-written
+rules, the automaton is derived from the moves themselves: every sequence
+up to a given length is compiled to its sticker permutation, and a
+sequence is redundant if a shorter one, or an earlier one of the same
+length (in move-list order), gives the same permutation. The minimal
+redundant sequences are compiled into an Aho-Corasick automaton whose
+states remember just enough of the last moves to reject any sequence
+containing one of them.
+
+A search keeps one automaton state per node and only expands the moves
+it allows, so redundant branches are never built. The canonical
+sequences are exactly the shortest, earliest ways of writing each
+position, so pruning never loses an optimal solution.
+"""
+
+import threading
+import sys
+import os
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import MOVE_PERMS
+
+# Longest redundant sequence looked for: length 4 already catches
+# "R2 L2 U2 D2" = "U2 D2 R2 L2"; the next identities are far longer
+DEFAULT_DEPTH = 4
+
+# Transition target of a rejected move
+DEAD = -1
+
+_IDENTITY = tuple(range(54))
+
+
+def redundant_sequences(moves, depth=DEFAULT_DEPTH):
+    """
+    Minimal redundant move sequences up to `depth` moves
+
+    A sequence is redundant if a shorter sequence, or an earlier sequence
+    of the same length, has the same effect; it is minimal if dropping its
+    first or last move leaves a canonical sequence.
+
+    Args:
+        moves: Move names; their order decides which of two equal
+               sequences of the same length is canonical
+
+    Returns:
+        List of tuples of move indices
+    """
+    perms = [MOVE_PERMS[move] for move in moves]
+    seen = {_IDENTITY}
+    level = {(): _IDENTITY}
+    redundant = []
+    for _ in range(depth):
+        next_level = {}
+        # Parents in lexicographic order, moves in list order: children are
+        # generated in lexicographic order, so the first one to reach a
+        # permutation is its canonical sequence
+        for sequence, perm in level.items():
+            for m, step in enumerate(perms):
+                candidate = sequence + (m,)
+                if len(candidate) > 1 and candidate[1:] not in level:
+                    continue    # contains a shorter redundant sequence
+                new_perm = tuple(perm[i] for i in step)
+                if new_perm in seen:
+                    redundant.append(candidate)
+                else:
+                    seen.add(new_perm)
+                    next_level[candidate] = new_perm
+        level = next_level
+    return redundant
+
+
+class MoveAutomaton:
+    def __init__(self, moves, depth=DEFAULT_DEPTH):
+        """
+        Automaton accepting only canonical move sequences
+        moves: Move names (search move set, in preference order)
+        depth: Longest redundant sequence taken into account
+
+        State 0 is the start state; transitions[state][m] is the state after
+        move index m, or DEAD if that move would make the sequence redundant.
+        """
+        self.moves = tuple(moves)
+        self.depth = depth
+        self.patterns = [tuple(self.moves[m] for m in pattern)
+                         for pattern in redundant_sequences(self.moves, depth)]
+
+        # Trie of the patterns
+        children = [{}]
+        rejected = [False]
+        for pattern in self.patterns:
+            node = 0
+            for move in pattern:
+                m = self.moves.index(move)
+                if m not in children[node]:
+                    children[node][m] = len(children)
+                    children.append({})
+                    rejected.append(False)
+                node = children[node][m]
+            rejected[node] = True
+
+        # Failure links in breadth-first order turn the trie into a full
+        # transition table (a state rejects if any suffix of it does)
+        n_moves = len(self.moves)
+        transitions = [None] * len(children)
+        fail = [0] * len(children)
+        transitions[0] = [children[0].get(m, 0) for m in range(n_moves)]
+        queue = list(children[0].values())
+        for node in queue:
+            rejected[node] = rejected[node] or rejected[fail[node]]
+            row = []
+            for m in range(n_moves):
+                child = children[node].get(m)
+                if child is None:
+                    row.append(transitions[fail[node]][m])
+                else:
+                    fail[child] = transitions[fail[node]][m]
+                    queue.append(child)
+                    row.append(child)
+            transitions[node] = row
+
+        # Renumber the live states and point rejected moves at DEAD
+        live = [node for node in range(len(children)) if not rejected[node]]
+        number = {node: i for i, node in enumerate(live)}
+        self.transitions = [[number.get(transitions[node][m], DEAD) for m in range(n_moves)]
+                            for node in live]
+        self.successors = [[(m, nxt) for m, nxt in enumerate(row) if nxt != DEAD]
+                           for row in self.transitions]
+        self.start = 0
+
+    def __len__(self):
+        return len(self.transitions)
+
+    def step(self, state, move):
+        """State after a move (name or index), DEAD if it is redundant there"""
+        m = self.moves.index(move) if isinstance(move, str) else move
+        return self.transitions[state][m]
+
+    def accepts(self, moves):
+        """Whether a move sequence is canonical"""
+        state = self.start
+        for move in moves:
+            state = self.step(state, move)
+            if state == DEAD:
+                return False
+        return True
+
+    def count_sequences(self, length):
+        """Number of canonical sequences of each length from 0 to `length`"""
+        counts = [0] * len(self)
+        counts[self.start] = 1
+        totals = [1]
+        for _ in range(length):
+            next_counts = [0] * len(self)
+            for state, count in enumerate(counts):
+                if count:
+                    for _, nxt in self.successors[state]:
+                        next_counts[nxt] += count
+            counts = next_counts
+            totals.append(sum(counts))
+        return totals
+
+    def branching_factor(self, length=12):
+        """Asymptotic average number of moves expanded per node"""
+        totals = self.count_sequences(length)
+        return totals[-1] / totals[-2]
+
+    def __repr__(self):
+        return (f"MoveAutomaton({len(self.moves)} moves, {len(self)} states, "
+                f"{len(self.patterns)} redundant sequences)")
+
+
+_AUTOMATA = {}
+_AUTOMATA_LOCK = threading.Lock()
+
+
+def get_automaton(moves, depth=DEFAULT_DEPTH):
+    """
+    Automaton for a move set, built on first use and cached
+    Automata are never modified after construction, so searches in any
+    number of threads can share them.
+    """
+    key = (tuple(moves), depth)
+    automaton = _AUTOMATA.get(key)
+    if automaton is None:
+        with _AUTOMATA_LOCK:
+            automaton = _AUTOMATA.get(key)
+            if automaton is None:
+                automaton = _AUTOMATA[key] = MoveAutomaton(key[0], depth)
+    return automaton
+
+
+def demo_move_automaton():
+    """Derive the automata of the quarter- and face-turn move sets"""
+    import time
+    from cube.moves import VALID_MOVES
+    from solver.coordinates import MOVES
+
+    print("🤖 Redundant-sequence pruning automaton")
+    print("=" * 45)
+    for name, moves in (('quarter turns', VALID_MOVES), ('face turns', MOVES)):
+        for depth in (2, 3, 4):
+            start = time.monotonic()
+            automaton = MoveAutomaton(moves, depth)
+            print(f"• {name}, depth {depth}: {automaton} in {time.monotonic() - start:.2f}s, "
+                  f"branching {automaton.branching_factor():.2f} (was {len(moves)})")
+    automaton = get_automaton(VALID_MOVES)
+    for sequence in (["R", "R'"], ["R", "L"], ["L", "R"], ["R", "R", "R"], ["R", "U", "R'"]):
+        print(f"  {' '.join(sequence):8} canonical: {automaton.accepts(sequence)}")
+
+
+if __name__ == "__main__":
+    demo_move_automaton()
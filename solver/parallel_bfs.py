@@ -0,0 +1,344 @@
+# rubiks_solver/solver/parallel_bfs.py
+
+"""
+Hash-partitioned multi-process breadth-first search
+Each worker process owns the states whose hash falls in its partition:
+it holds their part of the visited set and of the frontier, so both the
+deduplication work and the memory are split across workers. The search
+advances one level at a time:
+
+    1. every worker expands its frontier (NumPy, one sticker permutation
+       per move over the whole frontier, canonical moves only)
+    2. the new states are sent to their owners in fixed-size batches
+       through shared-memory slots, one outgoing slot per worker with
+       semaphores as the handshake
+    3. every owner deduplicates what it received and checks the goal
+    4. the coordinator waits for all workers (the level barrier) before
+       starting the next level
+
+Each state carries its path as an integer (the move indices in base
+len(moves)), and duplicates keep the smallest one, so the result is the
+same first solution the sequential solve_bfs finds and no parent
+pointers are needed. Neighbours of a level-d state lie in levels d-1, d
+and d+1, so only the last two levels are kept as the visited set.
+"""
+
+import multiprocessing
+from multiprocessing import connection, shared_memory
+import sys
+import os
+import traceback
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import MOVE_PERMS, VALID_MOVES
+from cube.state import CubeState, standard_colors
+from solver.move_automaton import get_automaton, DEAD
+from utils.dataset import pack_states, unpack_states, PACKED_STATE_SIZE
+
+BATCH_ROWS = 1 << 15        # records per shared-memory batch
+EXCHANGE_TIMEOUT = 120.0    # seconds a worker waits for a partner
+
+RECORD_DTYPE = np.dtype([
+    ('state', np.uint8, PACKED_STATE_SIZE),
+    ('code', '<i8'),
+    ('node', np.uint8),
+])
+
+# Batch header: record count, last-batch flag
+_HEADER = np.dtype([('count', '<i8'), ('last', '<i8')])
+
+# Fixed odd multipliers for the partition hash (same in every process)
+_HASH_WEIGHTS = (np.random.default_rng(0x5EED).integers(1, 1 << 62, PACKED_STATE_SIZE,
+                                                        dtype=np.uint64) | np.uint64(1))
+
+
+def partition_of(packed, workers):
+    """Owning worker of each packed state (array of shape (n, 18))"""
+    h = packed.astype(np.uint64) @ _HASH_WEIGHTS
+    return ((h >> np.uint64(33)) % np.uint64(workers)).astype(np.intp)
+
+
+def decode_path(code, length, moves):
+    """Move sequence of a path code"""
+    path = []
+    for _ in range(length):
+        code, m = divmod(code, len(moves))
+        path.append(moves[m])
+    return path[::-1]
+
+
+def _keys(packed):
+    """Sortable fixed-width byte keys of packed states"""
+    return np.ascontiguousarray(packed).view(f'S{PACKED_STATE_SIZE}').ravel()
+
+
+def _contains(sorted_keys, keys):
+    if not len(sorted_keys):
+        return np.zeros(len(keys), dtype=bool)
+    index = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return sorted_keys[index] == keys
+
+
+class _Worker:
+    """Search state of one partition (runs inside the worker process)"""
+
+    def __init__(self, index, workers, moves, mask, wanted, shm, slots, full, empty):
+        self.index = index
+        self.workers = workers
+        automaton = get_automaton(moves)
+        self.perms = [np.array(MOVE_PERMS[move]) for move in moves]
+        self.transitions = np.array(automaton.transitions, dtype=np.int16)
+        self.n_moves = len(moves)
+        self.mask = mask
+        self.wanted = wanted
+        self.shm = shm
+        self.headers = np.ndarray(workers, dtype=_HEADER, buffer=shm.buf)
+        self.slots = slots
+        self.full = full
+        self.empty = empty
+        self.previous = np.empty(0, dtype=f'S{PACKED_STATE_SIZE}')
+        self.current = self.previous
+        self.states = np.empty((0, 54), dtype=np.uint8)
+        self.codes = np.empty(0, dtype=np.int64)
+        self.nodes = np.empty(0, dtype=np.uint8)
+
+    def start(self, stickers, node):
+        state = np.frombuffer(stickers, dtype=np.uint8).reshape(1, 54)
+        packed = pack_states(state)
+        if partition_of(packed, self.workers)[0] == self.index:
+            self.states = state.copy()
+            self.codes = np.zeros(1, dtype=np.int64)
+            self.nodes = np.array([node], dtype=np.uint8)
+            self.current = _keys(packed).copy()
+
+    def expand(self):
+        """Canonical successors of the frontier as one record array"""
+        parts = []
+        for m, perm in enumerate(self.perms):
+            nxt = self.transitions[self.nodes, m]
+            rows = np.flatnonzero(nxt != DEAD)
+            if not len(rows):
+                continue
+            records = np.empty(len(rows), dtype=RECORD_DTYPE)
+            records['state'] = pack_states(self.states[rows][:, perm])
+            records['code'] = self.codes[rows] * self.n_moves + m
+            records['node'] = nxt[rows]
+            parts.append(records)
+        if not parts:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.concatenate(parts)
+
+    def _acquire(self, semaphore):
+        if not semaphore.acquire(timeout=EXCHANGE_TIMEOUT):
+            raise RuntimeError("Parallel BFS exchange timed out")
+
+    def exchange(self, records):
+        """
+        Route records to their owners; returns the records this worker owns
+        In round k worker w sends to w + k and receives from w - k, one
+        batch at a time in alternation, so no pair can wait on each other.
+        Workers may be in different rounds, so a slot's 'full' semaphore is
+        per receiver: a batch is only ever taken by the worker it is for.
+        """
+        owners = partition_of(records['state'], self.workers)
+        order = np.argsort(owners, kind='stable')
+        bounds = np.searchsorted(owners[order], np.arange(self.workers + 1))
+        outgoing = [records[order[bounds[w]:bounds[w + 1]]] for w in range(self.workers)]
+        received = [outgoing[self.index]]
+
+        slot, header = self.slots[self.index], self.headers[self.index:self.index + 1]
+        for k in range(1, self.workers):
+            target = (self.index + k) % self.workers
+            source = (self.index - k) % self.workers
+            data = outgoing[target]
+            offsets = list(range(0, len(data), BATCH_ROWS)) or [0]
+            sent = 0
+            receiving = True
+            while sent < len(offsets) or receiving:
+                if sent < len(offsets):
+                    batch = data[offsets[sent]:offsets[sent] + BATCH_ROWS]
+                    self._acquire(self.empty[self.index])
+                    slot[:len(batch)] = batch
+                    header['count'] = len(batch)
+                    header['last'] = sent == len(offsets) - 1
+                    self.full[self.index][target].release()
+                    sent += 1
+                if receiving:
+                    self._acquire(self.full[source][self.index])
+                    count = int(self.headers['count'][source])
+                    received.append(self.slots[source][:count].copy())
+                    receiving = not self.headers['last'][source]
+                    self.empty[source].release()
+        return np.concatenate(received)
+
+    def level(self):
+        """Advance one level; returns (new states, smallest goal path code or -1)"""
+        records = self.exchange(self.expand())
+        # Keep the smallest path code of every state
+        records = records[np.argsort(records['code'], kind='stable')]
+        keys = _keys(records['state'])
+        keys, first = np.unique(keys, return_index=True)
+        records = records[first]
+        fresh = ~(_contains(self.current, keys) | _contains(self.previous, keys))
+        records, keys = records[fresh], keys[fresh]
+
+        self.previous, self.current = self.current, keys
+        self.states = unpack_states(records['state'])
+        self.codes = records['code']
+        self.nodes = records['node']
+
+        hits = np.flatnonzero((self.states[:, self.mask] == self.wanted).all(axis=1))
+        best = int(self.codes[hits].min()) if len(hits) else -1
+        return len(records), best
+
+
+def _worker_main(index, workers, moves, mask, wanted, shm, full, empty, conn):
+    slots = [np.ndarray(BATCH_ROWS, dtype=RECORD_DTYPE, buffer=shm.buf,
+                        offset=workers * _HEADER.itemsize + w * BATCH_ROWS * RECORD_DTYPE.itemsize)
+             for w in range(workers)]
+    worker = _Worker(index, workers, moves, mask, wanted, shm, slots, full, empty)
+    try:
+        while True:
+            command = conn.recv()
+            if command is None:
+                break
+            if command[0] == 'start':
+                worker.start(*command[1:])
+                conn.send(('ok', None))
+            else:
+                conn.send(('ok', worker.level()))
+    except Exception:
+        conn.send(('error', traceback.format_exc()))
+    finally:
+        del slots, worker
+        shm.close()
+
+
+class ParallelBFS:
+    def __init__(self, workers=None, moves=VALID_MOVES):
+        """
+        Breadth-first search split over worker processes
+        workers: Number of processes (default: one per CPU)
+        moves: Move set to search
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.moves = list(moves)
+        self.level_sizes = []
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+    def search(self, initial_state, max_depth, goal=None):
+        """
+        Shortest move sequence from initial_state to the goal (solved if None)
+        Returns the moves, or None if the goal is not within max_depth
+        level_sizes records the number of new states found per level
+        """
+        if len(self.moves) ** max_depth >= 1 << 63:
+            raise ValueError(f"max_depth {max_depth} is too deep for {len(self.moves)} moves")
+        # Packed states assume the standard centres: relabel the colours
+        # (of the goal too), which leaves every solution unchanged
+        state, colors = standard_colors(initial_state)
+        if goal is not None:
+            mask = np.array(goal.mask, dtype=np.intp)
+            wanted = np.frombuffer(goal.target.stickers.translate(colors), dtype=np.uint8)[mask]
+        else:
+            # Face turns never move centres: solved means every face matches its centre
+            mask = np.arange(54)
+            wanted = np.repeat(np.frombuffer(state.stickers[4::9], dtype=np.uint8), 9)
+        self.level_sizes = [1]
+        if (np.frombuffer(state.stickers, dtype=np.uint8)[mask] == wanted).all():
+            return []
+
+        size = self.workers * (_HEADER.itemsize + BATCH_ROWS * RECORD_DTYPE.itemsize)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        full = [[self._context.Semaphore(0) for _ in range(self.workers)] for _ in range(self.workers)]
+        empty = [self._context.Semaphore(1) for _ in range(self.workers)]
+        conns = []
+        processes = []
+        try:
+            for index in range(self.workers):
+                parent, child = self._context.Pipe()
+                process = self._context.Process(
+                    target=_worker_main, daemon=True,
+                    args=(index, self.workers, self.moves, mask, wanted, shm, full, empty, child))
+                process.start()
+                child.close()
+                conns.append(parent)
+                processes.append(process)
+
+            node = get_automaton(self.moves).start
+            self._broadcast(conns, processes, ('start', state.stickers, node))
+            for depth in range(1, max_depth + 1):
+                results = self._broadcast(conns, processes, ('level',))
+                self.level_sizes.append(sum(count for count, _ in results))
+                codes = [best for _, best in results if best >= 0]
+                if codes:
+                    return decode_path(min(codes), depth, self.moves)
+                if not self.level_sizes[-1]:
+                    break
+            return None
+        finally:
+            for conn in conns:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            shm.close()
+            shm.unlink()
+
+    @staticmethod
+    def _broadcast(conns, processes, command):
+        """Send a command to every worker and wait for all replies (the level barrier)"""
+        for conn in conns:
+            conn.send(command)
+        replies = [None] * len(conns)
+        pending = set(range(len(conns)))
+        while pending:
+            ready = connection.wait([conns[i] for i in pending], timeout=1.0)
+            for i in list(pending):
+                if conns[i] in ready:
+                    status, value = conns[i].recv()
+                    if status == 'error':
+                        raise RuntimeError(f"Parallel BFS worker {i} failed:\n{value}")
+                    replies[i] = value
+                    pending.discard(i)
+            if not ready and any(not processes[i].is_alive() for i in pending):
+                raise RuntimeError("A parallel BFS worker exited unexpectedly")
+        return replies
+
+
+def demo_parallel_bfs():
+    """Compare the sequential and the partitioned BFS on one scramble"""
+    import time
+    from cube.moves import apply_moves
+    from solver.simple_solver import SimpleCubeSolver
+
+    print("🧵 Hash-partitioned parallel BFS")
+    print("=" * 45)
+    scramble = ["R", "U", "F'", "L", "D"]
+    state = apply_moves(CubeState.solved(), scramble)
+    print(f"🔄 Scramble: {' '.join(scramble)}")
+
+    start = time.monotonic()
+    moves = SimpleCubeSolver(max_depth=6).solve_bfs(state)
+    print(f"⏱️  sequential: {' '.join(moves)} in {time.monotonic() - start:.2f}s")
+
+    for workers in (1, 2, 4):
+        bfs = ParallelBFS(workers)
+        start = time.monotonic()
+        moves = bfs.search(state, 6)
+        print(f"⏱️  {workers} workers: {' '.join(moves)} in {time.monotonic() - start:.2f}s "
+              f"(levels {bfs.level_sizes})")
+
+
+if __name__ == "__main__":
+    demo_parallel_bfs()
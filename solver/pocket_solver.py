@@ -0,0 +1,222 @@
+# rubiks_solver/solver/pocket_solver.py
+
+"""
+Optimal 2x2x2 solver by table lookup
+With the DBL corner held fixed, a pocket cube is one of 7! x 3^6 =
+3,674,160 states reachable with U, R and F turns. The BFS engine gives
+every state its optimal distance, and each table byte stores that
+distance together with a move that gets one step closer. Solving is a
+walk through the memory-mapped table: no search at all.
+
+Table file layout:
+    header  b'RC2T' | version u8 | 3 reserved bytes
+    entries 3,674,160 bytes, distance << 4 | next move (15 = solved)
+"""
+
+import struct
+import threading
+import sys
+import os
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import MOVE_CUBES
+from cube.pocket import validate_pocket_state, FIXED_CORNER
+from cube.validation import InvalidStateError
+from solver.coordinates import MOVES, all_permutations, perm_move_table, rank_permutations
+from solver.bfs_engine import CoordinateSpace, bfs_enumerate
+
+MAGIC = b'RC2T'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sB3x')
+
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tables', 'pocket_2x2.bin')
+
+# U, U2, U', R, R2, R', F, F2, F' - none of them moves the DBL corner
+POCKET_MOVES = [m for m, move in enumerate(MOVES) if move[0] in 'URF']
+
+# Corner positions that move, and the rank of each corner among them
+POSITIONS = [p for p in range(8) if p != FIXED_CORNER]
+_SLOT = {p: k for k, p in enumerate(POSITIONS)}
+
+N_PERM = 5040           # 7!
+N_TWIST = 729           # 3^6 (the 7th moving corner's twist is implied)
+N_STATES = N_PERM * N_TWIST
+
+SOLVED_ENTRY = 0x0F
+
+
+def _twist_move_table():
+    """Twist of the 6 leading moving corners under each pocket move"""
+    digits = np.zeros((N_TWIST, 8), dtype=np.int64)
+    values = np.arange(N_TWIST)
+    for k in range(5, -1, -1):
+        digits[:, POSITIONS[k]] = values % 3
+        values = values // 3
+    digits[:, POSITIONS[6]] = (3 - digits.sum(axis=1) % 3) % 3
+    weights = 3 ** np.arange(5, -1, -1)
+    table = np.zeros((N_TWIST, len(POCKET_MOVES)), dtype=np.int32)
+    for k, m in enumerate(POCKET_MOVES):
+        cube = MOVE_CUBES[MOVES[m]]
+        new = (digits[:, cube.cp] + np.array(cube.co)) % 3
+        table[:, k] = (new[:, POSITIONS[:6]] * weights).sum(axis=1)
+    return table
+
+
+def _perm_move_table():
+    """Permutation of the 7 moving corners under each pocket move"""
+    return perm_move_table(
+        all_permutations(7),
+        lambda mv: [_SLOT[MOVE_CUBES[mv].cp[p]] for p in POSITIONS],
+        POCKET_MOVES)
+
+
+def coordinates(cube):
+    """(perm, twist) of a CubieCube whose DBL corner is solved"""
+    perm = int(rank_permutations(np.array([[_SLOT[cube.cp[p]] for p in POSITIONS]]))[0])
+    twist = 0
+    for p in POSITIONS[:6]:
+        twist = twist * 3 + cube.co[p]
+    return perm, twist
+
+
+def build_table(verbose=False):
+    """
+    Enumerate all 3,674,160 states and return the uint8 table
+    (distance << 4 | index into POCKET_MOVES of a move one step closer)
+    """
+    space = CoordinateSpace([_perm_move_table(), _twist_move_table()])
+    result = bfs_enumerate(space, goals=0, exact=True, verbose=verbose)
+    distance = result.exact
+
+    # First move whose successor is exactly one step closer
+    next_move = np.full(N_STATES, SOLVED_ENTRY, dtype=np.uint8)
+    coords = space.decode(np.arange(N_STATES))
+    pending = distance > 0
+    for k in range(space.num_moves):
+        closer = pending & (distance[space.apply(coords, k)] == distance - 1)
+        next_move[closer] = k
+        pending &= ~closer
+    return (distance << 4) | next_move
+
+
+def save_table(table, path):
+    """Write the table to path atomically (a temporary file, then os.replace)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = path + '.tmp'
+    try:
+        with open(temporary, 'wb') as f:
+            f.write(FILE_HEADER.pack(MAGIC, VERSION))
+            f.write(table.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        # An interrupted run leaves at most a stray .tmp file, never a
+        # truncated table that load_table would accept
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def load_table(path):
+    """Memory-map a table written by save_table (read-only)"""
+    with open(path, 'rb') as f:
+        magic, version = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a pocket cube table (version {VERSION})")
+    return np.memmap(path, dtype=np.uint8, mode='r', offset=FILE_HEADER.size, shape=(N_STATES,))
+
+
+_TABLES = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def get_table(path=DEFAULT_TABLE_PATH, verbose=False):
+    """Return the memory-mapped table, building and saving it on first use"""
+    table = _TABLES.get(path)
+    if table is None:
+        # One thread builds and saves the file; the others wait for it
+        with _TABLES_LOCK:
+            table = _TABLES.get(path)
+            if table is None:
+                if not os.path.exists(path):
+                    save_table(build_table(verbose), path)
+                table = _TABLES[path] = load_table(path)
+    return table
+
+
+class PocketSolver:
+    def __init__(self, table_path=DEFAULT_TABLE_PATH):
+        """
+        Optimal 2x2x2 solver (half-turn metric)
+        table_path: Table file; built (a few seconds) if it does not exist
+        """
+        self.table = get_table(table_path)
+        self.perm_move = _perm_move_table().tolist()
+        self.twist_move = _twist_move_table().tolist()
+
+    def _coordinates(self, state):
+        validation = validate_pocket_state(state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+        return coordinates(validation.cubie)
+
+    def distance(self, state):
+        """Optimal number of moves to solve a pocket state"""
+        perm, twist = self._coordinates(state)
+        return int(self.table[perm * N_TWIST + twist]) >> 4
+
+    def solve(self, state):
+        """
+        Solve a pocket state (PocketState, 6 faces of 4 stickers, or the
+        corners of a 3x3x3 state); returns an optimal list of U/R/F moves
+        Raises InvalidStateError for states no move sequence can solve
+        """
+        perm, twist = self._coordinates(state)
+        return self.solve_coordinates(perm, twist)
+
+    def solve_coordinates(self, perm, twist):
+        solution = []
+        entry = int(self.table[perm * N_TWIST + twist])
+        while entry != SOLVED_ENTRY:
+            k = entry & 0x0F
+            solution.append(MOVES[POCKET_MOVES[k]])
+            perm, twist = self.perm_move[perm][k], self.twist_move[twist][k]
+            entry = int(self.table[perm * N_TWIST + twist])
+        return solution
+
+
+def demo_pocket_solver():
+    """Build (or load) the table and solve a few 2x2x2 scrambles"""
+    import random
+    import time
+    from cube.pocket import PocketCube
+
+    print("🧊 2x2x2 optimal solver")
+    print("=" * 45)
+    start = time.monotonic()
+    solver = PocketSolver()
+    print(f"📦 Table ready in {time.monotonic() - start:.2f}s ({N_STATES:,} states)")
+
+    rng = random.Random(2)
+    for _ in range(3):
+        scramble = [rng.choice(MOVES) for _ in range(20)]
+        cube = PocketCube()
+        cube.apply_moves(scramble)
+        start = time.perf_counter()
+        solution = solver.solve(cube.state)
+        elapsed = (time.perf_counter() - start) * 1e6
+        cube.apply_moves(solution)
+        print(f"\n🔄 Scramble: {' '.join(scramble)}")
+        print(f"✅ Solution: {' '.join(solution)} ({len(solution)} moves, {elapsed:.0f}µs)")
+        print(f"   Solved: {cube.is_solved()}")
+
+
+if __name__ == "__main__":
+    demo_pocket_solver()
@@ -0,0 +1,216 @@
+# rubiks_solver/solver/portfolio.py
+
+"""
+Portfolio solver
+Races several solver strategies on the same state, each in its own
+process. The first solution short enough for the quality target wins at
+once; otherwise the shortest solution found by the deadline is used.
+Strategies still running are terminated. Wins are counted per
+scramble-length bucket, and the counts decide which strategies are
+started first (or at all) for later states in the same bucket.
+"""
+
+from collections import Counter
+import multiprocessing
+import queue
+import sys
+import os
+import time
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.state import as_state
+from cube.validation import validate_state, InvalidStateError
+from solver.simple_solver import SimpleCubeSolver
+from solver.stage_solver import StageSolver
+from solver.two_phase import TwoPhaseSolver
+
+# Upper bounds of the scramble-length buckets (the last one is open)
+LENGTH_BUCKETS = [5, 10, 15, 20]
+
+
+def length_bucket(length):
+    """Label of the bucket a scramble length falls in"""
+    low = 0
+    for high in LENGTH_BUCKETS:
+        if length <= high:
+            return f"{low}-{high}"
+        low = high + 1
+    return f"{low}+"
+
+
+def default_strategies(timeout=10.0):
+    """
+    Built-in strategies: name -> function taking a state, returning moves
+    (or None). Solvers are created here, in the parent, so their tables
+    are built once and inherited by every forked worker.
+    """
+    return {
+        'bfs': SimpleCubeSolver(max_depth=5).solve_bfs,
+        'stage': StageSolver().solve,
+        'two_phase': TwoPhaseSolver(timeout=timeout).solve,
+    }
+
+
+def _run_strategy(name, solve, state, results):
+    start = time.monotonic()
+    try:
+        solution = solve(state)
+        results.put((name, solution, time.monotonic() - start, None))
+    except Exception as exc:
+        results.put((name, None, time.monotonic() - start, repr(exc)))
+
+
+class PortfolioResult:
+    """
+    Outcome of one portfolio solve
+
+    solution: chosen move list (None if no strategy found one)
+    strategy: name of the strategy that produced it
+    met_target: whether it satisfied the quality target
+    finished: name -> (solution, seconds, error) for strategies that returned
+    cancelled: strategies terminated before returning
+    """
+
+    def __init__(self, solution, strategy, met_target, finished, cancelled, elapsed):
+        self.solution = solution
+        self.strategy = strategy
+        self.met_target = met_target
+        self.finished = finished
+        self.cancelled = cancelled
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        length = len(self.solution) if self.solution is not None else None
+        return (f"PortfolioResult(strategy={self.strategy!r}, length={length}, "
+                f"met_target={self.met_target}, elapsed={self.elapsed:.3f}s)")
+
+
+class PortfolioSolver:
+    def __init__(self, strategies=None, target_length=None, timeout=10.0, max_workers=None):
+        """
+        Race solver strategies in separate processes
+        strategies: name -> solve function (default_strategies() if None)
+        target_length: Accept the first solution with at most this many moves
+                       (None = wait for every strategy and keep the shortest)
+        timeout: Seconds before the best solution so far is returned
+        max_workers: Start only the strategies that win most often in the
+                     state's bucket (None = start all of them)
+        """
+        self.strategies = strategies if strategies is not None else default_strategies(timeout)
+        self.target_length = target_length
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.wins = {}              # bucket -> Counter(strategy -> wins)
+        self.last_result = None
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+    def schedule(self, bucket):
+        """Strategy names for a bucket, most frequent winner first"""
+        wins = self.wins.get(bucket, Counter())
+        names = sorted(self.strategies, key=lambda name: -wins[name])
+        if self.max_workers is not None:
+            names = names[:self.max_workers]
+        return names
+
+    def solve(self, state, scramble_length=None):
+        """
+        Solve a sticker state with the whole portfolio; returns the moves
+        scramble_length: Length of the scramble that produced the state; it
+                         picks the bucket whose wins order the strategies,
+                         and only such solves are recorded (None: the
+                         given strategy order, nothing recorded)
+        Raises InvalidStateError for states no move sequence can solve
+        """
+        validation = validate_state(state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+        state = as_state(state)
+
+        start = time.monotonic()
+        deadline = start + self.timeout
+        bucket = length_bucket(scramble_length) if scramble_length is not None else None
+        names = self.schedule(bucket)
+
+        results = self._context.Queue()
+        workers = {}
+        for name in names:
+            worker = self._context.Process(target=_run_strategy, daemon=True,
+                                           args=(name, self.strategies[name], state, results))
+            worker.start()
+            workers[name] = worker
+
+        finished = {}
+        best = None
+        try:
+            while len(finished) < len(workers):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    name, solution, seconds, error = results.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                finished[name] = (solution, seconds, error)
+                if solution is not None and (best is None or len(solution) < len(finished[best][0])):
+                    best = name
+                if best is not None and self._meets_target(finished[best][0]):
+                    break
+        finally:
+            cancelled = [name for name in workers if name not in finished]
+            for worker in workers.values():
+                if worker.is_alive():
+                    worker.terminate()
+            for worker in workers.values():
+                worker.join()
+            results.close()
+
+        solution = finished[best][0] if best is not None else None
+        result = PortfolioResult(solution, best, solution is not None and self._meets_target(solution),
+                                 finished, cancelled, time.monotonic() - start)
+        if best is not None and bucket is not None:
+            self.wins.setdefault(bucket, Counter())[best] += 1
+        self.last_result = result
+        return solution
+
+    def _meets_target(self, solution):
+        return self.target_length is not None and len(solution) <= self.target_length
+
+    def format_wins(self):
+        lines = [f"{'Bucket':>8}  " + "  ".join(f"{name:>10}" for name in self.strategies)]
+        for bucket in sorted(self.wins, key=lambda b: int(b.rstrip('+').split('-')[0])):
+            counts = self.wins[bucket]
+            lines.append(f"{bucket:>8}  " + "  ".join(f"{counts[name]:>10}" for name in self.strategies))
+        return "\n".join(lines)
+
+
+def demo_portfolio():
+    """Race the built-in strategies on scrambles of different lengths"""
+    import random
+    from cube.moves import apply_moves, ALL_MOVES
+    from cube.state import CubeState
+
+    print("🏁 Portfolio solver")
+    print("=" * 45)
+    print("📦 Building solver tables...")
+    solver = PortfolioSolver(target_length=22, timeout=10.0)
+
+    rng = random.Random(4)
+    for length in (3, 4, 8, 25):
+        scramble = [rng.choice(ALL_MOVES) for _ in range(length)]
+        state = apply_moves(CubeState.solved(), scramble)
+        solution = solver.solve(state, scramble_length=length)
+        result = solver.last_result
+        print(f"\n🔄 Scramble ({length}): {' '.join(scramble)}")
+        print(f"✅ {result.strategy}: {' '.join(solution)} ({len(solution)} moves, "
+              f"{result.elapsed:.2f}s, cancelled: {', '.join(result.cancelled) or 'none'})")
+
+    print("\n📊 Wins per scramble-length bucket:")
+    print(solver.format_wins())
+
+
+if __name__ == "__main__":
+    demo_portfolio()
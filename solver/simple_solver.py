@@ -1,112 +1,263 @@
 # rubiks_solver/solver/simple_solver.py
 
 from collections import deque
-import copy
+import threading
 import sys
 import os
 
-# Add the project root to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    # Run as a script: make the project root importable. Imported as
+    # solver.simple_solver, the root is already on the path and sys.path
+    # is left alone
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    from cube.moves import MOVE_FUNCS, VALID_MOVES
-except ImportError:
-    # If running as script, try relative import
-    from ..cube.moves import MOVE_FUNCS, VALID_MOVES
+from cube.moves import MOVE_FUNCS, MOVE_PERMS, VALID_MOVES, apply_moves
+from cube.sequences import MoveTrie
+from cube.state import CubeState, as_state, standard_colors
+from cube.validation import validate_state, InvalidStateError
+from solver.move_automaton import get_automaton
 
 class SimpleCubeSolver:
-    def __init__(self, max_depth=7):
+    def __init__(self, max_depth=7, table_memory=16 << 20, table_policy='two_tier'):
         """
         Simple BFS solver for Rubik's cube
         max_depth: Maximum search depth (keep low due to exponential growth)
+        table_memory: Byte budget of the transposition table used by the
+                      depth-first iter_solutions search
+        table_policy: Its replacement policy ('depth', 'always' or 'two_tier')
         """
         self.max_depth = max_depth
+        self.table_memory = table_memory
+        self.table_policy = table_policy
+        # Search state is per thread (the transposition table of
+        # iter_solutions); everything else is configuration, so one solver
+        # can be shared between threads
+        self._local = threading.local()
+
+    @property
+    def table(self):
+        """The calling thread's transposition table (None until iter_solutions runs)"""
+        return getattr(self._local, 'table', None)
+
+    def __getstate__(self):
+        # Thread-local search state cannot be pickled (spawned portfolio
+        # workers) and is not worth sending: each process starts afresh
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
         
     def is_solved(self, state):
         """
         Check if the cube is in solved state
         A solved cube has all faces with the same color
         """
-        for face in state:
-            if not all(sticker == face[0] for sticker in face):
-                return False
-        return True
+        return as_state(state).is_solved()
     
     def get_scrambled_moves(self, num_moves=5):
         """
         Generate a random scramble sequence
+        Never turns the same face twice in a row (R R', R R) or returns to a
+        face across its opposite (R L R'), so no moves cancel or merge.
+        For uniformly random states use utils.scramble.Scrambler instead.
         """
         import random
-        return [random.choice(VALID_MOVES) for _ in range(num_moves)]
+        opposite = {'U': 'D', 'D': 'U', 'R': 'L', 'L': 'R', 'F': 'B', 'B': 'F'}
+        moves = []
+        while len(moves) < num_moves:
+            move = random.choice(VALID_MOVES)
+            if moves and move[0] == moves[-1][0]:
+                continue
+            if (len(moves) >= 2 and move[0] == moves[-2][0]
+                    and moves[-1][0] == opposite[move[0]]):
+                continue
+            moves.append(move)
+        return moves
     
     def apply_moves(self, state, moves):
         """
         Apply a sequence of moves to a cube state
+        Returns a new CubeState; the input is never modified, so no copy is needed
+        Accepts every move cube.moves.apply_moves does (half turns and M/E/S
+        slices included); raises ValueError for any other move
+        """
+        unsupported = [move for move in moves if move not in MOVE_PERMS]
+        if unsupported:
+            raise ValueError(f"Unsupported moves {unsupported}")
+        return apply_moves(state, moves)
+
+    def apply_many(self, state, sequences, intermediate=False):
+        """
+        Apply many move sequences to the same state, computing each shared
+        prefix once (see cube.sequences.MoveTrie)
+        Returns the final CubeState of each sequence, or with
+        intermediate=True the list of states after each of its moves
+        Raises ValueError for moves apply_moves does not know
         """
-        current_state = copy.deepcopy(state)
-        for move in moves:
-            if move in MOVE_FUNCS:
-                current_state = MOVE_FUNCS[move](current_state)
-        return current_state
+        trie = MoveTrie(sequences)
+        return trie.evaluate(state, intermediate)
     
-    def solve_bfs(self, initial_state):
+    def solve_bfs(self, initial_state, goal=None, upper_bound=None):
         """
         Solve using breadth-first search
-        Returns the sequence of moves to solve the cube
+        goal: Optional solver.goals.Goal (partial goal or target state);
+              solver.goals.GoalSolver reaches goals far faster
+        upper_bound: Length of a known solution; only strictly shorter
+                     ones are searched for
+        Returns the sequence of moves to solve the cube (or reach the goal)
+        Raises InvalidStateError for states no move sequence can solve
         """
-        if self.is_solved(initial_state):
+        # 0. VALIDATION - an unreachable state would only exhaust max_depth
+        validation = validate_state(initial_state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+
+        initial_state = as_state(initial_state)
+        is_goal = goal.is_reached if goal is not None else CubeState.is_solved
+        if is_goal(initial_state):
             return []
         
+        max_depth = self.max_depth if upper_bound is None else min(self.max_depth, upper_bound - 1)
+
         # 1. INITIALIZATION
-        queue = deque([(initial_state, [])])  # (cube_state, move_sequence)
-        visited = set()                       # Track explored states
-        
-        # Convert state to string for hashing
-        def state_to_string(state):
-            return str(state)
-        
-        visited.add(state_to_string(initial_state))
+        automaton = get_automaton(VALID_MOVES)
+        queue = deque([(initial_state, [], automaton.start)])  # (cube_state, move_sequence, automaton state)
+        visited = {initial_state}             # CubeStates hash directly
         
         # 2. STATE EXPLORATION
         while queue:
-            current_state, moves = queue.popleft()  # Get next state to explore
+            current_state, moves, node = queue.popleft()  # Get next state to explore
             
-            if len(moves) >= self.max_depth:
+            if len(moves) >= max_depth:
                 continue
                 
-            # 3. BRANCHING - Try all 12 possible moves
-            for move in VALID_MOVES:  # ['U', "U'", 'D', "D'", 'R', "R'", 'L', "L'", 'F', "F'", 'B', "B'"]
+            # 3. BRANCHING - Only the moves the automaton allows (about 9 of
+            # the 12): never "R R'", "R R R" or "D U" after "U D"
+            for m, next_node in automaton.successors[node]:
+                move = VALID_MOVES[m]
                 # Apply move to current state
                 new_state = MOVE_FUNCS[move](current_state)
                 new_moves = moves + [move]
                 
                 # 4. GOAL CHECK
-                if self.is_solved(new_state):
+                if is_goal(new_state):
                     return new_moves  # Found solution!
                 
                 # 5. DUPLICATE PREVENTION
-                state_str = state_to_string(new_state)
-                if state_str not in visited:
-                    visited.add(state_str)
-                    queue.append((new_state, new_moves))
+                if new_state not in visited:
+                    visited.add(new_state)
+                    queue.append((new_state, new_moves, next_node))
     
         return None  # No solution found within max_depth
 
+    def solve_from_history(self, initial_state, history):
+        """
+        Solve a state whose scramble is known
+        Returns an iterator over improving solutions: the simplified inverse
+        of the history (quarter turns; M/E/S slices from patterns are kept),
+        then a shorter optimal solution if the breadth-first search, bounded
+        by that length, finds one. If the history does not lead to the state
+        the search runs unbounded instead.
+        Raises ValueError at once for moves apply_moves does not know
+        """
+        from utils.scramble import history_solution
+        unsupported = [move for move in history if move not in MOVE_PERMS]
+        if unsupported:
+            raise ValueError(f"Unsupported moves {unsupported}")
+        initial_state = as_state(initial_state)
+        solution = history_solution(history, half_turns=False)
+        # Checked with the same moves the history was built from
+        if not self.apply_moves(initial_state, solution).is_solved():
+            solution = None
+        return self._iter_history_solutions(initial_state, solution)
+
+    def _iter_history_solutions(self, initial_state, solution):
+        if solution is not None:
+            yield solution
+            if not solution:
+                return
+        upper_bound = len(solution) if solution is not None else None
+        shorter = self.solve_bfs(initial_state, upper_bound=upper_bound)
+        if shorter is not None:
+            yield shorter
+
+    def solve_bfs_parallel(self, initial_state, goal=None, workers=None):
+        """
+        Breadth-first search with the visited set hash-partitioned over
+        worker processes (see solver.parallel_bfs); same result as solve_bfs
+        workers: Number of processes (default: one per CPU)
+        Raises InvalidStateError for states no move sequence can solve
+        """
+        from solver.parallel_bfs import ParallelBFS
+        validation = validate_state(initial_state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+        return ParallelBFS(workers, VALID_MOVES).search(initial_state, self.max_depth, goal)
+
+    def solve_bfs_external(self, initial_state, work_dir, memory_bytes=256 << 20):
+        """
+        Breadth-first search with the levels kept in sorted files under
+        work_dir (see solver.external_bfs), for searches whose levels do
+        not fit in RAM; an interrupted search resumes from work_dir
+        Returns a shortest solution, or None within max_depth
+        Raises InvalidStateError for states no move sequence can solve
+        """
+        from solver.external_bfs import ExternalBFS, CubeStateSpace
+        validation = validate_state(initial_state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+        # Keys are packed states, which assume the standard centres; face
+        # turns ignore colour names, so the relabelled state's solution fits
+        initial_state, _ = standard_colors(initial_state)
+        solved = CubeState.solved()
+
+        space = CubeStateSpace(VALID_MOVES)
+        bfs = ExternalBFS(work_dir, space, [initial_state], memory_bytes)
+        goal = space.keys([solved])
+        bfs.run(max_depth=self.max_depth, stop_keys=goal)
+        return bfs.path_to(goal[0])
+
+    def iter_solutions(self, initial_state, optimal=True):
+        """
+        Lazily yield every distinct solution up to max_depth quarter turns
+        (all optimal ones by default), streamed as found; friendly moves
+        are tried first
+        See solver.solutions.iter_solutions
+        """
+        from solver.solutions import iter_solutions
+        from solver.transposition import TranspositionTable
+        table = self.table
+        if table is None:
+            table = self._local.table = TranspositionTable(self.table_memory, self.table_policy)
+        return iter_solutions(initial_state, self.max_depth, optimal, VALID_MOVES, table=table)
+
+    def solve_many(self, states, workers=None):
+        """
+        Solve many states with solve_bfs on a thread pool (see solver.batch)
+        Returns the solutions in input order
+        Raises InvalidStateError if a state cannot be solved at all
+        """
+        from solver.batch import BatchSolver
+        return BatchSolver(self.solve_bfs, workers).solve_many(states)
+
+    def stats(self):
+        """Search statistics of the calling thread (transposition table probes, hits, ...)"""
+        stats = {'max_depth': self.max_depth}
+        if self.table is not None:
+            stats.update(self.table.stats())
+        return stats
+
 def create_solved_cube():
     """
     Create a solved cube state
-    State format: [Up, Right, Front, Down, Left, Back]
-    Each face is a list of 9 stickers (0-8)
+    State format: CubeState with faces [Up, Right, Front, Down, Left, Back]
+    Each face has 9 stickers (0-8); state[face][sticker] gives the colour
     Colors: 0=White, 1=Red, 2=Green, 3=Yellow, 4=Orange, 5=Blue
     """
-    return [
-        [0] * 9,  # Up (White)
-        [1] * 9,  # Right (Red)  
-        [2] * 9,  # Front (Green)
-        [3] * 9,  # Down (Yellow)
-        [4] * 9,  # Left (Orange)
-        [5] * 9   # Back (Blue)
-    ]
+    return CubeState.solved()
 
 def demo_solver():
     """
@@ -0,0 +1,232 @@
+# rubiks_solver/solver/solutions.py
+
+"""
+Enumeration of all optimal (or all short) solutions
+iter_solutions is a generator: it runs one depth-first search per
+solution length, guided by the two-phase pruning tables, and yields
+solutions as they are found, so memory stays bounded by the search depth
+and callers can stop after any number of results.
+
+Move sequences are only generated in the canonical form accepted by the
+move set's MoveAutomaton (solver/move_automaton.py): nothing that a
+shorter or earlier sequence already does ("R R'", "R R R", "D U" after
+"U D", "R' R'" for "R R" in the quarter-turn metric), so each solution is
+produced once modulo these trivial rewrites.
+"""
+
+import heapq
+import sys
+import os
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import N_TWIST, N_FLIP
+from cube.moves import MOVE_FUNCS, VALID_MOVES, ALL_MOVES
+from cube.state import as_state
+from cube.validation import validate_state, InvalidStateError
+from solver.coordinates import MOVES, get_slice
+from solver.two_phase import get_tables
+from solver.transposition import state_key
+from solver.move_automaton import get_automaton, DEAD
+
+# Rough execution cost of each face turn with standard right-hand-heavy
+# fingertricks; half turns and regrips (R/L <-> F/B) cost extra
+FACE_COST = {'R': 1.0, 'U': 1.0, 'L': 1.3, 'F': 1.5, 'D': 1.6, 'B': 2.2}
+HALF_TURN_COST = 0.4
+REGRIP_COST = 0.5
+
+# Subtrees shallower than this are cheaper to search than to look up
+TABLE_MIN_DEPTH = 3
+
+# Solutions buffered for ranking by iter_solutions(ranked=True)
+RANK_WINDOW = 64
+
+
+def fingertrick_cost(moves):
+    """Estimated execution cost of a move sequence (lower is friendlier)"""
+    cost = 0.0
+    previous = None
+    for move in moves:
+        face = move[0]
+        cost += FACE_COST[face]
+        if move.endswith('2'):
+            cost += HALF_TURN_COST
+        if previous is not None and {previous, face} & set('RL') and {previous, face} & set('FB'):
+            cost += REGRIP_COST
+        previous = face
+    return cost
+
+
+def _successor_order(moves):
+    """Moves sorted friendliest first, so searches find easy solutions early"""
+    return sorted(moves, key=lambda move: fingertrick_cost([move]))
+
+
+def _ranked(solutions, window):
+    """Reorder a stream friendliest first within a sliding buffer of `window` solutions"""
+    heap = []
+    for count, solution in enumerate(solutions):
+        item = (fingertrick_cost(solution), count, solution)
+        if len(heap) < window:
+            heapq.heappush(heap, item)
+        else:
+            yield heapq.heappushpop(heap, item)[2]
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+def iter_solutions(state, max_length=20, optimal=True, moves=ALL_MOVES, ranked=False, table=None):
+    """
+    Lazily yield distinct solutions, shortest first
+
+    Args:
+        state: Cube state to solve
+        max_length: Longest solution to consider
+        optimal: Stop after the shortest length that has solutions
+                 (False = every solution up to max_length)
+        moves: Move set (ALL_MOVES = face-turn metric, VALID_MOVES =
+               quarter turns only)
+        ranked: False streams solutions in search order (friendly moves
+                are tried first). True, or a buffer size, reorders them
+                friendliest first within a sliding buffer of RANK_WINDOW
+                (or that many) solutions, so memory stays bounded; use
+                best_solutions for the exact k friendliest
+        table: Optional TranspositionTable shared by all lengths (and,
+               if the caller keeps it, by later searches with the same
+               move set: its keys mix in automaton states)
+
+    Yields:
+        Lists of moves; none of them passes through the solved state
+    Raises InvalidStateError for states no move sequence can solve, and
+    ValueError if the table was used with another move set
+    """
+    automaton = get_automaton(moves)
+    if table is not None:
+        table.bind(tuple(automaton.moves))
+    validation = validate_state(state)
+    if not validation.valid:
+        raise InvalidStateError(validation)
+    state = as_state(state)
+    if state.is_solved():
+        yield []
+        return
+
+    tables = get_tables()
+    cube = validation.cubie
+    # Canonical successors of each automaton state, friendliest first
+    order = _successor_order(moves)
+    successors = [[(move, MOVES.index(move), MOVE_FUNCS[move], row[automaton.moves.index(move)])
+                   for move in order if row[automaton.moves.index(move)] != DEAD]
+                  for row in automaton.transitions]
+    start = (state, cube.get_twist(), cube.get_flip(), get_slice(cube), automaton.start)
+
+    window = RANK_WINDOW if ranked is True else int(ranked)
+    for length in range(1, max_length + 1):
+        level = _search(tables, successors, start, length, table)
+        if window > 1:
+            level = _ranked(level, window)
+        found = False
+        for solution in level:
+            found = True
+            yield solution
+        if found and optimal:
+            return
+
+
+def _search(tables, successors, start, length, table=None):
+    """
+    Depth-first search for solutions of exactly `length` moves
+
+    With a transposition table, every subtree that yields nothing is
+    recorded under its state and the automaton state that constrains it:
+    the depth it was searched to (the same subtree is skipped when it is
+    reached again with the same remaining depth, e.g. on the next length)
+    and a lower bound one more than its children's smallest bound.
+    """
+    twist_move, flip_move, slice_move = tables.twist_move, tables.flip_move, tables.slice_move
+    twist_prune, flip_prune = tables.slice_twist_prune, tables.slice_flip_prune
+    path = []
+
+    def lower_bound(twist, flip, slc):
+        # Face-turn distances also bound quarter-turn ones
+        return max(twist_prune[slc * N_TWIST + twist], flip_prune[slc * N_FLIP + flip])
+
+    def search(state, twist, flip, slc, remaining, node):
+        """Yields solutions, returns (found, lower bound of this subtree)"""
+        found = False
+        child_bound = 255
+        for move, m, apply_move, nxt in successors[node]:
+            new_twist, new_flip, new_slice = twist_move[twist][m], flip_move[flip][m], slice_move[slc][m]
+            bound = lower_bound(new_twist, new_flip, new_slice)
+            new_state = None
+            if table is not None and remaining > TABLE_MIN_DEPTH:
+                new_state = apply_move(state)
+                key = state_key(new_state, nxt)
+                entry = table.probe(key)
+                if entry is not None:
+                    bound = max(bound, entry[0])
+                    if entry[1] == remaining - 1 and bound <= remaining - 1:
+                        # Already searched to this depth without a solution
+                        child_bound = min(child_bound, bound)
+                        continue
+            if bound > remaining - 1:
+                child_bound = min(child_bound, bound)
+                continue
+            if new_state is None:
+                new_state = apply_move(state)
+            path.append(move)
+            if remaining == 1:
+                if new_state.is_solved():
+                    found = True
+                    yield list(path)
+                else:
+                    child_bound = min(child_bound, max(bound, 1))
+            elif new_state.is_solved():
+                child_bound = 0
+            else:
+                child_found, bound = yield from search(new_state, new_twist, new_flip, new_slice,
+                                                       remaining - 1, nxt)
+                if child_found:
+                    found = True
+                else:
+                    child_bound = min(child_bound, bound)
+                    if table is not None and remaining > TABLE_MIN_DEPTH:
+                        table.store(key, bound, remaining - 1)
+            path.pop()
+        return found, child_bound + 1
+
+    state, twist, flip, slc, node = start
+    if lower_bound(twist, flip, slc) > length:
+        return
+    yield from search(state, twist, flip, slc, length, node)
+
+
+def best_solutions(state, k=5, max_length=20, moves=ALL_MOVES):
+    """
+    The k friendliest optimal solutions, friendliest first
+    Every optimal solution is looked at, but only k are kept at a time
+    """
+    return heapq.nsmallest(k, iter_solutions(state, max_length, True, moves), key=fingertrick_cost)
+
+
+def demo_solutions():
+    """List every optimal solution of a short scramble"""
+    from cube.moves import apply_moves
+    from cube.state import CubeState
+
+    print("🧭 All optimal solutions")
+    print("=" * 45)
+    scramble = ["R", "U", "R'", "U'", "F2"]
+    state = apply_moves(CubeState.solved(), scramble)
+    print(f"🔄 Scramble: {' '.join(scramble)}")
+    for metric, moves in (("face turns", ALL_MOVES), ("quarter turns", VALID_MOVES)):
+        count = sum(1 for _ in iter_solutions(state, max_length=10, moves=moves))
+        print(f"\n✅ {count} optimal solutions ({metric}), friendliest first:")
+        for solution in best_solutions(state, k=5, max_length=10, moves=moves):
+            print(f"   {' '.join(solution):<30} cost {fingertrick_cost(solution):.1f}")
+
+
+if __name__ == "__main__":
+    demo_solutions()
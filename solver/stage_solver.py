@@ -0,0 +1,366 @@
+# rubiks_solver/solver/stage_solver.py
+
+"""
+Stage-wise (layer-by-layer) solver: cross, F2L, OLL, PLL
+Built for throughput rather than move count. Every stage is a lookup:
+    cross  exact distance table of the 4 D edges, walked move by move
+    F2L    per-pair distance tables over "trigger" macros (a side turn,
+           a U turn and the side turn undone), so solved pieces stay put
+    OLL    last-layer orientation case -> algorithm
+    PLL    last-layer permutation case -> algorithm
+The OLL/PLL tables are complete: they are generated from stored
+algorithms (utils/patterns.py plus a few standard ones below) combined
+with U turns, so every case has an entry. A solve does no search, so its
+runtime is bounded for any valid state.
+"""
+
+import heapq
+import threading
+import sys
+import os
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import CubieCube, MOVE_CUBES
+from cube.validation import validate_state, InvalidStateError
+from solver.coordinates import MOVES, piece_destinations, piece_move_table
+from solver.bfs_engine import CoordinateSpace, bfs_enumerate
+from utils.patterns import PATTERNS, SIMPLE_PATTERNS
+from utils.scramble import invert_moves, simplify_moves
+
+CROSS_EDGES = [4, 5, 6, 7]          # DR, DF, DL, DB
+SLOT_CORNERS = [4, 5, 6, 7]         # DFR, DLF, DBL, DRB
+SLOT_EDGES = [8, 9, 10, 11]         # FR, FL, BL, BR
+SIDE_FACES = 'RLFB'
+
+U_TURNS = [['U'], ['U2'], ["U'"]]
+
+# Last-layer algorithms used besides the ones in utils/patterns.py;
+# anything that disturbs the first two layers is ignored when the
+# tables are built
+LAST_LAYER_ALGORITHMS = [
+    ["F", "R", "U", "R'", "U'", "F'"],
+    ["R", "U", "R'", "U", "R'", "F", "R", "F'", "R", "U2", "R'"],
+    ["R", "U'", "R", "U", "R", "U", "R", "U'", "R'", "U'", "R2"],       # Ua
+    ["R'", "F", "R'", "B2", "R", "F'", "R'", "B2", "R2"],               # Aa
+    ["R", "U", "R'", "F'", "R", "U", "R'", "U'", "R'", "F", "R2", "U'", "R'"],
+]
+
+_CROSS_SIZE = 12 ** 4 * 16
+_PAIR_SIZE = 24 * 24
+
+
+def _cross_move_table():
+    """Positions (4 x base 12) and flips (4 bits) of the D edges under every face turn"""
+    values = np.arange(_CROSS_SIZE)
+    flips, rest = values % 16, values // 16
+    positions = []
+    for _ in range(4):
+        rest, pos = np.divmod(rest, 12)
+        positions.append(pos)
+    positions.reverse()
+    table = np.zeros((_CROSS_SIZE, len(MOVES)), dtype=np.int64)
+    for m, move in enumerate(MOVES):
+        dest, gain = piece_destinations(move, 'edge')
+        index = np.zeros(_CROSS_SIZE, dtype=np.int64)
+        new_flips = np.zeros(_CROSS_SIZE, dtype=np.int64)
+        for k, pos in enumerate(positions):
+            index = index * 12 + dest[pos]
+            new_flips |= (((flips >> (3 - k)) & 1) ^ gain[pos]) << (3 - k)
+        table[:, m] = index * 16 + new_flips
+    return table
+
+
+def cross_index(cube):
+    index, flips = 0, 0
+    for edge in CROSS_EDGES:
+        pos = cube.ep.index(edge)
+        index = index * 12 + pos
+        flips = flips * 2 + cube.eo[pos]
+    return index * 16 + flips
+
+
+def pair_index(cube, slot):
+    corner = cube.cp.index(SLOT_CORNERS[slot])
+    edge = cube.ep.index(SLOT_EDGES[slot])
+    return (corner * 3 + cube.co[corner]) * 24 + edge * 2 + cube.eo[edge]
+
+
+def _preserves(cube, corners, edges):
+    return (all(cube.cp[c] == c and cube.co[c] == 0 for c in corners) and
+            all(cube.ep[e] == e and cube.eo[e] == 0 for e in edges))
+
+
+def _slot_triggers():
+    """Trigger macros (X U^k X^-1) sorted by the one F2L slot each disturbs"""
+    triggers = [[] for _ in SLOT_CORNERS]
+    for face in SIDE_FACES:
+        for turn in (face, face + "'"):
+            for u_turn in U_TURNS:
+                moves = [turn] + u_turn + invert_moves([turn])
+                cube = CubieCube().apply_moves(moves)
+                for slot in range(4):
+                    others = [s for s in range(4) if s != slot]
+                    if _preserves(cube, [SLOT_CORNERS[s] for s in others],
+                                  CROSS_EDGES + [SLOT_EDGES[s] for s in others]):
+                        triggers[slot].append(moves)
+    return triggers
+
+
+def _last_layer_algorithms():
+    """Stored algorithms (and their inverses) that keep the first two layers solved"""
+    algorithms = [info['algorithm'] for info in list(PATTERNS.values()) + list(SIMPLE_PATTERNS.values())]
+    algorithms += LAST_LAYER_ALGORITHMS
+    kept = []
+    for moves in algorithms:
+        if not moves or any(move not in MOVE_CUBES for move in moves):
+            continue
+        cube = CubieCube().apply_moves(moves)
+        if _preserves(cube, SLOT_CORNERS, CROSS_EDGES + SLOT_EDGES):
+            for candidate in (list(moves), invert_moves(moves)):
+                if candidate not in kept:
+                    kept.append(candidate)
+    return kept
+
+
+def _case_table(algorithms, case_of, build):
+    """
+    Shortest (in moves) combination of algorithms and U turns for every
+    last-layer case reachable from the solved one
+    case_of(cube) -> case key, build(case) -> CubieCube with that case
+    """
+    macros = U_TURNS + algorithms
+    solved = case_of(CubieCube())
+    table = {solved: []}
+    queue = [(0, 0, solved)]
+    counter = 1
+    while queue:
+        cost, _, case = heapq.heappop(queue)
+        if cost > len(table[case]):
+            continue
+        cube = build(case)
+        for macro in macros:
+            # Reaching `previous` by the inverse macro means macro solves it
+            previous = case_of(cube.apply_moves(invert_moves(macro)))
+            solution = macro + table[case]
+            if previous not in table or len(solution) < len(table[previous]):
+                table[previous] = solution
+                heapq.heappush(queue, (len(solution), counter, previous))
+                counter += 1
+    return table
+
+
+def oll_case(cube):
+    return tuple(cube.co[:4]) + tuple(cube.eo[:4])
+
+
+def pll_case(cube):
+    return tuple(cube.cp[:4]) + tuple(cube.ep[:4])
+
+
+def _build_oll(case):
+    return CubieCube(co=list(case[:4]) + [0] * 4, eo=list(case[4:]) + [0] * 8)
+
+
+def _build_pll(case):
+    return CubieCube(cp=list(case[:4]) + [4, 5, 6, 7], ep=list(case[4:]) + list(range(4, 12)))
+
+
+def case_classes(table, case_of, build, final_turn=False):
+    """
+    Number of distinct cases once the U turn before the algorithm (and,
+    with final_turn, the one after it) is ignored
+    """
+    classes = set()
+    u_turns = [CubieCube()] + [MOVE_CUBES[m[0]] for m in U_TURNS]
+    for case in table:
+        cube = build(case)
+        variants = [case_of(before.multiply(cube).multiply(after))
+                    for before in (u_turns if final_turn else u_turns[:1])
+                    for after in u_turns]
+        classes.add(min(variants))
+    return len(classes)
+
+
+class _StageTables:
+    """Lookup tables for every stage (built once, a fraction of a second)"""
+
+    def __init__(self):
+        cross_move = _cross_move_table()
+        goal = 0
+        for pos in CROSS_EDGES:
+            goal = goal * 12 + pos
+        self.cross_goal = goal * 16
+        self.cross_dist = bfs_enumerate(CoordinateSpace([cross_move]), self.cross_goal,
+                                        exact=True).exact.tolist()
+        self.cross_move = cross_move.tolist()
+
+        corner_move = piece_move_table('corner')
+        edge_move = piece_move_table('edge')
+        self.triggers = _slot_triggers()
+        # Pair tables per (target slot, slots that may still be disturbed)
+        self.pair_tables = {}
+        for slot in range(4):
+            for free in range(16):
+                if not free >> slot & 1:
+                    continue
+                macros = list(U_TURNS)
+                for s in range(4):
+                    if free >> s & 1:
+                        macros += self.triggers[s]
+                corner_macro = np.stack([self._compose(corner_move, m) for m in macros], axis=1)
+                edge_macro = np.stack([self._compose(edge_move, m) for m in macros], axis=1)
+                space = CoordinateSpace([corner_macro, edge_macro])
+                goal = (SLOT_CORNERS[slot] * 3) * 24 + SLOT_EDGES[slot] * 2
+                dist = bfs_enumerate(space, goal, exact=True).exact
+                successors = [space.apply(space.decode(np.arange(_PAIR_SIZE)), k)
+                              for k in range(len(macros))]
+                self.pair_tables[slot, free] = (macros, dist.tolist(),
+                                                np.stack(successors, axis=1).tolist())
+
+        algorithms = _last_layer_algorithms()
+        self.oll = _case_table(algorithms, oll_case, _build_oll)
+        pll_algorithms = [a for a in algorithms
+                          if oll_case(CubieCube().apply_moves(a)) == (0,) * 8]
+        self.pll = _case_table(pll_algorithms, pll_case, _build_pll)
+
+    @staticmethod
+    def _compose(table, moves):
+        values = np.arange(len(table))
+        for move in moves:
+            values = table[values, MOVES.index(move)]
+        return values
+
+
+_TABLES = None
+_TABLES_LOCK = threading.Lock()
+
+
+def get_stage_tables():
+    global _TABLES
+    if _TABLES is None:
+        with _TABLES_LOCK:
+            if _TABLES is None:
+                _TABLES = _StageTables()
+    return _TABLES
+
+
+class StageSolver:
+    def __init__(self):
+        """
+        Layer-by-layer solver: fast, valid, far from optimal solutions
+        (typically 60-90 moves)
+        """
+        self.tables = get_stage_tables()
+        self._local = threading.local()
+
+    @property
+    def last_stages(self):
+        """Moves of each stage of the last solve in the calling thread"""
+        return getattr(self._local, 'stages', {})
+
+    def __getstate__(self):
+        # The thread-local last_stages cannot be pickled; unpickled solvers start empty
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def solve(self, state):
+        """
+        Solve a sticker state; returns the move sequence
+        Raises InvalidStateError for states no move sequence can solve
+        """
+        validation = validate_state(state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+        return self.solve_cubie(validation.cubie)
+
+    def solve_cubie(self, cube):
+        """Solve a CubieCube; the moves of each stage are kept in last_stages"""
+        stages = {}
+        stages['cross'], cube = self._cross(cube)
+        stages['f2l'], cube = self._f2l(cube)
+        stages['oll'], cube = self._last_layer(cube, self.tables.oll, oll_case)
+        stages['pll'], cube = self._last_layer(cube, self.tables.pll, pll_case)
+        self._local.stages = stages
+        return simplify_moves([move for moves in stages.values() for move in moves])
+
+    def _cross(self, cube):
+        t = self.tables
+        index = cross_index(cube)
+        moves = []
+        while index != t.cross_goal:
+            dist = t.cross_dist[index]
+            for m, nxt in enumerate(t.cross_move[index]):
+                if t.cross_dist[nxt] == dist - 1:
+                    moves.append(MOVES[m])
+                    index = nxt
+                    break
+        return moves, cube.apply_moves(moves)
+
+    def _f2l(self, cube):
+        moves = []
+        free = 0b1111
+        while free:
+            # Pair closest to its slot first
+            best = None
+            for slot in range(4):
+                if free >> slot & 1:
+                    macros, dist, successors = self.tables.pair_tables[slot, free]
+                    index = pair_index(cube, slot)
+                    if best is None or dist[index] < best[0]:
+                        best = (dist[index], slot, index)
+            _, slot, index = best
+            macros, dist, successors = self.tables.pair_tables[slot, free]
+            pair_moves = []
+            while dist[index]:
+                for k, nxt in enumerate(successors[index]):
+                    if dist[nxt] == dist[index] - 1:
+                        pair_moves += macros[k]
+                        index = nxt
+                        break
+            cube = cube.apply_moves(pair_moves)
+            moves += pair_moves
+            free &= ~(1 << slot)
+        return moves, cube
+
+    def _last_layer(self, cube, table, case_of):
+        moves = table[case_of(cube)]
+        return list(moves), cube.apply_moves(moves)
+
+
+def demo_stage_solver():
+    """Solve random states and show the stage breakdown and timing"""
+    import time
+    from utils.scramble import Scrambler
+
+    print("🏗️  Stage-wise solver (cross / F2L / OLL / PLL)")
+    print("=" * 45)
+    start = time.monotonic()
+    solver = StageSolver()
+    t = solver.tables
+    print(f"📦 Tables ready in {time.monotonic() - start:.2f}s")
+    print(f"   OLL cases: {case_classes(t.oll, oll_case, _build_oll) - 1}, "
+          f"PLL cases: {case_classes(t.pll, pll_case, _build_pll, final_turn=True) - 1}")
+
+    scrambler = Scrambler(seed=3)
+    for _ in range(3):
+        state = scrambler.random_state()
+        start = time.perf_counter()
+        solution = solver.solve(state)
+        elapsed = (time.perf_counter() - start) * 1000
+        stages = ", ".join(f"{name} {len(moves)}" for name, moves in solver.last_stages.items())
+        print(f"\n✅ {len(solution)} moves in {elapsed:.1f}ms ({stages})")
+        print(f"   {' '.join(solution)}")
+
+
+if __name__ == "__main__":
+    demo_stage_solver()
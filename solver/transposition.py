@@ -0,0 +1,162 @@
+# rubiks_solver/solver/transposition.py
+
+"""
+Bounded transposition table for depth-first searches
+Depth-first solvers reach the same state along different move orders;
+the table remembers what an earlier visit learned so the subtree is not
+searched again. Entries are kept in flat fixed-size arrays (64-bit key,
+lower bound, depth), so the table never grows past its memory budget:
+when two states map to the same slot, the replacement policy decides
+which one stays.
+
+Policies:
+    'depth'     keep the entry searched to the greater depth
+    'always'    the newest entry always wins
+    'two_tier'  buckets of two slots: a depth-preferred slot and an
+                always-replace slot, so deep results survive while recent
+                shallow ones are still cached
+"""
+
+from array import array
+
+ENTRY_BYTES = 10            # key (8) + lower bound (1) + depth (1)
+DEFAULT_MEMORY = 16 << 20   # bytes
+POLICIES = ('depth', 'always', 'two_tier')
+
+_KEY_MASK = (1 << 64) - 1
+_EMPTY = 0
+
+
+def state_key(state, extra=0):
+    """Compact 64-bit key of a hashable state (0 is reserved for empty slots)"""
+    key = (hash(state) * 31 + extra) & _KEY_MASK
+    return key or 1
+
+
+class TranspositionTable:
+    def __init__(self, memory_bytes=DEFAULT_MEMORY, policy='two_tier'):
+        """
+        Fixed-size transposition table
+        memory_bytes: Budget for the entry arrays (rounded down to a power
+                      of two number of entries, at least 2)
+        policy: Replacement policy, one of POLICIES
+        Raises ValueError for a budget below the 2-entry minimum
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown replacement policy {policy!r}, expected one of {POLICIES}")
+        if memory_bytes < 2 * ENTRY_BYTES:
+            raise ValueError(f"A transposition table needs at least {2 * ENTRY_BYTES} bytes, "
+                             f"got {memory_bytes}")
+        capacity = 2
+        while capacity * 2 * ENTRY_BYTES <= memory_bytes:
+            capacity *= 2
+        self.policy = policy
+        self.capacity = capacity
+        self.owner = None           # search space the keys belong to (see bind)
+        self._keys = array('Q', bytes(8 * capacity))
+        self._bounds = bytearray(capacity)
+        self._depths = bytearray(capacity)
+        # two_tier indexes buckets of two adjacent slots
+        self._mask = (capacity // 2 - 1) if policy == 'two_tier' else capacity - 1
+        self.reset_stats()
+
+    @property
+    def memory_bytes(self):
+        return self._keys.itemsize * len(self._keys) + len(self._bounds) + len(self._depths)
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def clear(self):
+        self._keys = array('Q', bytes(8 * self.capacity))
+        self._bounds = bytearray(self.capacity)
+        self._depths = bytearray(self.capacity)
+        self.owner = None
+        self.reset_stats()
+
+    def bind(self, owner):
+        """
+        Tie the table to one search space (e.g. a move automaton's moves)
+        Keys only mean something within the space they were made in, so
+        sharing a table across spaces would return foreign bounds
+        Raises ValueError if the table already holds entries of another
+        space; clear() it first
+        """
+        if self.owner is None:
+            self.owner = owner
+        elif self.owner != owner:
+            raise ValueError(f"The transposition table belongs to {self.owner!r}, "
+                             f"not {owner!r}; clear() it before reusing it")
+
+    def _slots(self, key):
+        if self.policy == 'two_tier':
+            slot = (key & self._mask) * 2
+            return slot, slot + 1
+        return (key & self._mask,)
+
+    def probe(self, key):
+        """Return (lower bound, depth) stored for key, or None"""
+        self.probes += 1
+        for slot in self._slots(key):
+            if self._keys[slot] == key:
+                self.hits += 1
+                return self._bounds[slot], self._depths[slot]
+        return None
+
+    def store(self, key, bound, depth):
+        """Record a lower bound on the distance and the depth it was searched to"""
+        bound = min(bound, 255)
+        depth = min(depth, 255)
+        self.stores += 1
+        slots = self._slots(key)
+        keys, depths = self._keys, self._depths
+
+        slot = next((s for s in slots if keys[s] == key), None)
+        if slot is None:
+            if self.policy == 'always':
+                slot = slots[0]
+            elif self.policy == 'depth':
+                slot = slots[0]
+                if keys[slot] != _EMPTY and depths[slot] > depth:
+                    return
+            else:
+                first, second = slots
+                if keys[first] == _EMPTY or depth >= depths[first]:
+                    # Demote the old deep entry to the always-replace slot
+                    if keys[first] != _EMPTY:
+                        self._copy(first, second)
+                    slot = first
+                else:
+                    slot = second
+            if keys[slot] != _EMPTY:
+                self.replacements += 1
+        keys[slot] = key
+        self._bounds[slot] = bound
+        depths[slot] = depth
+
+    def _copy(self, source, target):
+        self._keys[target] = self._keys[source]
+        self._bounds[target] = self._bounds[source]
+        self._depths[target] = self._depths[source]
+
+    def __len__(self):
+        return sum(1 for key in self._keys if key != _EMPTY)
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+    def stats(self):
+        return {
+            'tt_probes': self.probes,
+            'tt_hits': self.hits,
+            'tt_hit_rate': self.hit_rate,
+            'tt_stores': self.stores,
+            'tt_replacements': self.replacements,
+            'tt_capacity': self.capacity,
+            'tt_memory_bytes': self.memory_bytes,
+            'tt_policy': self.policy,
+        }
@@ -0,0 +1,208 @@
+# rubiks_solver/solver/two_phase.py
+
+"""
+Two-phase (Kociemba) solver
+Phase 1 brings the cube into the subgroup <U, D, R2, L2, F2, B2>
+(all orientations solved, slice edges in the slice), phase 2 solves it
+with those moves only. Both phases are IDA* searches guided by pruning
+tables built with NumPy on coordinate arrays.
+"""
+
+import threading
+import sys
+import os
+import time
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import CubieCube, MOVE_CUBES, N_TWIST, N_FLIP
+from cube.validation import validate_state, InvalidStateError
+from solver.coordinates import (MOVES, N_SLICE_PERM, all_permutations,
+                                twist_move_table, flip_move_table, slice_move_table,
+                                perm_move_table, corner_perm_move_table,
+                                get_slice, get_ud_edge_perm, get_slice_perm)
+from solver.bfs_engine import CoordinateSpace, bfs_enumerate
+from solver.move_automaton import get_automaton
+
+# Moves that keep the cube inside the phase 2 subgroup
+PHASE2_MOVES = [MOVES.index(m) for m in ['U', 'U2', "U'", 'D', 'D2', "D'", 'R2', 'F2', 'L2', 'B2']]
+
+
+def _prune_table(move_a, move_b, goal):
+    """Exact distance-to-goal table over the product of two coordinates"""
+    return bfs_enumerate(CoordinateSpace([move_a, move_b]), goal, exact=True).exact
+
+
+class _Tables:
+    """Move and pruning tables shared by all searches (built once)"""
+
+    def __init__(self):
+        twist_move = twist_move_table()
+        flip_move = flip_move_table()
+        slice_move = slice_move_table()
+        cperm_move = corner_perm_move_table(PHASE2_MOVES)
+        ud_move = perm_move_table(all_permutations(8), lambda mv: MOVE_CUBES[mv].ep[:8], PHASE2_MOVES)
+        sperm_move = perm_move_table(
+            all_permutations(4), lambda mv: [e - 8 for e in MOVE_CUBES[mv].ep[8:]], PHASE2_MOVES)
+
+        self.slice_goal = get_slice(CubieCube())
+
+        self.slice_twist_prune = _prune_table(slice_move, twist_move,
+                                              self.slice_goal * N_TWIST).tobytes()
+        self.slice_flip_prune = _prune_table(slice_move, flip_move,
+                                             self.slice_goal * N_FLIP).tobytes()
+        self.cperm_sperm_prune = _prune_table(cperm_move, sperm_move, 0).tobytes()
+        self.ud_sperm_prune = _prune_table(ud_move, sperm_move, 0).tobytes()
+
+        # Plain lists index much faster than NumPy arrays inside the search
+        self.twist_move = twist_move.tolist()
+        self.flip_move = flip_move.tolist()
+        self.slice_move = slice_move.tolist()
+        self.cperm_move = cperm_move.tolist()
+        self.ud_move = ud_move.tolist()
+        self.sperm_move = sperm_move.tolist()
+
+        # Canonical successors per automaton state; phase 2 continues the
+        # phase 1 path, so it walks the same automaton restricted to its moves
+        automaton = get_automaton(MOVES)
+        self.successors = automaton.successors
+        phase2_index = {m: k for k, m in enumerate(PHASE2_MOVES)}
+        self.phase2_successors = [[(phase2_index[m], m, nxt) for m, nxt in row if m in phase2_index]
+                                  for row in automaton.successors]
+
+
+_TABLES = None
+_TABLES_LOCK = threading.Lock()
+
+
+def get_tables():
+    """
+    Return the shared tables, building them on first use
+    The tables are never modified once built, so every solver and thread
+    reads the same copy; the lock only makes sure they are built once.
+    """
+    global _TABLES
+    if _TABLES is None:
+        with _TABLES_LOCK:
+            if _TABLES is None:
+                _TABLES = _Tables()
+    return _TABLES
+
+
+class _Timeout(Exception):
+    pass
+
+
+class TwoPhaseSolver:
+    def __init__(self, max_length=24, timeout=10.0):
+        """
+        Two-phase solver for arbitrary cube states
+        max_length: Longest solution accepted (20 is always possible, but slow to find)
+        timeout: Seconds to search before giving up
+        """
+        self.max_length = max_length
+        self.timeout = timeout
+        self.tables = get_tables()
+
+    def solve(self, state):
+        """
+        Solve a sticker state ([U, R, F, D, L, B] lists of colours)
+        Returns the move sequence, or None if nothing was found in time
+        Raises InvalidStateError for states no move sequence can solve
+        """
+        validation = validate_state(state)
+        if not validation.valid:
+            raise InvalidStateError(validation)
+        return self.solve_cubie(validation.cubie)
+
+    def solve_cubie(self, cube):
+        """Solve a CubieCube; returns a list of moves or None"""
+        if cube.is_solved():
+            return []
+
+        # All per-search state lives in the _Search, so one solver can be
+        # shared by any number of threads
+        search = _Search(self.tables, cube, self.max_length, time.monotonic() + self.timeout)
+        t = self.tables
+        twist, flip, slc = cube.get_twist(), cube.get_flip(), get_slice(cube)
+        h = max(t.slice_twist_prune[slc * N_TWIST + twist], t.slice_flip_prune[slc * N_FLIP + flip])
+
+        try:
+            for depth in range(h, self.max_length + 1):
+                solution = search.phase1(twist, flip, slc, depth, 0)
+                if solution is not None:
+                    return [MOVES[m] for m in solution]
+        except _Timeout:
+            pass
+        return None
+
+
+class _Search:
+    """State of one two-phase search (cube, current phase 1 path, deadline)"""
+
+    def __init__(self, tables, cube, max_length, deadline):
+        self.tables = tables
+        self.cube = cube
+        self.max_length = max_length
+        self.deadline = deadline
+        self.path = []
+
+    def phase1(self, twist, flip, slc, depth, node):
+        if depth == 0:
+            # A phase 1 path ending in a phase 2 move was already tried one level up
+            if self.path and self.path[-1] in PHASE2_MOVES:
+                return None
+            return self.start_phase2(node)
+
+        t = self.tables
+        for m, nxt in t.successors[node]:
+            new_twist = t.twist_move[twist][m]
+            new_flip = t.flip_move[flip][m]
+            new_slice = t.slice_move[slc][m]
+            if (t.slice_twist_prune[new_slice * N_TWIST + new_twist] >= depth or
+                    t.slice_flip_prune[new_slice * N_FLIP + new_flip] >= depth):
+                continue
+            self.path.append(m)
+            solution = self.phase1(new_twist, new_flip, new_slice, depth - 1, nxt)
+            if solution is not None:
+                return solution
+            self.path.pop()
+        return None
+
+    def start_phase2(self, node):
+        if time.monotonic() > self.deadline:
+            raise _Timeout()
+
+        remaining = self.max_length - len(self.path)
+        cube = self.cube.apply_moves(MOVES[m] for m in self.path)
+        cperm, ud, sperm = cube.get_corner_perm(), get_ud_edge_perm(cube), get_slice_perm(cube)
+
+        t = self.tables
+        h = max(t.cperm_sperm_prune[cperm * N_SLICE_PERM + sperm],
+                t.ud_sperm_prune[ud * N_SLICE_PERM + sperm])
+        phase1_path = list(self.path)
+        for depth in range(h, remaining + 1):
+            tail = []
+            if self.phase2(cperm, ud, sperm, depth, node, tail):
+                return phase1_path + tail
+        return None
+
+    def phase2(self, cperm, ud, sperm, depth, node, path):
+        if depth == 0:
+            return cperm == 0 and ud == 0 and sperm == 0
+
+        t = self.tables
+        for k, m, nxt in t.phase2_successors[node]:
+            new_cperm = t.cperm_move[cperm][k]
+            new_ud = t.ud_move[ud][k]
+            new_sperm = t.sperm_move[sperm][k]
+            if (t.cperm_sperm_prune[new_cperm * N_SLICE_PERM + new_sperm] >= depth or
+                    t.ud_sperm_prune[new_ud * N_SLICE_PERM + new_sperm] >= depth):
+                continue
+            path.append(m)
+            if self.phase2(new_cperm, new_ud, new_sperm, depth - 1, nxt, path):
+                return True
+            path.pop()
+        return False
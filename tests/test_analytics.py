@@ -0,0 +1,80 @@
+# rubiks_solver/tests/test_analytics.py
+
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import CubieCube, CORNERS, EDGES
+from cube.moves import ALL_MOVES, apply_moves
+from cube.state import CubeState
+from utils.analytics import analyze, commutes, compile_moves, inverse_permutation, analyze_patterns
+from utils.patterns import PATTERNS
+
+
+def test_permutation_matches_apply_moves():
+    solved = CubeState.solved()
+    for info in PATTERNS.values():
+        perm = compile_moves(info['algorithm'])
+        assert bytes(solved.stickers[i] for i in perm) == apply_moves(solved, info['algorithm']).stickers
+
+
+@pytest.mark.parametrize('moves, order', [('R', 4), ('R2', 2), ('R U', 105), ("R U R' U'", 6), ('', 1)])
+def test_order(moves, order):
+    analysis = analyze(moves)
+    assert analysis.order == order
+    state = CubeState.solved()
+    for repetition in range(1, order + 1):
+        state = apply_moves(state, moves.split())
+        assert state.is_solved() == (repetition == order)
+
+
+def test_pattern_structure():
+    analyses = analyze_patterns()
+    t_perm = analyses['t_perm']
+    assert t_perm.order == 2
+    assert t_perm.corner_cycles == ((('URF', 'UBR'), 0),)
+    assert t_perm.edge_cycles == ((('UR', 'UL'), 0),)
+    assert t_perm.cycle_notation() == '(URF UBR) (UR UL)'
+
+    h_perm = analyses['h_perm']
+    assert h_perm.affected['corners'] == () and len(h_perm.affected['edges']) == 4
+
+    checkerboard = analyses['checkerboard']
+    assert len(checkerboard.edge_cycles) == 6 and checkerboard.centre_cycles == ()
+    assert analyses['solved'].is_identity and analyses['solved'].cycle_notation() == 'identity'
+
+
+def test_orientation_only_changes():
+    twist = analyze("R' D' R D R' D' R D")     # turns URF in place; only the D layer moves
+    assert twist.twisted_corners['URF'] in (1, 2)
+    assert all(name[0] == 'D' for cycle, _ in twist.corner_cycles for name in cycle)
+    assert analyze('M').centre_cycles and set(analyze('M').affected['centres']) == set('UFDB')
+
+
+def test_affected_pieces_match_the_cubie_model():
+    rng = random.Random(5)
+    for _ in range(50):
+        moves = [rng.choice(ALL_MOVES) for _ in range(rng.randint(1, 12))]
+        cube = CubieCube().apply_moves(moves)
+        affected = analyze(moves).affected
+        assert set(affected['corners']) == {CORNERS[p] for p in range(8) if cube.cp[p] != p or cube.co[p]}
+        assert set(affected['edges']) == {EDGES[p] for p in range(12) if cube.ep[p] != p or cube.eo[p]}
+
+
+def test_inverse_and_commutation():
+    analysis = analyze(PATTERNS['sune']['algorithm'])
+    assert analysis.inverse.permutation == inverse_permutation(analysis.permutation)
+    assert commutes('R', 'L') and commutes('U D', 'D2')
+    assert not commutes('R', 'U')
+
+
+def test_analyses_are_cached_and_read_only():
+    assert analyze('R U') is analyze(['R', 'U'])
+    with pytest.raises(TypeError):
+        analyze(PATTERNS['sune']['algorithm']).affected['corners'] = ()
+    with pytest.raises(ValueError):
+        analyze('R X')
@@ -0,0 +1,44 @@
+# rubiks_solver/tests/test_batch.py
+
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from solver.batch import BatchSolver, solve_many
+from solver.simple_solver import SimpleCubeSolver
+
+SCRAMBLES = [['R'], ['R', 'U'], ['F', 'D', "L'"], [], ['B2', 'U']]
+
+
+def _states():
+    return [apply_moves(CubeState.solved(), moves) for moves in SCRAMBLES]
+
+
+def test_solutions_come_back_in_input_order():
+    states = _states()
+    solver = SimpleCubeSolver(max_depth=5)
+    solutions = BatchSolver(solver.solve_bfs, workers=4).solve_many(states)
+    assert solutions == [solver.solve_bfs(state) for state in states]
+    assert all(apply_moves(state, moves).is_solved() for state, moves in zip(states, solutions))
+
+
+def test_work_runs_on_the_pool_threads():
+    names = set()
+
+    def solve(state):
+        names.add(threading.current_thread().name)
+        return []
+
+    solve_many(_states(), solve, workers=3)
+    assert threading.current_thread().name not in names
+
+
+def test_imap_yields_every_index():
+    solver = SimpleCubeSolver(max_depth=5)
+    results = dict(BatchSolver(solver.solve_bfs, workers=2).imap(_states()))
+    assert sorted(results) == list(range(len(SCRAMBLES)))
+    assert results[3] == []
@@ -0,0 +1,64 @@
+# rubiks_solver/tests/test_bfs_engine.py
+
+import sys
+import os
+from collections import deque
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solver.bfs_engine import CoordinateSpace, bfs_enumerate, UNVISITED
+from solver.coordinates import corner_perm_move_table, twist_move_table
+
+
+def _plain_bfs(table, goal=0):
+    table = np.asarray(table).tolist()
+    distance = [-1] * len(table)
+    distance[goal] = 0
+    queue = deque([goal])
+    while queue:
+        index = queue.popleft()
+        for nxt in table[index]:
+            if distance[nxt] < 0:
+                distance[nxt] = distance[index] + 1
+                queue.append(nxt)
+    return np.array(distance)
+
+
+def test_matches_a_plain_breadth_first_search():
+    table = corner_perm_move_table()
+    expected = _plain_bfs(table)
+    for chunk_size in (1 << 20, 1000):
+        result = bfs_enumerate(CoordinateSpace([table]), goals=0, exact=True, chunk_size=chunk_size)
+        assert result.distribution == np.bincount(expected).tolist()
+        assert np.array_equal(result.exact, expected)
+        assert np.array_equal(result.mod3(np.arange(len(expected))), expected % 3)
+
+
+def test_product_space_and_distance_walk():
+    space = CoordinateSpace([twist_move_table(), twist_move_table()])
+    assert space.size == 2187 ** 2
+    coords = space.decode(np.array([0, 5, space.size - 1]))
+    assert np.array_equal(space.encode(coords), [0, 5, space.size - 1])
+
+    space = CoordinateSpace([twist_move_table()])
+    exact = bfs_enumerate(space, goals=0, exact=True)
+    packed = bfs_enumerate(space, goals=0)
+    assert packed.exact is None and packed.distribution == exact.distribution
+    for index in (0, 1, 100, 2186):
+        assert packed.distance(index) == exact.distance(index)
+
+
+def test_max_depth_and_several_goals():
+    table = corner_perm_move_table()
+    space = CoordinateSpace([table])
+    partial = bfs_enumerate(space, goals=0, max_depth=2)
+    assert partial.distribution == [1, 18, 243] and partial.max_depth == 2
+    far = int(np.argmax(_plain_bfs(table)))
+    assert partial.mod3([far])[0] == UNVISITED and partial.distance(far) is None
+
+    goals = [0, 1, 2]
+    result = bfs_enumerate(space, goals=goals, exact=True)
+    assert result.distribution[0] == 3 and result.visited == space.size
+    assert all(result.distance(goal) == 0 for goal in goals)
@@ -0,0 +1,67 @@
+# rubiks_solver/tests/test_dataset.py
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from utils.dataset import DatasetReader, DatasetWriter, pack_states, unpack_states
+from utils.scramble import random_states
+
+
+def test_pack_round_trip():
+    states = random_states(1000, seed=3)
+    assert np.array_equal(unpack_states(pack_states(states)), states)
+
+
+def test_pack_rejects_moved_centres():
+    state = apply_moves(CubeState.solved(), ['M'])
+    with pytest.raises(ValueError):
+        pack_states(np.frombuffer(state.stickers, dtype=np.uint8))
+
+
+def test_file_round_trip(tmp_path):
+    path = tmp_path / 'data.rcds'
+    bulk = random_states(300, seed=4)
+    single = apply_moves(CubeState.solved(), ['R', 'U2', "F'"])
+    with DatasetWriter(path, chunk_size=128) as writer:
+        writer.write(single, ['R', 'U2', "F'"], depth=3, solve_time=0.25)
+        writer.write_many(bulk, moves_list=[['U']] * len(bulk))
+
+    with DatasetReader(path) as reader:
+        assert len(reader) == 301
+        records = list(reader)
+    assert records[0] == (single, ['R', 'U2', "F'"], 3, 0.25)
+    assert all(depth is None and solve_time is None for _, _, depth, solve_time in records[1:])
+    assert np.array_equal(np.array([np.frombuffer(s.stickers, dtype=np.uint8) for s, _, _, _ in records[1:]]),
+                          bulk)
+
+
+def test_with_block_while_chunk_views_are_alive(tmp_path):
+    path = tmp_path / 'data.rcds'
+    with DatasetWriter(path, chunk_size=50) as writer:
+        writer.write_many(random_states(120, seed=5))
+
+    with DatasetReader(path) as reader:
+        for chunk in reader.iter_chunks():
+            states = chunk.states()
+    # The last chunk's views outlive the block without an error
+    assert len(chunk) == 20 and states.shape == (20, 54)
+    assert int(chunk.depths[0]) == 255
+    with pytest.raises(ValueError):
+        reader.chunk(0)
+
+
+def test_with_block_does_not_hide_errors(tmp_path):
+    path = tmp_path / 'data.rcds'
+    with DatasetWriter(path) as writer:
+        writer.write_many(random_states(10, seed=6))
+    with pytest.raises(KeyError):
+        with DatasetReader(path) as reader:
+            chunk = reader.chunk(0)
+            raise KeyError(len(chunk))
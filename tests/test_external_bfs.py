@@ -0,0 +1,73 @@
+# rubiks_solver/tests/test_external_bfs.py
+
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from solver.external_bfs import ExternalBFS, CubeStateSpace
+
+# States at each distance from solved in the face-turn metric
+DISTRIBUTION = [1, 18, 243, 3240, 43239]
+MEMORY = 64 << 10               # small chunks, so levels are split into several runs
+
+
+def _runs(work_dir):
+    return sorted(name for name in os.listdir(work_dir) if name.startswith('run_'))
+
+
+def test_distribution_with_resume(tmp_path):
+    space = CubeStateSpace()
+    bfs = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY)
+    assert bfs.run(max_depth=2) == DISTRIBUTION[:3]
+
+    resumed = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY)
+    assert resumed.depth == 2
+    assert resumed.run(max_depth=4) == DISTRIBUTION
+    assert not _runs(tmp_path)
+
+    level = resumed.level(3)
+    assert len(level) == DISTRIBUTION[3] and np.all(level[:-1] < level[1:])
+    state = apply_moves(CubeState.solved(), ['R', 'U2', "F'"])
+    key = space.keys([state])[0]
+    assert resumed.distance(key) == 3
+    assert apply_moves(CubeState.solved(), resumed.path_to(key)) == state
+
+
+def test_interrupted_level_reuses_its_runs(tmp_path):
+    space = CubeStateSpace()
+    bfs = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY)
+    bfs.run(max_depth=2)
+    runs = bfs._write_runs(3)           # crash after the runs, before the merge
+    assert len(runs) > 1
+
+    resumed = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY)
+    assert _runs(tmp_path) == sorted(os.path.basename(path) for path in runs)
+    assert resumed.run(max_depth=3) == DISTRIBUTION[:4]
+
+
+def test_runs_of_finished_levels_are_removed_on_resume(tmp_path):
+    space = CubeStateSpace()
+    bfs = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY)
+    bfs.run(max_depth=2)
+    stale = bfs._write_runs(2)          # crash after the checkpoint, before the removal
+    assert stale
+
+    resumed = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY)
+    assert not _runs(tmp_path)
+    assert resumed.run(max_depth=3) == DISTRIBUTION[:4]
+
+
+def test_runs_cut_at_another_chunk_size_are_discarded(tmp_path):
+    space = CubeStateSpace()
+    bfs = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY)
+    bfs.run(max_depth=2)
+    bfs._write_runs(3)
+
+    resumed = ExternalBFS(tmp_path, space, [CubeState.solved()], memory_bytes=MEMORY // 2)
+    assert not _runs(tmp_path)
+    assert resumed.run(max_depth=3) == DISTRIBUTION[:4]
@@ -0,0 +1,87 @@
+# rubiks_solver/tests/test_facelets.py
+
+import sys
+import os
+import io
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from utils.facelets import (to_facelet_string, from_facelet_string, to_base64, from_base64, parse_state,
+                            parse_facelet_buffer, format_facelet_buffer, parse_base64_buffer,
+                            format_base64_buffer, load_states, save_states, BASE64_LENGTH)
+from utils.scramble import random_states
+
+SOLVED = 'U' * 9 + 'R' * 9 + 'F' * 9 + 'D' * 9 + 'L' * 9 + 'B' * 9
+
+
+def test_single_state_round_trips():
+    assert to_facelet_string(CubeState.solved()) == SOLVED
+    assert from_facelet_string(SOLVED.lower()) == CubeState.solved()
+    state = apply_moves(CubeState.solved(), ['R', 'U2', "F'", 'D'])
+    text = to_facelet_string(state)
+    assert from_facelet_string(text) == state == parse_state(text)
+    encoded = to_base64(state)
+    assert len(encoded) == BASE64_LENGTH and '=' not in encoded
+    assert from_base64(encoded) == state == parse_state(f" {encoded}\n")
+
+
+def test_moved_centres():
+    state = apply_moves(CubeState.solved(), ['M'])
+    assert from_facelet_string(to_facelet_string(state)) == state
+    with pytest.raises(ValueError):
+        to_base64(state)
+
+
+@pytest.mark.parametrize('text', ['U' * 53, 'U' * 53 + 'X', 'U' * 53 + 'é'])
+def test_bad_facelet_strings(text):
+    with pytest.raises(ValueError):
+        from_facelet_string(text)
+
+
+@pytest.mark.parametrize('text', ['A' * 23, 'A' * 23 + '+', 'A' * 23 + '=', '_' * 24])
+def test_bad_base64_states(text):
+    with pytest.raises(ValueError):
+        from_base64(text)
+
+
+def test_bulk_round_trips():
+    states = random_states(1000, seed=8)
+    text = format_facelet_buffer(states)
+    assert len(text) == 55 * 1000
+    assert np.array_equal(parse_facelet_buffer(text), states)
+    assert np.array_equal(parse_facelet_buffer(text.decode('ascii').replace('\n', '\r\n')), states)
+    assert np.array_equal(parse_facelet_buffer(io.BytesIO(text.rstrip(b'\n'))), states)
+    compact = format_base64_buffer(states)
+    assert len(compact) == (BASE64_LENGTH + 1) * 1000
+    assert np.array_equal(parse_base64_buffer(compact), states)
+    assert parse_facelet_buffer(b'').shape == (0, 54)
+
+
+def test_bulk_matches_single_states():
+    states = random_states(20, seed=9)
+    lines = format_facelet_buffer(states).decode('ascii').split()
+    assert lines == [to_facelet_string(CubeState(row.tobytes())) for row in states]
+    lines = format_base64_buffer(states).decode('ascii').split()
+    assert lines == [to_base64(CubeState(row.tobytes())) for row in states]
+
+
+def test_bulk_errors_name_the_line():
+    lines = [SOLVED] * 3
+    lines[1] = SOLVED[:-1] + 'X'
+    with pytest.raises(ValueError, match='Line 2'):
+        parse_facelet_buffer('\n'.join(lines))
+    with pytest.raises(ValueError):
+        parse_facelet_buffer(SOLVED + '\n' + SOLVED[:-1] + '\n')
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_files(tmp_path, compact):
+    states = random_states(50, seed=10)
+    path = tmp_path / 'states.txt'
+    save_states(path, states, compact=compact)
+    assert np.array_equal(load_states(path), states)
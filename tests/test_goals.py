@@ -0,0 +1,75 @@
+# rubiks_solver/tests/test_goals.py
+
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import ALL_MOVES, apply_moves
+from cube.state import CubeState
+from solver.goals import Goal, GoalSolver, cross_goal, first_two_layers_goal, pattern_goal
+from solver.solutions import iter_solutions
+from solver.stage_solver import StageSolver
+from utils.scramble import Scrambler
+
+
+@pytest.fixture(scope='module')
+def solver():
+    return GoalSolver(max_length=12, timeout=60.0)
+
+
+def test_goal_masks():
+    goal = cross_goal()
+    assert len(goal.edges) == 4 and not goal.corners and len(goal.mask) == 8
+    assert goal.is_reached(CubeState.solved())
+    assert goal.is_reached(apply_moves(CubeState.solved(), ['U', 'R', 'U', "R'"]))
+    assert not goal.is_reached(apply_moves(CubeState.solved(), ['R']))
+    f2l = first_two_layers_goal()
+    assert len(f2l.corners) == 4 and len(f2l.edges) == 8
+    assert f2l.is_reached(apply_moves(CubeState.solved(), ['F', 'R', 'U', "R'", "U'", "F'"]))
+    assert len(Goal().mask) == 48       # centres are never checked
+
+
+def test_optimal_cross(solver):
+    stage = StageSolver()
+    scrambler = Scrambler(seed=12)
+    for _ in range(5):
+        state = scrambler.random_state()
+        moves = solver.solve(state, cross_goal())
+        assert cross_goal().is_reached(apply_moves(state, moves))
+        stage.solve(state)
+        # The stage solver walks an exact cross distance table
+        assert len(moves) == len(stage.last_stages['cross'])
+
+
+def test_full_solve_is_optimal(solver):
+    rng = random.Random(8)
+    for _ in range(3):
+        state = apply_moves(CubeState.solved(), [rng.choice(ALL_MOVES) for _ in range(5)])
+        moves = solver.solve(state)
+        assert apply_moves(state, moves).is_solved()
+        assert len(moves) == len(next(iter_solutions(state, 8)))
+
+
+def test_state_to_state(solver):
+    start = apply_moves(CubeState.solved(), ['R', 'U', 'F'])
+    target = apply_moves(start, ['D', "L'", 'B2'])
+    moves = solver.solve_to(start, target)
+    assert len(moves) == 3 and apply_moves(start, moves) == target
+
+
+def test_pattern_goal(solver):
+    moves = solver.solve(CubeState.solved(), pattern_goal('t_pattern'))
+    assert pattern_goal('t_pattern').is_reached(apply_moves(CubeState.solved(), moves))
+    with pytest.raises(ValueError):
+        pattern_goal('no_such_pattern')
+    with pytest.raises(ValueError):
+        pattern_goal('checkerboard')        # slice moves
+
+
+def test_timeout_returns_none():
+    state = Scrambler(seed=1).random_state()
+    assert GoalSolver(max_length=20, timeout=0.0).solve(state) is None
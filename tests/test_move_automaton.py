@@ -0,0 +1,67 @@
+# rubiks_solver/tests/test_move_automaton.py
+
+import sys
+import os
+from itertools import product
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import ALL_MOVES, VALID_MOVES, MOVE_FUNCS
+from cube.state import CubeState
+from solver.move_automaton import MoveAutomaton, get_automaton, DEAD
+
+
+def _positions_by_depth(moves, depth):
+    """Number of new positions at each depth, by plain breadth-first search"""
+    seen = {CubeState.solved()}
+    frontier = [CubeState.solved()]
+    counts = [1]
+    for _ in range(depth):
+        next_frontier = []
+        for state in frontier:
+            for move in moves:
+                new_state = MOVE_FUNCS[move](state)
+                if new_state not in seen:
+                    seen.add(new_state)
+                    next_frontier.append(new_state)
+        frontier = next_frontier
+        counts.append(len(frontier))
+    return counts
+
+
+def test_canonical_sequences_are_the_distinct_positions():
+    # Up to the automaton's depth every position has exactly one canonical sequence
+    assert get_automaton(ALL_MOVES).count_sequences(4) == [1, 18, 243, 3240, 43239]
+    assert get_automaton(VALID_MOVES).count_sequences(4) == _positions_by_depth(VALID_MOVES, 4)
+
+
+def test_canonical_sequences_reach_distinct_states():
+    automaton = get_automaton(VALID_MOVES)
+    states = set()
+    for moves in product(VALID_MOVES, repeat=3):
+        if automaton.accepts(moves):
+            state = CubeState.solved()
+            for move in moves:
+                state = MOVE_FUNCS[move](state)
+            states.add(state)
+    assert len(states) == automaton.count_sequences(3)[3]
+
+
+def test_redundant_sequences_are_rejected():
+    automaton = get_automaton(ALL_MOVES)
+    assert not automaton.accepts(['R', "R'"]) and not automaton.accepts(['R', 'R2', 'U'])
+    assert automaton.accepts(['R', 'L']) != automaton.accepts(['L', 'R'])
+    assert automaton.step(automaton.start, 'R') != DEAD
+    assert automaton.step(automaton.step(automaton.start, 'R'), 'R') == DEAD
+    quarter = get_automaton(VALID_MOVES)
+    assert quarter.accepts(['R', 'R']) != quarter.accepts(["R'", "R'"])
+    assert 13 < automaton.branching_factor() < 14      # of the 18 moves
+
+
+def test_automata_are_cached():
+    assert get_automaton(ALL_MOVES) is get_automaton(tuple(ALL_MOVES))
+    assert get_automaton(ALL_MOVES, depth=2) is not get_automaton(ALL_MOVES)
+    # Depth 2 merges R R with R' R' but cannot see R R R = R'
+    small = MoveAutomaton(['R', "R'"], depth=2)
+    assert small.count_sequences(3) == [1, 2, 1, 1]
+    assert MoveAutomaton(['R', "R'"], depth=3).count_sequences(3) == [1, 2, 1, 0]
@@ -0,0 +1,33 @@
+# rubiks_solver/tests/test_parallel_bfs.py
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from solver.simple_solver import SimpleCubeSolver
+
+# A valid colour scheme other than 0-5 in face order (a rotation about U)
+RELABEL = {0: 0, 1: 2, 2: 4, 3: 3, 4: 5, 5: 1}
+
+
+def _recolored(state):
+    return CubeState(bytes(RELABEL[c] for c in state.stickers))
+
+
+def test_parallel_matches_sequential_on_recolored_state():
+    solver = SimpleCubeSolver(max_depth=4)
+    state = _recolored(apply_moves(CubeState.solved(), ["R", "U"]))
+    expected = solver.solve_bfs(state)
+    assert expected == ["U'", "R'"]
+    assert solver.solve_bfs_parallel(state, workers=2) == expected
+
+
+def test_parallel_matches_sequential_on_standard_state():
+    solver = SimpleCubeSolver(max_depth=4)
+    state = apply_moves(CubeState.solved(), ["F", "R'", "D"])
+    expected = solver.solve_bfs(state)
+    assert solver.solve_bfs_parallel(state, workers=3) == expected
+    assert apply_moves(state, expected).is_solved()
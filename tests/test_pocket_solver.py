@@ -0,0 +1,68 @@
+# rubiks_solver/tests/test_pocket_solver.py
+
+import sys
+import os
+import random
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.pocket import PocketState, pocket_apply_moves
+from cube.state import CubeState
+from cube.validation import InvalidStateError
+from solver.coordinates import MOVES
+from solver.pocket_solver import PocketSolver, get_table, load_table, save_table, N_STATES
+
+# States at each optimal distance in the half-turn metric (God's number 11)
+DISTRIBUTION = [1, 9, 54, 321, 1847, 9992, 50136, 227536, 870072, 1887748, 623800, 2644]
+
+
+@pytest.fixture(scope='module')
+def solver():
+    return PocketSolver()
+
+
+def test_distance_distribution():
+    table = get_table()
+    assert len(table) == N_STATES
+    assert np.bincount(np.asarray(table) >> 4).tolist() == DISTRIBUTION
+
+
+def test_random_states_are_solved_optimally(solver):
+    rng = random.Random(3)
+    for _ in range(50):
+        scramble = [rng.choice(MOVES) for _ in range(rng.randrange(25))]
+        state = pocket_apply_moves(PocketState.solved(), scramble)
+        solution = solver.solve(state)
+        assert len(solution) == solver.distance(state) <= min(len(scramble), 11)
+        assert pocket_apply_moves(state, solution).is_solved()
+
+
+def test_corners_of_a_cube_state(solver):
+    state = apply_moves(CubeState.solved(), ['R', 'U', "R'", "U'"])
+    solution = solver.solve(state)
+    assert len(solution) == 4
+    assert pocket_apply_moves(PocketState.from_cube_state(state), solution).is_solved()
+
+
+def test_unsolvable_states_are_rejected(solver):
+    stickers = list(PocketState.solved().stickers)
+    stickers[0], stickers[1] = stickers[1], stickers[0]
+    stickers[3], stickers[4] = stickers[4], stickers[3]
+    with pytest.raises(InvalidStateError):
+        solver.solve(PocketState(bytes(stickers)))
+
+
+def test_table_file_round_trip(tmp_path):
+    table = np.asarray(get_table())
+    path = str(tmp_path / 'pocket.bin')
+    save_table(table, path)
+    assert np.array_equal(load_table(path), table)
+    assert not os.path.exists(path + '.tmp')
+    with open(path, 'r+b') as f:
+        f.write(b'XXXX')
+    with pytest.raises(ValueError):
+        load_table(path)
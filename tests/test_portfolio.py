@@ -0,0 +1,37 @@
+# rubiks_solver/tests/test_portfolio.py
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from solver.portfolio import PortfolioSolver, length_bucket
+
+
+def _wrong(state):
+    return None
+
+
+def _inverse(state):
+    return ["U'", "R'"]
+
+
+def test_wins_are_recorded_only_under_scramble_buckets():
+    solver = PortfolioSolver({'wrong': _wrong, 'inverse': _inverse}, timeout=30.0)
+    state = apply_moves(CubeState.solved(), ['R', 'U'])
+    assert solver.schedule(None) == ['wrong', 'inverse']
+
+    assert solver.solve(state) == ["U'", "R'"]
+    assert solver.wins == {}
+
+    assert solver.solve(state, scramble_length=2) == ["U'", "R'"]
+    assert solver.last_result.strategy == 'inverse'
+    assert solver.wins == {length_bucket(2): {'inverse': 1}}
+    assert solver.schedule(length_bucket(2)) == ['inverse', 'wrong']
+    assert solver.schedule(None) == ['wrong', 'inverse']
+
+
+def test_length_buckets():
+    assert [length_bucket(n) for n in (0, 5, 6, 20, 21)] == ['0-5', '0-5', '6-10', '16-20', '21+']
@@ -0,0 +1,64 @@
+# rubiks_solver/tests/test_scramble.py
+
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import permutation_parity
+from cube.moves import apply_moves
+from cube.state import CubeState
+from cube.validation import validate_state
+from utils.scramble import (Scrambler, random_states, invert_moves, simplify_moves, history_solution,
+                            _parities, _unrank_permutations)
+
+
+def test_random_cubies_have_matching_parities():
+    scrambler = Scrambler(seed=1)
+    for _ in range(200):
+        cube = scrambler.random_cubie()
+        assert cube.corner_parity() == cube.edge_parity()
+        assert sum(cube.co) % 3 == 0 and sum(cube.eo) % 2 == 0
+
+
+def test_parity_fix_keeps_both_edge_parities_reachable():
+    # Without the swap half the edge permutations could never be drawn
+    parities = {Scrambler(seed=seed).random_cubie().edge_parity() for seed in range(40)}
+    assert parities == {0, 1}
+
+
+def test_scramble_reaches_the_state():
+    scrambler = Scrambler(seed=7)
+    state, moves = scrambler.scramble()
+    assert apply_moves(CubeState.solved(), moves) == state
+    assert len(moves) <= scrambler.solver.max_length
+
+
+def test_bulk_states_are_valid_and_reproducible():
+    states = random_states(500, seed=11, chunk_size=128)
+    assert states.shape == (500, 54) and states.dtype == np.uint8
+    assert np.array_equal(states, random_states(500, seed=11, chunk_size=128))
+    assert all(validate_state(list(row)).valid for row in states)
+    assert len({row.tobytes() for row in states}) == 500
+
+
+def test_vectorized_permutation_helpers():
+    perms = _unrank_permutations(np.arange(24), 4)
+    assert len({tuple(p) for p in perms}) == 24
+    assert list(perms[0]) == [0, 1, 2, 3] and list(perms[-1]) == [3, 2, 1, 0]
+    assert list(_parities(perms)) == [permutation_parity(list(p)) for p in perms]
+
+
+def test_move_simplification():
+    assert invert_moves(['R', "U'", 'F2']) == ['F2', 'U', "R'"]
+    assert simplify_moves(['R', "R'"]) == []
+    assert simplify_moves(['R', 'R']) == ['R2']
+    assert simplify_moves(['R', 'R'], half_turns=False) == ['R', 'R']
+    assert simplify_moves(['R', 'L', "R'"]) == ['L']
+    assert simplify_moves(['M2', 'M2', 'R']) == ['M2', 'M2', 'R']
+    history = ['R', 'U', 'U', "U'", 'F']
+    assert history_solution(history) == ["F'", "U'", "R'"]
+    state = apply_moves(CubeState.solved(), history)
+    assert apply_moves(state, history_solution(history, half_turns=False)).is_solved()
@@ -0,0 +1,42 @@
+# rubiks_solver/tests/test_sequences.py
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.sequences import MoveTrie, apply_many
+from cube.state import CubeState
+from solver.simple_solver import SimpleCubeSolver
+from utils.patterns import PATTERNS, SIMPLE_PATTERNS
+
+ALGORITHMS = [info["algorithm"] for info in list(PATTERNS.values()) + list(SIMPLE_PATTERNS.values())]
+
+
+def test_apply_many_matches_apply_moves_for_every_pattern():
+    solved = CubeState.solved()
+    states = SimpleCubeSolver().apply_many(solved, ALGORITHMS)
+    assert states == [apply_moves(solved, moves) for moves in ALGORITHMS]
+
+
+def test_intermediate_states():
+    start = apply_moves(CubeState.solved(), ['R', 'U'])
+    for moves, states in zip(ALGORITHMS, apply_many(ALGORITHMS, start, intermediate=True)):
+        assert states == [apply_moves(start, moves[:i + 1]) for i in range(len(moves))]
+
+
+def test_shared_prefixes_are_stored_once():
+    trie = MoveTrie([['R', 'U', "R'"], ['R', 'U', 'F'], ['R'], []])
+    assert len(trie) == 4
+    assert trie.node_count == 4
+    assert trie.depths[trie.ends[0]] == 3 and trie.ends[3] == 0
+
+
+def test_unknown_moves_are_rejected():
+    with pytest.raises(ValueError):
+        MoveTrie([['R', 'X']])
+    with pytest.raises(ValueError):
+        SimpleCubeSolver().apply_many(CubeState.solved(), [['R'], ['Q2']])
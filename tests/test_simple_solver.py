@@ -0,0 +1,46 @@
+# rubiks_solver/tests/test_simple_solver.py
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from solver.simple_solver import SimpleCubeSolver
+
+
+@pytest.mark.parametrize('history', [
+    ['R', 'U'],
+    ['M2', 'E2', 'S2', 'R'],                                # checkerboard, then a move
+    ['M2', 'U', 'M2', 'U2', 'M2', 'U', 'M2', 'U'],          # H permutation, then a move
+])
+def test_history_solutions_solve_the_state(history):
+    solver = SimpleCubeSolver(max_depth=5)
+    state = apply_moves(CubeState.solved(), history)
+    solutions = list(solver.solve_from_history(state, history))
+    assert solutions
+    assert all(apply_moves(state, moves).is_solved() for moves in solutions)
+    assert [len(moves) for moves in solutions] == sorted((len(m) for m in solutions), reverse=True)
+
+
+def test_wrong_history_falls_back_to_search():
+    solver = SimpleCubeSolver(max_depth=5)
+    state = apply_moves(CubeState.solved(), ['R', 'U'])
+    assert list(solver.solve_from_history(state, ['F'])) == [["U'", "R'"]]
+
+
+def test_unknown_history_move_raises_at_once():
+    solver = SimpleCubeSolver()
+    with pytest.raises(ValueError):
+        solver.solve_from_history(CubeState.solved(), ['R', 'X'])
+
+
+def test_apply_moves_rejects_unknown_moves():
+    solver = SimpleCubeSolver()
+    with pytest.raises(ValueError):
+        solver.apply_moves(CubeState.solved(), ['R', 'X'])
+    assert solver.apply_moves(CubeState.solved(), ['M2', 'E2', 'S2']) == \
+        apply_moves(CubeState.solved(), ['M2', 'E2', 'S2'])
@@ -0,0 +1,80 @@
+# rubiks_solver/tests/test_solutions.py
+
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import ALL_MOVES, VALID_MOVES, apply_moves
+from cube.state import CubeState
+from cube.validation import InvalidStateError
+from solver.simple_solver import SimpleCubeSolver
+from solver.solutions import iter_solutions, best_solutions, fingertrick_cost
+from solver.transposition import POLICIES, TranspositionTable
+
+
+def _scrambles(count, length, moves, seed):
+    rng = random.Random(seed)
+    return [[rng.choice(moves) for _ in range(length)] for _ in range(count)]
+
+
+def _check(state, solutions):
+    assert len({tuple(s) for s in solutions}) == len(solutions)
+    for solution in solutions:
+        assert apply_moves(state, solution).is_solved()
+        assert not any(apply_moves(state, solution[:i]).is_solved() for i in range(len(solution)))
+
+
+@pytest.mark.parametrize('moves', [ALL_MOVES, VALID_MOVES])
+def test_table_does_not_change_the_solutions(moves):
+    for scramble in _scrambles(4, 5, moves, seed=len(moves)):
+        state = apply_moves(CubeState.solved(), scramble)
+        plain = list(iter_solutions(state, 8, moves=moves))
+        _check(state, plain)
+        assert len({len(s) for s in plain}) == 1 and len(plain[0]) <= len(scramble)
+        for policy in POLICIES:
+            # A tiny table, so entries are replaced all the time
+            table = TranspositionTable(1 << 10, policy)
+            cached = list(iter_solutions(state, 8, moves=moves, table=table))
+            assert sorted(cached) == sorted(plain)
+
+
+def test_quarter_turn_optimum_matches_breadth_first_search():
+    solver = SimpleCubeSolver(max_depth=6)
+    for scramble in _scrambles(5, 5, VALID_MOVES, seed=9):
+        state = apply_moves(CubeState.solved(), scramble)
+        first = next(iter_solutions(state, 8, moves=VALID_MOVES))
+        assert set(first) <= set(VALID_MOVES)
+        assert len(first) == len(solver.solve_bfs(state))
+        assert [len(s) for s in solver.iter_solutions(state)] == \
+            [len(first)] * len(list(iter_solutions(state, 8, moves=VALID_MOVES)))
+
+
+def test_all_short_solutions_come_shortest_first():
+    state = apply_moves(CubeState.solved(), ['R', 'U', 'F2', 'D'])
+    optimal = list(iter_solutions(state, 6))
+    solutions = list(iter_solutions(state, 6, optimal=False))
+    _check(state, solutions)
+    lengths = [len(s) for s in solutions]
+    assert lengths == sorted(lengths) and solutions[:len(optimal)] == optimal
+
+
+def test_ranking():
+    state = apply_moves(CubeState.solved(), ['R', 'U', "R'", "U'", 'F2'])
+    plain = list(iter_solutions(state, 8))
+    ranked = list(iter_solutions(state, 8, ranked=True))
+    assert sorted(ranked) == sorted(plain)
+    assert [fingertrick_cost(s) for s in ranked] == sorted(fingertrick_cost(s) for s in plain)
+    best = best_solutions(state, k=3, max_length=8)
+    assert best == ranked[:3]
+
+
+def test_solved_and_invalid_states():
+    assert list(iter_solutions(CubeState.solved())) == [[]]
+    stickers = list(CubeState.solved().stickers)
+    stickers[5], stickers[10] = stickers[10], stickers[5]
+    with pytest.raises(InvalidStateError):
+        next(iter_solutions(stickers))
@@ -0,0 +1,65 @@
+# rubiks_solver/tests/test_stage_solver.py
+
+import sys
+import os
+import pickle
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from cube.validation import InvalidStateError
+from solver.stage_solver import (StageSolver, CROSS_EDGES, SLOT_CORNERS, SLOT_EDGES, case_classes,
+                                 oll_case, pll_case, _build_oll, _build_pll)
+from utils.scramble import Scrambler
+
+
+@pytest.fixture(scope='module')
+def solver():
+    return StageSolver()
+
+
+def test_last_layer_tables_are_complete(solver):
+    tables = solver.tables
+    # 27 corner twists x 8 edge flips, 4! x 4! / 2 even permutations
+    assert len(tables.oll) == 216 and len(tables.pll) == 288
+    # The 57 OLL and 21 PLL cases, plus the solved one
+    assert case_classes(tables.oll, oll_case, _build_oll) == 58
+    assert case_classes(tables.pll, pll_case, _build_pll, final_turn=True) == 22
+
+
+def test_random_states_are_solved_stage_by_stage(solver):
+    scrambler = Scrambler(seed=21)
+    for _ in range(20):
+        cube = scrambler.random_cubie()
+        state = cube.to_state()
+        solution = solver.solve(state)
+        assert apply_moves(state, solution).is_solved()
+
+        stages = solver.last_stages
+        assert list(stages) == ['cross', 'f2l', 'oll', 'pll']
+        cube = cube.apply_moves(stages['cross'])
+        assert all(cube.ep[e] == e and cube.eo[e] == 0 for e in CROSS_EDGES)
+        cube = cube.apply_moves(stages['f2l'])
+        assert all(cube.cp[c] == c and cube.co[c] == 0 for c in SLOT_CORNERS)
+        assert all(cube.ep[e] == e and cube.eo[e] == 0 for e in SLOT_EDGES)
+        cube = cube.apply_moves(stages['oll'])
+        assert oll_case(cube) == (0,) * 8
+
+
+def test_solved_and_invalid_states(solver):
+    assert solver.solve(CubeState.solved()) == []
+    stickers = list(CubeState.solved().stickers)
+    stickers[5], stickers[10] = stickers[10], stickers[5]       # flip the UR edge
+    with pytest.raises(InvalidStateError):
+        solver.solve(stickers)
+
+
+def test_pickled_solver_solves(solver):
+    solver.solve(apply_moves(CubeState.solved(), ['R', 'U']))
+    copy = pickle.loads(pickle.dumps(solver))
+    assert copy.last_stages == {}
+    state = apply_moves(CubeState.solved(), ['F', 'R', "D'"])
+    assert apply_moves(state, copy.solve(state)).is_solved()
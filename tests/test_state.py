@@ -0,0 +1,56 @@
+# rubiks_solver/tests/test_state.py
+
+import sys
+import os
+import pickle
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import MOVE_FUNCS, MOVE_PERMS, apply_moves
+from cube.state import CubeState, as_state, standard_colors
+
+
+def test_value_semantics():
+    state = apply_moves(CubeState.solved(), ['R', 'U'])
+    same = CubeState(bytes(state.stickers))
+    assert state == same and hash(state) == hash(same) and state is not same
+    assert len({state, same, CubeState.solved()}) == 2
+    assert pickle.loads(pickle.dumps(state)) == state
+    with pytest.raises(AttributeError):
+        state.extra = 1
+    with pytest.raises(ValueError):
+        CubeState(bytes(53))
+
+
+def test_conversions():
+    state = apply_moves(CubeState.solved(), ['F', "D'"])
+    faces = state.to_faces()
+    assert as_state(faces) == state == as_state(list(state.stickers)) == CubeState.from_faces(state.to_letters())
+    assert state[2] == state.face(2) == tuple(faces[2]) and len(state) == 6
+    assert list(state) == [tuple(face) for face in faces]
+
+
+def test_moves_are_permutations():
+    solved = CubeState.solved()
+    for move, function in MOVE_FUNCS.items():
+        assert function(solved) == solved.permute(MOVE_PERMS[move]) == apply_moves(solved, [move])
+        assert apply_moves(solved, [move] * 4).is_solved()
+
+
+def test_is_solved_follows_the_centres():
+    assert CubeState.solved().is_solved()
+    assert not apply_moves(CubeState.solved(), ['R']).is_solved()
+    rotated = apply_moves(CubeState.solved(), ['M', "R'", 'L'])      # a whole-cube rotation
+    assert rotated.is_solved() and rotated != CubeState.solved()
+
+
+def test_standard_colors():
+    state = apply_moves(CubeState.solved(), ['R', 'U'])
+    recoloured = CubeState(state.stickers.translate(bytes.maketrans(bytes(range(6)), bytes([5, 3, 1, 0, 2, 4]))))
+    relabelled, table = standard_colors(recoloured)
+    assert relabelled == state
+    assert recoloured.stickers.translate(table) == state.stickers
+    with pytest.raises(ValueError):
+        standard_colors([0] * 54)
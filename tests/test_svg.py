@@ -0,0 +1,97 @@
+# rubiks_solver/tests/test_svg.py
+
+import sys
+import os
+import struct
+import subprocess
+import zlib
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import apply_moves
+from cube.state import CubeState
+from utils.svg import SVGRenderer, COLORS, NET_POSITIONS, render_svg, render_png
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE = apply_moves(CubeState.solved(), ['R', 'U', "F'"])
+
+
+def _png_chunks(data):
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    chunks, offset = {}, 8
+    while offset < len(data):
+        length, kind = struct.unpack('>I4s', data[offset:offset + 8])
+        body = data[offset + 8:offset + 8 + length]
+        assert struct.unpack('>I', data[offset + 8 + length:offset + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b'') + body
+        offset += 12 + length
+    return chunks
+
+
+def test_svg_has_one_rect_per_sticker():
+    renderer = SVGRenderer(sticker_size=20, labels=True)
+    root = ET.fromstring(renderer.render(STATE))
+    assert root.get('width') == str(renderer.width)
+    rects = root.findall('.//{http://www.w3.org/2000/svg}rect')
+    assert [rect.get('fill') for rect in rects] == [COLORS[c] for c in STATE.stickers]
+    labels = root.findall('.//{http://www.w3.org/2000/svg}text')
+    assert [label.text for label in labels] == list('URFDLB')
+
+
+def test_png_pixels_show_the_stickers():
+    size = 10
+    renderer = SVGRenderer(sticker_size=size)
+    chunks = _png_chunks(renderer.render_png(STATE))
+    width, height, depth, color_type = struct.unpack('>IIBB', chunks[b'IHDR'][:10])
+    assert (width, height, depth, color_type) == (12 * size + 1, 9 * size + 1, 8, 3)
+    rows = zlib.decompress(chunks[b'IDAT'])
+    assert len(rows) == height * (width + 1)
+
+    def pixel(x, y):
+        return rows[y * (width + 1) + 1 + x]
+
+    for face, (column, row) in enumerate(NET_POSITIONS):
+        for index in range(9):
+            r, c = divmod(index, 3)
+            x, y = (column + c) * size + size // 2, (row + r) * size + size // 2
+            assert pixel(x, y) == STATE.stickers[face * 9 + index]
+    assert pixel(0, 0) == 7 and pixel(3 * size, 0) == 6       # background, grid
+
+
+def test_cache():
+    renderer = SVGRenderer(cache_size=2)
+    first = renderer.render(STATE)
+    assert renderer.render(list(STATE.stickers)) is first
+    renderer.render_png(STATE)
+    renderer.render(CubeState.solved())
+    assert renderer.cache_info() == {'hits': 1, 'misses': 3, 'size': 2, 'max_size': 2}
+    assert renderer.render(STATE) is not first          # evicted, least recently used
+    renderer.clear_cache()
+    assert renderer.cache_info()['size'] == 0
+
+    uncached = SVGRenderer(cache_size=0)
+    uncached.render(STATE)
+    assert uncached.cache_info()['size'] == 0
+
+
+def test_render_many_and_helpers(tmp_path):
+    states = [apply_moves(CubeState.solved(), [move]) for move in ['R', 'U', 'F', 'D']] * 3
+    renderer = SVGRenderer()
+    assert renderer.render_many(states, workers=4) == [renderer.render(s) for s in states]
+    assert renderer.render_many(states, png=True) == [renderer.render_png(s) for s in states]
+    assert render_svg(STATE) == SVGRenderer().render(STATE)
+    assert render_png(STATE) == SVGRenderer().render_png(STATE)
+    assert SVGRenderer.etag(STATE) == SVGRenderer.etag(list(STATE.stickers)) != SVGRenderer.etag(CubeState.solved())
+
+    renderer.save(STATE, str(tmp_path / 'net.svg'))
+    renderer.save(STATE, str(tmp_path / 'net.PNG'))
+    assert (tmp_path / 'net.svg').read_text(encoding='utf-8') == renderer.render(STATE)
+    assert (tmp_path / 'net.PNG').read_bytes() == renderer.render_png(STATE)
+
+
+def test_no_matplotlib_or_numpy():
+    code = ("import sys; sys.path.insert(0, '.'); import utils.svg; "
+            "print('matplotlib' in sys.modules or 'numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,79 @@
+# rubiks_solver/tests/test_transposition.py
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.moves import ALL_MOVES, VALID_MOVES, apply_moves
+from cube.state import CubeState
+from solver.solutions import iter_solutions
+from solver.transposition import ENTRY_BYTES, POLICIES, TranspositionTable, state_key
+
+# Four slots: keys 4 apart share a slot ('depth', 'always') or a bucket ('two_tier')
+SMALL = 4 * ENTRY_BYTES
+
+
+def test_capacity_and_budget():
+    table = TranspositionTable(SMALL)
+    assert table.capacity == 4 and table.memory_bytes == SMALL
+    with pytest.raises(ValueError):
+        TranspositionTable(2 * ENTRY_BYTES - 1)
+    with pytest.raises(ValueError):
+        TranspositionTable(SMALL, policy='lru')
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_probe_returns_what_was_stored(policy):
+    table = TranspositionTable(SMALL, policy)
+    assert table.probe(5) is None
+    table.store(5, 7, 3)
+    assert table.probe(5) == (7, 3)
+    table.store(5, 9, 300)         # same key: updated in place, clamped to a byte
+    assert table.probe(5) == (9, 255)
+    assert table.hits == 2 and table.probes == 3 and len(table) == 1
+
+
+def test_depth_policy_keeps_the_deeper_entry():
+    table = TranspositionTable(SMALL, 'depth')
+    table.store(1, 5, 6)
+    table.store(5, 5, 2)
+    assert table.probe(1) == (5, 6) and table.probe(5) is None
+    table.store(9, 5, 8)
+    assert table.probe(1) is None and table.probe(9) == (5, 8)
+    assert table.replacements == 1
+
+
+def test_always_policy_keeps_the_newest_entry():
+    table = TranspositionTable(SMALL, 'always')
+    table.store(1, 5, 6)
+    table.store(5, 5, 2)
+    assert table.probe(1) is None and table.probe(5) == (5, 2)
+
+
+def test_two_tier_policy_keeps_deep_and_recent_entries():
+    table = TranspositionTable(SMALL, 'two_tier')
+    table.store(1, 5, 6)
+    table.store(3, 5, 2)           # shallower: goes to the always-replace slot
+    table.store(5, 5, 1)           # replaces the recent entry only
+    assert table.probe(1) == (5, 6) and table.probe(3) is None and table.probe(5) == (5, 1)
+    table.store(7, 5, 9)           # deeper: takes the depth slot, demoting the old one
+    assert table.probe(7) == (5, 9) and table.probe(1) == (5, 6) and table.probe(5) is None
+
+
+def test_state_keys_are_never_empty():
+    state = CubeState.solved()
+    assert state_key(state, 0) != 0
+    assert state_key(state, 1) != state_key(state, 2)
+
+
+def test_table_is_tied_to_one_move_set():
+    state = apply_moves(CubeState.solved(), ['R', 'U', 'F'])
+    table = TranspositionTable(1 << 16)
+    assert list(iter_solutions(state, 8, moves=VALID_MOVES, table=table)) == [["F'", "U'", "R'"]]
+    with pytest.raises(ValueError):
+        list(iter_solutions(state, 8, moves=ALL_MOVES, table=table))
+    table.clear()
+    assert list(iter_solutions(state, 8, moves=ALL_MOVES, table=table)) == [["F'", "U'", "R'"]]
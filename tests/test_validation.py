@@ -0,0 +1,93 @@
+# rubiks_solver/tests/test_validation.py
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import CORNER_FACELETS, EDGE_FACELETS
+from cube.moves import apply_moves
+from cube.state import CubeState
+from cube import validation
+from cube.validation import validate_state, is_valid_state, InvalidStateError
+from solver.simple_solver import SimpleCubeSolver
+
+SCRAMBLED = apply_moves(CubeState.solved(), ['R', 'U', "F'", 'L2', 'D', 'B'])
+
+
+def _stickers():
+    return list(SCRAMBLED.stickers)
+
+
+def _twisted():
+    stickers = _stickers()
+    a, b, c = CORNER_FACELETS[0]
+    stickers[a], stickers[b], stickers[c] = stickers[b], stickers[c], stickers[a]
+    return stickers
+
+
+def _flipped():
+    stickers = _stickers()
+    a, b = EDGE_FACELETS[0]
+    stickers[a], stickers[b] = stickers[b], stickers[a]
+    return stickers
+
+
+def _swapped_edges():
+    stickers = _stickers()
+    for a, b in zip(EDGE_FACELETS[0], EDGE_FACELETS[1]):
+        stickers[a], stickers[b] = stickers[b], stickers[a]
+    return stickers
+
+
+def _solved_with(index, color):
+    stickers = list(CubeState.solved().stickers)
+    stickers[index] = color
+    return stickers
+
+
+def _swapped_stickers(a, b):
+    stickers = _stickers()
+    stickers[a], stickers[b] = stickers[b], stickers[a]
+    return stickers
+
+
+def _mirrored_centres():
+    stickers = list(CubeState.solved().stickers)
+    for i in range(9):
+        stickers[i], stickers[27 + i] = stickers[27 + i], stickers[i]     # swap U and D
+    return stickers
+
+
+@pytest.mark.parametrize('state', [SCRAMBLED, CubeState.solved(), list(SCRAMBLED.stickers),
+                                   [list(SCRAMBLED.stickers[i:i + 9]) for i in range(0, 54, 9)]])
+def test_valid_states(state):
+    result = validate_state(state)
+    assert result.valid and result and result.reason is None
+    assert is_valid_state(state)
+
+
+@pytest.mark.parametrize('stickers, reason', [
+    (list(range(53)), validation.SHAPE),
+    ([[0] * 9] * 5, validation.SHAPE),
+    (_solved_with(4, 1), validation.CENTRES),
+    (_mirrored_centres(), validation.CENTRES),
+    (_solved_with(0, 1), validation.STICKER_COUNT),
+    (_solved_with(0, 9), validation.STICKER_COUNT),
+    (_swapped_stickers(CORNER_FACELETS[0][0], EDGE_FACELETS[0][1]), validation.PIECE),
+    (_twisted(), validation.TWIST),
+    (_flipped(), validation.FLIP),
+    (_swapped_edges(), validation.PARITY),
+])
+def test_failure_reasons(stickers, reason):
+    result = validate_state(stickers)
+    assert not result and result.reason == reason and result.message
+
+
+def test_solvers_reject_invalid_states():
+    with pytest.raises(InvalidStateError) as error:
+        SimpleCubeSolver().solve_bfs(_flipped())
+    assert error.value.result.reason == validation.FLIP
+    assert isinstance(error.value, ValueError)
@@ -0,0 +1,70 @@
+# rubiks_solver/tests/test_visual.py
+
+import sys
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import CORNER_FACELETS, EDGE_FACELETS
+from cube.moves import MOVE_PERMS, apply_moves
+from cube.state import CubeState
+from utils.visual import CubeRenderer3D, COLOR_RGBA, STICKER_VERTICES
+
+CENTRES = STICKER_VERTICES.mean(axis=1)
+
+# Axis and side of each face's outer layer in the [0, 3]^3 cube
+LAYERS = {'U': (2, 3), 'D': (2, 0), 'R': (0, 3), 'L': (0, 0), 'F': (1, 0), 'B': (1, 3)}
+
+
+def test_stickers_are_unit_squares_on_their_face():
+    edges = np.roll(STICKER_VERTICES, -1, axis=1) - STICKER_VERTICES
+    assert np.allclose(np.linalg.norm(edges, axis=2), 1)
+    for face, letter in enumerate('URFDLB'):
+        axis, side = LAYERS[letter]
+        assert np.allclose(STICKER_VERTICES[face * 9:face * 9 + 9, :, axis], side)
+
+
+@pytest.mark.parametrize('face', 'URFDLB')
+def test_turns_move_the_stickers_of_their_layer(face):
+    # Ties the 3D layout to the move definitions: a face turn moves exactly
+    # the stickers within one unit of that face
+    axis, side = LAYERS[face]
+    moved = {i for i, p in enumerate(MOVE_PERMS[face]) if p != i}
+    centres = {f * 9 + 4 for f in range(6)}
+    in_layer = {i for i in range(54) if abs(CENTRES[i, axis] - side) < 1} - centres
+    assert moved == in_layer
+
+
+def test_pieces_meet_at_a_point():
+    for facelets in CORNER_FACELETS:
+        shared = set(map(tuple, STICKER_VERTICES[facelets[0]]))
+        for f in facelets[1:]:
+            shared &= set(map(tuple, STICKER_VERTICES[f]))
+        assert len(shared) == 1
+    for a, b in EDGE_FACELETS:
+        assert len(set(map(tuple, STICKER_VERTICES[a])) & set(map(tuple, STICKER_VERTICES[b]))) == 2
+
+
+def test_renderer_recolours_one_collection():
+    fig = Figure()
+    renderer = CubeRenderer3D(fig.add_subplot(projection='3d'), title='test')
+    collection = renderer.collection
+    assert len(collection.get_facecolor()) == 54
+
+    # Drawn colours come back depth-sorted, so record what update() sets
+    colours = []
+    set_facecolor = collection.set_facecolor
+    collection.set_facecolor = lambda c: (colours.append(np.array(c)), set_facecolor(c))
+    state = apply_moves(CubeState.solved(), ['R', 'U'])
+    renderer.update(state, 'R U')
+    assert renderer.collection is collection
+    assert np.allclose(colours[-1], COLOR_RGBA[list(state.stickers)])
+    renderer.set_view(azim=30)
+    assert renderer.ax.azim == 30 and renderer.ax.get_title() == 'R U'
+    fig.canvas.draw()
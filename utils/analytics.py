@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# rubiks_solver/utils/analytics.py
+
+"""
+Algorithm analytics
+Compiles a move sequence into its sticker permutation once, then reads
+everything else off its cycle decomposition: the order (repetitions
+needed to return to the start), corner and edge cycles with their net
+twist/flip, pieces that only change orientation, and the set of affected
+pieces. Results are cached per algorithm, so analysing thousands of
+algorithms costs one compilation each.
+"""
+
+from functools import lru_cache
+from math import lcm
+from types import MappingProxyType
+import sys
+import os
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import CORNERS, EDGES, CORNER_FACELETS, EDGE_FACELETS
+from cube.moves import MOVE_PERMS
+from utils.patterns import PATTERNS
+from utils.scramble import invert_moves
+
+FACES = 'URFDLB'
+IDENTITY = tuple(range(54))
+
+# Sticker index -> (position, index of the sticker within the piece)
+_CORNER_OF = {f: (p, k) for p, facelets in enumerate(CORNER_FACELETS) for k, f in enumerate(facelets)}
+_EDGE_OF = {f: (p, k) for p, facelets in enumerate(EDGE_FACELETS) for k, f in enumerate(facelets)}
+
+
+def compile_moves(moves):
+    """
+    Sticker permutation of a move sequence: after the moves, sticker i
+    shows what sticker perm[i] showed before (the MOVE_PERMS convention)
+    """
+    perm = IDENTITY
+    for move in moves:
+        if move not in MOVE_PERMS:
+            raise ValueError(f"Unknown move {move!r}")
+        step = MOVE_PERMS[move]
+        perm = tuple(perm[i] for i in step)
+    return perm
+
+
+def compose(first, second):
+    """Permutation of applying first, then second"""
+    return tuple(first[i] for i in second)
+
+
+def inverse_permutation(perm):
+    inverse = [0] * len(perm)
+    for i, p in enumerate(perm):
+        inverse[p] = i
+    return tuple(inverse)
+
+
+def permutation_cycles(perm):
+    """Non-trivial cycles (i -> perm[i] -> ...) of a permutation"""
+    seen = [False] * len(perm)
+    cycles = []
+    for start in range(len(perm)):
+        if seen[start] or perm[start] == start:
+            seen[start] = True
+            continue
+        cycle = []
+        i = start
+        while not seen[i]:
+            seen[i] = True
+            cycle.append(i)
+            i = perm[i]
+        cycles.append(tuple(cycle))
+    return cycles
+
+
+def _piece_cycles(perm, facelets, lookup, names, orientations):
+    """
+    Piece-level cycles of a sticker permutation
+    Returns (cycles, reoriented): a tuple of (position names, net
+    orientation change) cycles, and a read-only {name: change} mapping of
+    the pieces that stay in place
+    """
+    source = []
+    twist = []
+    for p, stickers in enumerate(facelets):
+        q, k = lookup[perm[stickers[0]]]
+        source.append(q)
+        twist.append(k)
+
+    cycles = []
+    reoriented = {}
+    for cycle in permutation_cycles(source):
+        total = sum(twist[p] for p in cycle) % orientations
+        cycles.append((tuple(names[p] for p in cycle), total))
+    for p, q in enumerate(source):
+        if q == p and twist[p]:
+            reoriented[names[p]] = twist[p]
+    return tuple(cycles), MappingProxyType(reoriented)
+
+
+class AlgorithmAnalysis:
+    """
+    Structure of one algorithm
+
+    order: repetitions that bring every sticker back
+    corner_cycles / edge_cycles: ((position names...), net twist/flip) per cycle
+    twisted_corners / flipped_edges: pieces that stay in place but turn
+    centre_cycles: centre cycles as face letters (slice moves only)
+    affected: {'corners', 'edges', 'centres'} -> sorted position names that change
+
+    Analyses are cached and shared by every caller of analyze(), so all
+    fields are immutable (tuples and read-only mappings).
+    """
+
+    def __init__(self, moves):
+        self.moves = tuple(moves)
+        self.permutation = compile_moves(self.moves)
+        cycles = permutation_cycles(self.permutation)
+        self.order = lcm(*(len(cycle) for cycle in cycles)) if cycles else 1
+
+        self.corner_cycles, self.twisted_corners = _piece_cycles(
+            self.permutation, CORNER_FACELETS, _CORNER_OF, CORNERS, 3)
+        self.edge_cycles, self.flipped_edges = _piece_cycles(
+            self.permutation, EDGE_FACELETS, _EDGE_OF, EDGES, 2)
+        centres = [self.permutation[f * 9 + 4] // 9 for f in range(6)]
+        self.centre_cycles = tuple(tuple(FACES[f] for f in cycle) for cycle in permutation_cycles(centres))
+
+        self.affected = MappingProxyType({
+            'corners': tuple(sorted({name for cycle, _ in self.corner_cycles for name in cycle}
+                                    | set(self.twisted_corners), key=CORNERS.index)),
+            'edges': tuple(sorted({name for cycle, _ in self.edge_cycles for name in cycle}
+                                  | set(self.flipped_edges), key=EDGES.index)),
+            'centres': tuple(sorted({face for cycle in self.centre_cycles for face in cycle},
+                                    key=FACES.index)),
+        })
+
+    @property
+    def inverse(self):
+        """Analysis of the inverse algorithm"""
+        return analyze(invert_moves(self.moves))
+
+    @property
+    def is_identity(self):
+        return self.permutation == IDENTITY
+
+    def commutes_with(self, other):
+        """Whether applying the two algorithms in either order gives the same result"""
+        other = other if isinstance(other, AlgorithmAnalysis) else analyze(other)
+        return compose(self.permutation, other.permutation) == compose(other.permutation, self.permutation)
+
+    def cycle_notation(self):
+        parts = []
+        for kind, cycles in (('corners', self.corner_cycles), ('edges', self.edge_cycles)):
+            for names, turn in cycles:
+                suffix = f"{'+' if turn else ''}{turn or ''}"
+                parts.append(f"({' '.join(names)}){suffix}")
+        parts += [f"{name}+{turn}" for name, turn in self.twisted_corners.items()]
+        parts += [f"{name}+{turn}" for name, turn in self.flipped_edges.items()]
+        return ' '.join(parts) or 'identity'
+
+    def __repr__(self):
+        return f"AlgorithmAnalysis({' '.join(self.moves)!r}, order={self.order})"
+
+
+@lru_cache(maxsize=65536)
+def _analyze(moves):
+    return AlgorithmAnalysis(moves)
+
+
+def analyze(moves):
+    """Analysis of a move sequence (list, tuple or space-separated string), cached"""
+    if isinstance(moves, str):
+        moves = moves.split()
+    return _analyze(tuple(moves))
+
+
+def commutes(first, second):
+    """Whether two algorithms commute"""
+    return analyze(first).commutes_with(analyze(second))
+
+
+def analyze_patterns(patterns=PATTERNS):
+    """Analysis of every pattern algorithm, by pattern name"""
+    return {name: analyze(info['algorithm']) for name, info in patterns.items()}
+
+
+def demo_analytics():
+    """Print the structure of every pattern algorithm"""
+    import random
+    import time
+    from cube.moves import ALL_MOVES
+
+    print("🔬 Algorithm analytics")
+    print("=" * 45)
+    for name, analysis in analyze_patterns().items():
+        print(f"\n• {name}: order {analysis.order}")
+        print(f"  cycles: {analysis.cycle_notation()}")
+        affected = analysis.affected
+        print(f"  affected: {len(affected['corners'])} corners, {len(affected['edges'])} edges"
+              f"{', centres ' + ''.join(affected['centres']) if affected['centres'] else ''}")
+
+    print(f"\n🔁 sune commutes with U2: {commutes(PATTERNS['sune']['algorithm'], ['U2'])}")
+    print(f"🔁 R commutes with L: {commutes('R', 'L')}")
+
+    rng = random.Random(0)
+    algorithms = [[rng.choice(ALL_MOVES) for _ in range(rng.randint(4, 20))] for _ in range(5000)]
+    start = time.monotonic()
+    orders = [analyze(moves).order for moves in algorithms]
+    print(f"\n⏱️  Analysed {len(algorithms)} random algorithms in {time.monotonic() - start:.2f}s "
+          f"(longest order {max(orders)})")
+
+
+if __name__ == "__main__":
+    demo_analytics()
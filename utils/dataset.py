@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# rubiks_solver/utils/dataset.py
+
+"""
+Binary scramble/solution dataset format
+
+File layout:
+    header   b'RCDS' | version u8 | state format u8 | 2 reserved bytes
+    chunk*   b'CHNK' | record count u32 | move blob size u32
+             records   (count x RECORD_DTYPE, fixed size)
+             move blob (varint move codes, one sequence per record)
+
+Each record holds a packed state (48 non-centre stickers x 3 bits = 18
+bytes), the depth, the solve time and the offset of its move sequence in
+the chunk's move blob. Chunks are written as they fill up, so a writer
+never holds more than one chunk, and a reader memory-maps the file and
+hands out NumPy views of each chunk without copying.
+"""
+
+import mmap
+import struct
+import sys
+import os
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.state import CubeState
+
+MAGIC = b'RCDS'
+CHUNK_MAGIC = b'CHNK'
+VERSION = 1
+STATE_FORMAT_3X3 = 1        # 3x3x3 stickers, centres dropped, 3 bits each
+
+FILE_HEADER = struct.Struct('<4sBB2x')
+CHUNK_HEADER = struct.Struct('<4sII')
+
+PACKED_STATE_SIZE = 18
+DEPTH_UNKNOWN = 255
+
+RECORD_DTYPE = np.dtype([
+    ('state', np.uint8, PACKED_STATE_SIZE),
+    ('depth', np.uint8),
+    ('solve_time', '<f4'),
+    ('moves_offset', '<u4'),
+])
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Move codes stored in the file; part of the format, never reorder
+MOVE_NAMES = ['U', 'U2', "U'", 'R', 'R2', "R'", 'F', 'F2', "F'",
+              'D', 'D2', "D'", 'L', 'L2', "L'", 'B', 'B2', "B'"]
+MOVE_CODES = {move: code for code, move in enumerate(MOVE_NAMES)}
+
+# Sticker indices kept in the packed form (centres never move)
+_NON_CENTRE = np.array([i for i in range(54) if i % 9 != 4])
+_CENTRES = np.arange(6, dtype=np.uint8)
+
+
+def pack_states(states):
+    """
+    Pack sticker states into 18 bytes each (centres are not stored)
+
+    Args:
+        states: Array-like of shape (n, 54) with colours 0-5 and the
+                standard centres (face i shows colour i)
+
+    Returns:
+        uint8 array of shape (n, 18)
+
+    Raises:
+        ValueError: on colours out of range, or on centres that are not
+                    0-5 in face order (recoloured states, or slice moves),
+                    which unpacking could not restore
+    """
+    states = np.asarray(states, dtype=np.uint8).reshape(-1, 54)
+    if states.size and states.max() > 5:
+        raise ValueError("Sticker colours must be in the range 0-5")
+    _check_centres(states)
+    stickers = states[:, _NON_CENTRE]
+    bits = (stickers[:, :, None] >> np.array([2, 1, 0], dtype=np.uint8)) & 1
+    return np.packbits(bits.reshape(len(states), -1), axis=1)
+
+
+def _check_centres(states):
+    """Raise ValueError unless every (n, 54) state has centres 0-5 in face order"""
+    bad = np.flatnonzero((states[:, 4::9] != _CENTRES).any(axis=1))
+    if bad.size:
+        raise ValueError(f"State {bad[0]} does not have the standard centres 0-5 "
+                         f"(got {states[bad[0], 4::9].tolist()}); packed states do not store centres")
+
+
+def unpack_states(packed):
+    """Inverse of pack_states: (n, 18) uint8 -> (n, 54) uint8"""
+    packed = np.asarray(packed, dtype=np.uint8).reshape(-1, PACKED_STATE_SIZE)
+    bits = np.unpackbits(packed, axis=1).reshape(len(packed), 48, 3)
+    states = np.empty((len(packed), 54), dtype=np.uint8)
+    states[:, _NON_CENTRE] = bits[:, :, 0] * 4 + bits[:, :, 1] * 2 + bits[:, :, 2]
+    states[:, 4::9] = _CENTRES
+    return states
+
+
+def encode_varint(value, out):
+    """Append the LEB128 varint encoding of value to the bytearray out"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varints(data, start, end):
+    """Decode all varints in data[start:end]"""
+    values = []
+    value = shift = 0
+    for byte in data[start:end]:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def _flatten_state(state):
+    """Accept a CubeState, a nested [U, R, F, D, L, B] state, a flat list or an array"""
+    if isinstance(state, CubeState):
+        return np.frombuffer(state.stickers, dtype=np.uint8)
+    if isinstance(state, np.ndarray):
+        return state.reshape(54)
+    if state and isinstance(state[0], (list, tuple)):
+        return [sticker for face in state for sticker in face]
+    return state
+
+
+class DatasetWriter:
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streaming dataset writer
+
+        Records are buffered until chunk_size of them are collected and
+        then written as one chunk. Use as a context manager or call close().
+        """
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._file = open(path, 'wb')
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, STATE_FORMAT_3X3))
+        self._reset_buffers()
+
+    def _reset_buffers(self):
+        self._states = []
+        self._depths = []
+        self._times = []
+        self._offsets = []
+        self._blob = bytearray()
+
+    def write(self, state, moves=(), depth=None, solve_time=None):
+        """
+        Append one record
+
+        Args:
+            state: CubeState (or nested/flat list or array, colours 0-5)
+            moves: Move sequence (scramble or solution)
+            depth: Search depth / distance, if known
+            solve_time: Seconds spent solving, if known
+        """
+        stickers = np.asarray(_flatten_state(state), dtype=np.uint8).reshape(1, 54)
+        _check_centres(stickers)    # reject it now rather than when the chunk is packed
+        self._states.append(stickers[0])
+        self._depths.append(DEPTH_UNKNOWN if depth is None else depth)
+        self._times.append(np.nan if solve_time is None else solve_time)
+        self._offsets.append(len(self._blob))
+        for move in moves:
+            encode_varint(MOVE_CODES[move], self._blob)
+        if len(self._states) >= self.chunk_size:
+            self.flush()
+
+    def write_many(self, states, moves_list=None, depths=None, solve_times=None):
+        """
+        Append many records at once; states is an (n, 54) array
+
+        Pending single records are flushed first, then whole chunks are
+        packed and written with vectorized NumPy operations.
+        """
+        states = np.asarray(states, dtype=np.uint8).reshape(-1, 54)
+        self.flush()
+        for start in range(0, len(states), self.chunk_size):
+            end = min(start + self.chunk_size, len(states))
+            blob = bytearray()
+            offsets = np.zeros(end - start, dtype=np.uint32)
+            if moves_list is not None:
+                for i in range(start, end):
+                    offsets[i - start] = len(blob)
+                    for move in moves_list[i]:
+                        encode_varint(MOVE_CODES[move], blob)
+            records = np.zeros(end - start, dtype=RECORD_DTYPE)
+            records['state'] = pack_states(states[start:end])
+            records['depth'] = DEPTH_UNKNOWN if depths is None else depths[start:end]
+            records['solve_time'] = np.nan if solve_times is None else solve_times[start:end]
+            records['moves_offset'] = offsets
+            self._write_chunk(records, blob)
+
+    def flush(self):
+        """Write buffered records as a chunk"""
+        if not self._states:
+            return
+        records = np.zeros(len(self._states), dtype=RECORD_DTYPE)
+        records['state'] = pack_states(np.array(self._states, dtype=np.uint8))
+        records['depth'] = self._depths
+        records['solve_time'] = self._times
+        records['moves_offset'] = self._offsets
+        self._write_chunk(records, self._blob)
+        self._reset_buffers()
+
+    def _write_chunk(self, records, blob):
+        self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, len(records), len(blob)))
+        self._file.write(records.tobytes())
+        self._file.write(blob)
+        self.count += len(records)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class DatasetChunk:
+    """
+    One chunk of a memory-mapped dataset
+
+    records and moves_blob are views into the mapped file (no copies);
+    unpacking states or decoding moves creates new arrays/lists.
+    """
+
+    def __init__(self, records, moves_blob):
+        self.records = records
+        self.moves_blob = moves_blob
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def packed_states(self):
+        return self.records['state']
+
+    @property
+    def depths(self):
+        return self.records['depth']
+
+    @property
+    def solve_times(self):
+        return self.records['solve_time']
+
+    def states(self):
+        """Unpacked (n, 54) sticker array for the whole chunk"""
+        return unpack_states(self.records['state'])
+
+    def move_codes(self, i):
+        """Move codes of record i (a zero-copy view for the 18-move alphabet)"""
+        start = int(self.records['moves_offset'][i])
+        end = int(self.records['moves_offset'][i + 1]) if i + 1 < len(self) else len(self.moves_blob)
+        codes = self.moves_blob[start:end]
+        if codes.size and codes.max() >= 0x80:
+            return np.array(decode_varints(self.moves_blob, start, end))
+        return codes
+
+    def moves(self, i):
+        """Move sequence of record i as move names"""
+        return [MOVE_NAMES[code] for code in self.move_codes(i)]
+
+
+class DatasetReader:
+    def __init__(self, path):
+        """
+        Memory-mapped, chunked dataset reader
+
+        Only chunk headers are read up front; record data stays on disk
+        until a chunk is accessed.
+        """
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, state_format = FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a cube dataset file")
+        if version != VERSION or state_format != STATE_FORMAT_3X3:
+            raise ValueError(f"Unsupported dataset version {version} / state format {state_format}")
+
+        # (record offset, record count, blob offset, blob size) per chunk
+        self._chunks = []
+        offset = FILE_HEADER.size
+        while offset < len(self._map):
+            magic, count, blob_size = CHUNK_HEADER.unpack_from(self._map, offset)
+            if magic != CHUNK_MAGIC:
+                raise ValueError(f"Corrupt chunk header at byte {offset}")
+            records_offset = offset + CHUNK_HEADER.size
+            blob_offset = records_offset + count * RECORD_DTYPE.itemsize
+            self._chunks.append((records_offset, count, blob_offset, blob_size))
+            offset = blob_offset + blob_size
+
+    def __len__(self):
+        return sum(count for _, count, _, _ in self._chunks)
+
+    @property
+    def num_chunks(self):
+        return len(self._chunks)
+
+    def chunk(self, index):
+        if self._map is None:
+            raise ValueError("The dataset reader is closed")
+        records_offset, count, blob_offset, blob_size = self._chunks[index]
+        records = np.frombuffer(self._map, dtype=RECORD_DTYPE, count=count, offset=records_offset)
+        blob = np.frombuffer(self._map, dtype=np.uint8, count=blob_size, offset=blob_offset)
+        return DatasetChunk(records, blob)
+
+    def iter_chunks(self):
+        """Yield DatasetChunk objects in file order"""
+        for index in range(len(self._chunks)):
+            yield self.chunk(index)
+
+    def __iter__(self):
+        """Yield (CubeState, moves, depth, solve_time) per record (convenient, not fast)"""
+        for chunk in self.iter_chunks():
+            states = chunk.states()
+            for i in range(len(chunk)):
+                depth = int(chunk.depths[i])
+                solve_time = float(chunk.solve_times[i])
+                # Unknown values were written as DEPTH_UNKNOWN / NaN
+                yield (CubeState(states[i].tobytes()), chunk.moves(i),
+                       None if depth == DEPTH_UNKNOWN else depth,
+                       None if np.isnan(solve_time) else solve_time)
+
+    def close(self):
+        """
+        Close the file and unmap it
+        Chunk views (DatasetChunk.records and moves_blob) still referenced
+        keep the mapping alive; it is unmapped when the last one is released
+        """
+        if self._map is None:
+            return
+        try:
+            self._map.close()
+        except BufferError:
+            pass    # exported to live views: dropping our reference defers the unmap to them
+        self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
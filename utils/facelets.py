@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# rubiks_solver/utils/facelets.py
+
+"""
+Facelet-string codec
+A state is written as the usual 54-character facelet string: the stickers
+in [U, R, F, D, L, B] face order, each named by the face whose colour it
+shows when solved ('UUUUUUUUURRR...' is the solved cube). The compact form
+is the 18-byte packed state of utils/dataset.py in URL-safe base64, which
+is exactly 24 characters with no padding. It does not store the
+centres, so states whose centres are not 0-5 in face order (recoloured,
+or after slice moves) are rejected with ValueError instead of being
+silently re-centred; use the facelet string for those.
+
+The bulk functions work on whole buffers of newline-separated lines (a
+file, bytes or str) and go straight to or from an (n, 54) uint8 array with
+a lookup table, so no per-state Python objects are created.
+"""
+
+import base64
+import binascii
+import sys
+import os
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.state import CubeState, as_state
+from utils.dataset import pack_states, unpack_states, PACKED_STATE_SIZE
+
+FACELET_LETTERS = 'URFDLB'
+FACELET_LENGTH = 54
+BASE64_LENGTH = PACKED_STATE_SIZE * 4 // 3     # 24
+
+_INVALID = 255
+
+# Byte -> colour for facelet letters (upper or lower case), 255 otherwise
+_LETTER_LOOKUP = np.full(256, _INVALID, dtype=np.uint8)
+for _color, _letter in enumerate(FACELET_LETTERS):
+    _LETTER_LOOKUP[ord(_letter)] = _LETTER_LOOKUP[ord(_letter.lower())] = _color
+
+# Bytes of the URL-safe base64 alphabet
+_BASE64_ALPHABET = np.zeros(256, dtype=bool)
+_BASE64_ALPHABET[np.frombuffer(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_',
+                               dtype=np.uint8)] = True
+
+_COLOR_BYTES = np.frombuffer(FACELET_LETTERS.encode('ascii'), dtype=np.uint8)
+_COLOR_TRANSLATION = bytes.maketrans(bytes(range(6)), FACELET_LETTERS.encode('ascii'))
+
+
+# ----------------------------------------------------------------------
+# Single states
+# ----------------------------------------------------------------------
+
+def _decode_base64(data):
+    """Strict URL-safe base64 decoding: any character outside the alphabet raises"""
+    chars = np.frombuffer(data, dtype=np.uint8)
+    if not _BASE64_ALPHABET[chars].all():
+        raise ValueError("Invalid base64 data: characters outside the URL-safe alphabet")
+    try:
+        return base64.b64decode(data, altchars=b'-_', validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid base64 data: {e}") from None
+
+
+def to_facelet_string(state):
+    """54-character URFDLB facelet string of a state"""
+    return as_state(state).stickers.translate(_COLOR_TRANSLATION).decode('ascii')
+
+
+def from_facelet_string(text):
+    """
+    CubeState from a 54-character URFDLB facelet string
+
+    Raises:
+        ValueError: if the string has the wrong length or other letters
+    """
+    text = text.strip()
+    if len(text) != FACELET_LENGTH:
+        raise ValueError(f"A facelet string needs {FACELET_LENGTH} letters, got {len(text)}")
+    try:
+        colors = _LETTER_LOOKUP[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    except UnicodeEncodeError:
+        colors = None
+    if colors is None or (colors == _INVALID).any():
+        bad = sorted({c for c in text if c.upper() not in FACELET_LETTERS})
+        raise ValueError(f"Facelet strings use only the letters {FACELET_LETTERS}, got {bad}")
+    return CubeState(colors.tobytes())
+
+
+def to_base64(state):
+    """
+    Compact 24-character URL-safe base64 form of a state
+
+    Raises:
+        ValueError: if the centres are not 0-5 in face order
+    """
+    packed = pack_states(np.frombuffer(as_state(state).stickers, dtype=np.uint8))
+    return base64.urlsafe_b64encode(packed.tobytes()).decode('ascii')
+
+
+def from_base64(text):
+    """
+    CubeState from its 24-character base64 form
+
+    Raises:
+        ValueError: if the text is not a valid encoded state
+    """
+    text = text.strip()
+    if len(text) != BASE64_LENGTH:
+        raise ValueError(f"An encoded state has {BASE64_LENGTH} characters, got {len(text)}")
+    try:
+        packed = _decode_base64(text.encode('ascii'))
+    except (UnicodeEncodeError, ValueError) as e:
+        raise ValueError(f"Invalid base64 state {text!r}: {e}") from None
+    states = unpack_states(np.frombuffer(packed, dtype=np.uint8))
+    if states.max() > 5:
+        raise ValueError(f"Invalid base64 state {text!r}: sticker colours out of range")
+    return CubeState(states[0].tobytes())
+
+
+def parse_state(text):
+    """CubeState from either a facelet string or its base64 form"""
+    text = text.strip()
+    if len(text) == BASE64_LENGTH:
+        return from_base64(text)
+    return from_facelet_string(text)
+
+
+# ----------------------------------------------------------------------
+# Bulk buffers
+# ----------------------------------------------------------------------
+
+def _read_buffer(source):
+    """Raw bytes of a path, binary/text file object, bytes-like or str"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, str):
+        return source.encode('ascii')
+    if isinstance(source, os.PathLike):
+        with open(source, 'rb') as f:
+            return f.read()
+    data = source.read()
+    return data.encode('ascii') if isinstance(data, str) else data
+
+
+def _split_lines(source, width):
+    """
+    View a buffer of fixed-width lines as an (n, width) uint8 array
+    Accepts '\\n' or '\\r\\n' line ends and a missing final line end
+    """
+    data = np.frombuffer(_read_buffer(source), dtype=np.uint8)
+    if not data.size:
+        return np.empty((0, width), dtype=np.uint8)
+    ending = b'\r\n' if data.size > width and data[width] == ord('\r') else b'\n'
+    ending = np.frombuffer(ending, dtype=np.uint8)
+    stride = width + len(ending)
+    remainder = data.size % stride
+    if remainder:
+        if remainder != width:
+            raise ValueError(f"Buffer is not made of {width}-character lines")
+        data = np.concatenate([data, ending])
+    rows = data.reshape(-1, stride)
+    bad = np.flatnonzero((rows[:, width:] != ending).any(axis=1))
+    if bad.size:
+        raise ValueError(f"Line {bad[0] + 1} is not {width} characters long")
+    return rows[:, :width]
+
+
+def _join_lines(rows):
+    """Bytes of an (n, width) uint8 array, one newline-terminated line per row"""
+    out = np.empty((len(rows), rows.shape[1] + 1), dtype=np.uint8)
+    out[:, :-1] = rows
+    out[:, -1] = ord('\n')
+    return out.tobytes()
+
+
+def parse_facelet_buffer(source):
+    """
+    Parse newline-separated facelet strings in one pass
+
+    Args:
+        source: Path (os.PathLike), file object, bytes or str
+
+    Returns:
+        uint8 array of shape (n, 54) with colours 0-5
+
+    Raises:
+        ValueError: on a malformed line (reported by line number)
+    """
+    colors = _LETTER_LOOKUP[_split_lines(source, FACELET_LENGTH)]
+    bad = np.flatnonzero((colors == _INVALID).any(axis=1))
+    if bad.size:
+        raise ValueError(f"Line {bad[0] + 1} has letters outside {FACELET_LETTERS}")
+    return colors
+
+
+def format_facelet_buffer(states):
+    """
+    Serialize states as newline-terminated facelet strings
+
+    Args:
+        states: Array-like of shape (n, 54) with colours 0-5
+
+    Returns:
+        bytes, 55 per state
+    """
+    states = np.asarray(states, dtype=np.uint8).reshape(-1, 54)
+    if states.size and states.max() > 5:
+        raise ValueError("Sticker colours must be in the range 0-5")
+    return _join_lines(_COLOR_BYTES[states])
+
+
+def parse_base64_buffer(source):
+    """
+    Parse newline-separated base64 states in one pass
+
+    Returns:
+        uint8 array of shape (n, 54) with colours 0-5
+    """
+    rows = _split_lines(source, BASE64_LENGTH)
+    # 18-byte blocks encode to 24 characters without padding, so the
+    # concatenated lines are one valid base64 stream
+    packed = _decode_base64(rows.tobytes())
+    states = unpack_states(np.frombuffer(packed, dtype=np.uint8))
+    bad = np.flatnonzero((states > 5).any(axis=1))
+    if bad.size:
+        raise ValueError(f"Line {bad[0] + 1} has sticker colours out of range")
+    return states
+
+
+def format_base64_buffer(states):
+    """
+    Serialize states as newline-terminated 24-character base64 lines
+
+    Raises:
+        ValueError: if a state's centres are not 0-5 in face order
+    """
+    packed = pack_states(states)
+    encoded = np.frombuffer(base64.urlsafe_b64encode(packed.tobytes()), dtype=np.uint8)
+    return _join_lines(encoded.reshape(-1, BASE64_LENGTH))
+
+
+def load_states(path):
+    """Read a file of facelet strings or base64 states (detected from the first line)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    first = data.split(b'\n', 1)[0].rstrip(b'\r')
+    if len(first) == BASE64_LENGTH:
+        return parse_base64_buffer(data)
+    return parse_facelet_buffer(data)
+
+
+def save_states(path, states, compact=False):
+    """Write states one per line, as facelet strings or (compact) base64"""
+    data = format_base64_buffer(states) if compact else format_facelet_buffer(states)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def demo_facelets():
+    """Round-trip single states and time the bulk codec"""
+    import time
+    from utils.scramble import Scrambler, random_states
+
+    print("🔤 Facelet-string codec")
+    print("=" * 45)
+    state = Scrambler(seed=3).random_state()
+    text = to_facelet_string(state)
+    compact = to_base64(state)
+    print(f"📝 Facelets: {text}")
+    print(f"📦 Base64:   {compact}")
+    print(f"✅ Round trip: {from_facelet_string(text) == state and parse_state(compact) == state}")
+
+    states = random_states(200000, seed=1)
+    for name, fmt, parse in (('facelet', format_facelet_buffer, parse_facelet_buffer),
+                             ('base64', format_base64_buffer, parse_base64_buffer)):
+        start = time.monotonic()
+        data = fmt(states)
+        middle = time.monotonic()
+        parsed = parse(data)
+        end = time.monotonic()
+        print(f"⏱️  {name}: {len(states)} states, {len(data) / 1e6:.1f} MB, "
+              f"write {middle - start:.2f}s, read {end - middle:.2f}s, "
+              f"match {np.array_equal(parsed, states)}")
+
+
+if __name__ == "__main__":
+    demo_facelets()
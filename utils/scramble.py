@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# rubiks_solver/utils/scramble.py
+
+"""
+Random-state scrambler
+Samples cube states uniformly over all solvable states by drawing the
+permutation and orientation coordinates directly (with the permutation
+parity constraint), instead of applying a handful of random moves.
+"""
+
+from math import factorial
+import random
+import sys
+import os
+
+import numpy as np
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.cubie import (CubieCube, CORNER_FACELETS, EDGE_FACELETS, CORNER_COLORS, EDGE_COLORS,
+                        N_TWIST, N_FLIP, N_CORNER_PERM, N_EDGE_PERM)
+from solver.two_phase import TwoPhaseSolver
+
+# Number of states generated per NumPy pass in bulk mode (bounds peak memory)
+BULK_CHUNK_SIZE = 1 << 18
+
+# Solves tried per sampled state, each with a longer length limit and timeout
+SCRAMBLE_ATTEMPTS = 3
+
+
+def invert_moves(moves):
+    """Return the inverse of a move sequence"""
+    inverse = []
+    for move in reversed(moves):
+        if move.endswith("'"):
+            inverse.append(move[0])
+        elif move.endswith('2'):
+            inverse.append(move)
+        else:
+            inverse.append(move + "'")
+    return inverse
+
+
+_QUARTERS = {'': 1, '2': 2, "'": 3}
+_OPPOSITE = {'U': 'D', 'D': 'U', 'R': 'L', 'L': 'R', 'F': 'B', 'B': 'F'}
+
+
+def simplify_moves(moves, half_turns=True):
+    """
+    Cancel and merge turns of the same face (R R' -> nothing, R R -> R2),
+    also across turns of the opposite face, which commute (R L R' -> L)
+
+    Args:
+        moves: Move sequence; slice moves are kept as they are
+        half_turns: Write half turns as R2 (False: as R R, for the
+                    quarter-turn metric)
+
+    Returns:
+        The simplified move list
+    """
+    merged = []     # [face, quarter turns] or [slice move, None]
+    for move in moves:
+        face, turns = move[0], _QUARTERS.get(move[1:])
+        if face not in _OPPOSITE or turns is None:
+            merged.append([move, None])
+            continue
+        # Look back over the trailing turns of the same axis
+        target = None
+        for i in (len(merged) - 1, len(merged) - 2):
+            if i < 0 or merged[i][1] is None:
+                break
+            if merged[i][0] == face:
+                target = i
+                break
+            if merged[i][0] != _OPPOSITE[face]:
+                break
+        if target is None:
+            merged.append([face, turns])
+        else:
+            merged[target][1] = (merged[target][1] + turns) % 4
+            if not merged[target][1]:
+                del merged[target]
+    return _format_merged(merged, half_turns)
+
+
+def _format_merged(merged, half_turns):
+    moves = []
+    for face, turns in merged:
+        if turns is None:
+            moves.append(face)
+        elif turns == 2 and not half_turns:
+            moves += [face, face]
+        else:
+            moves.append(face + {1: '', 2: '2', 3: "'"}[turns])
+    return moves
+
+
+def history_solution(history, half_turns=True):
+    """Solution read off a known scramble: its inverse, simplified"""
+    return simplify_moves(invert_moves(history), half_turns)
+
+
+class Scrambler:
+    def __init__(self, seed=None, max_length=24, timeout=10.0):
+        """
+        Uniform random-state scrambler
+        seed: Seed for reproducible scrambles
+        max_length, timeout: Passed to the two-phase solver that turns a
+                             sampled state into a scramble sequence
+        """
+        self.rng = random.Random(seed)
+        self.solver = TwoPhaseSolver(max_length=max_length, timeout=timeout)
+
+    def random_cubie(self):
+        """
+        Sample a CubieCube uniformly from all solvable states
+
+        Every coordinate is drawn independently; the last corner twist and
+        edge flip follow from the others, and if the permutation parities
+        differ the last two edges are swapped, which maps the odd half of
+        the edge permutations onto the even half one-to-one.
+        """
+        cube = CubieCube()
+        cube.set_corner_perm(self.rng.randrange(N_CORNER_PERM))
+        cube.set_edge_perm(self.rng.randrange(N_EDGE_PERM))
+        cube.set_twist(self.rng.randrange(N_TWIST))
+        cube.set_flip(self.rng.randrange(N_FLIP))
+        if cube.corner_parity() != cube.edge_parity():
+            cube.ep[10], cube.ep[11] = cube.ep[11], cube.ep[10]
+        return cube
+
+    def random_state(self):
+        """Return a uniformly random solvable state as a CubeState"""
+        return self.random_cubie().to_state()
+
+    def scramble(self):
+        """
+        Return a random state together with a scramble sequence reaching it
+
+        The sequence is the inverse of a two-phase solution, so applying it
+        to a solved cube gives exactly the returned state. A state the
+        solver gives up on is retried with a longer length limit and
+        timeout, never replaced by a new sample (that would bias the
+        distribution towards easy states).
+        Raises RuntimeError if no attempt finds a sequence
+        """
+        cube = self.random_cubie()
+        solver = self.solver
+        for attempt in range(SCRAMBLE_ATTEMPTS):
+            if attempt:
+                # 20 moves always suffice; the timeout is what usually runs out
+                solver = TwoPhaseSolver(max_length=max(solver.max_length + 2, 22),
+                                        timeout=solver.timeout * 2)
+            solution = solver.solve_cubie(cube)
+            if solution is not None:
+                return cube.to_state(), invert_moves(solution)
+        raise RuntimeError(f"No scramble found in {SCRAMBLE_ATTEMPTS} attempts "
+                           f"(last limit {solver.max_length} moves, {solver.timeout:.1f}s)")
+
+
+def _unrank_permutations(ranks, n):
+    """Vectorized inverse of the lexicographic permutation rank"""
+    count = len(ranks)
+    rows = np.arange(count)
+    used = np.zeros((count, n), dtype=bool)
+    perms = np.empty((count, n), dtype=np.int8)
+    for i in range(n):
+        digit = (ranks // factorial(n - 1 - i)) % (n - i)
+        # Pick the digit-th element that is still unused
+        free_rank = np.cumsum(~used, axis=1) - 1
+        choice = np.argmax((free_rank == digit[:, None]) & ~used, axis=1)
+        perms[:, i] = choice
+        used[rows, choice] = True
+    return perms
+
+
+def _parities(perms):
+    """Vectorized permutation parity (inversion count mod 2)"""
+    n = perms.shape[1]
+    inversions = np.zeros(len(perms), dtype=np.int64)
+    for i in range(n - 1):
+        inversions += (perms[:, i + 1:] < perms[:, i:i + 1]).sum(axis=1)
+    return inversions & 1
+
+
+def _orientation_digits(values, base, length):
+    """Coordinate -> orientation array, with the last piece fixing the sum"""
+    digits = np.empty((len(values), length), dtype=np.int8)
+    for i in range(length - 2, -1, -1):
+        digits[:, i] = values % base
+        values = values // base
+    digits[:, length - 1] = (-digits[:, :length - 1].sum(axis=1, dtype=np.int64)) % base
+    return digits
+
+
+def _facelets_from_pieces(cp, co, ep, eo):
+    """Vectorized CubieCube.to_facelets for whole arrays of states"""
+    count = len(cp)
+    rows = np.arange(count)
+    facelets = np.empty((count, 54), dtype=np.uint8)
+    facelets[:, 4::9] = np.arange(6, dtype=np.uint8)  # centres
+    corner_facelets = np.array(CORNER_FACELETS)
+    corner_colors = np.array(CORNER_COLORS, dtype=np.uint8)
+    edge_facelets = np.array(EDGE_FACELETS)
+    edge_colors = np.array(EDGE_COLORS, dtype=np.uint8)
+    for i in range(8):
+        for k in range(3):
+            target = corner_facelets[i][(k + co[:, i]) % 3]
+            facelets[rows, target] = corner_colors[cp[:, i], k]
+    for i in range(12):
+        for k in range(2):
+            target = edge_facelets[i][(k + eo[:, i]) % 2]
+            facelets[rows, target] = edge_colors[ep[:, i], k]
+    return facelets
+
+
+def random_states(count, seed=None, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Generate many uniformly random solvable states at once
+
+    Args:
+        count: Number of states
+        seed: Seed for reproducible output
+        chunk_size: States generated per vectorized pass
+
+    Returns:
+        uint8 array of shape (count, 54): sticker colours 0-5 in
+        [U, R, F, D, L, B] face order, 9 stickers per face
+    """
+    rng = np.random.default_rng(seed)
+    result = np.empty((count, 54), dtype=np.uint8)
+    for start in range(0, count, chunk_size):
+        n = min(chunk_size, count - start)
+        cp = _unrank_permutations(rng.integers(0, N_CORNER_PERM, n), 8)
+        ep = _unrank_permutations(rng.integers(0, N_EDGE_PERM, n), 12)
+        co = _orientation_digits(rng.integers(0, N_TWIST, n), 3, 8)
+        eo = _orientation_digits(rng.integers(0, N_FLIP, n), 2, 12)
+
+        # Same parity fix as Scrambler.random_cubie
+        odd = _parities(cp) != _parities(ep)
+        ep[odd, 10], ep[odd, 11] = ep[odd, 11], ep[odd, 10]
+
+        result[start:start + n] = _facelets_from_pieces(cp, co, ep, eo)
+    return result
+
+
+def demo_scramble():
+    """Show a few random-state scrambles"""
+    scrambler = Scrambler(seed=2024)
+    print("🎲 Random-state scrambles")
+    print("=" * 30)
+    for i in range(1, 4):
+        state, moves = scrambler.scramble()
+        print(f"{i}. {' '.join(moves)} ({len(moves)} moves)")
+
+    states = random_states(100000, seed=2024)
+    print(f"\n📊 Generated {len(states)} states in bulk, array shape {states.shape}")
+
+
+if __name__ == "__main__":
+    demo_scramble()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# rubiks_solver/utils/svg.py
+
+"""
+Dependency-free SVG (and PNG) renderer for the 2D net
+The SVG markup for a net is built once per renderer as a template with 54
+colour slots; rendering a state is a single %-substitution of its colours.
+PNGs are rasterized and encoded with the standard library (zlib). Both are
+kept in a content-addressed LRU cache keyed by the sticker bytes, so a
+state is rendered once however often it is requested.
+
+Nothing here imports matplotlib or NumPy, and renderers are thread-safe
+(the cache is guarded by a lock, rendering itself has no shared state),
+so they can serve HTTP responses and batch reports from many threads.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import struct
+import threading
+import zlib
+import sys
+import os
+
+if not __package__:
+    # Run as a script: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.state import as_state
+
+# Same palette as utils/visual.COLORS (repeated so this module never
+# pulls in matplotlib)
+COLORS = ['#FFFFFF', '#FF0000', '#00FF00', '#FFFF00', '#FFA500', '#0000FF']
+FACE_LETTERS = 'URFDLB'
+
+# Top-left cell of each face in the 12 x 9 net (column, row), SVG axes
+NET_POSITIONS = [(3, 0), (6, 3), (3, 3), (3, 6), (0, 3), (9, 3)]
+NET_COLUMNS, NET_ROWS = 12, 9
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _hex_rgb(color):
+    return bytes.fromhex(color.lstrip('#'))
+
+
+def _png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+class SVGRenderer:
+    def __init__(self, sticker_size=30, labels=False, colors=COLORS, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Template-based net renderer
+        sticker_size: Sticker edge in pixels
+        labels: Print the face letter on each centre (SVG only)
+        colors: CSS colour per colour code 0-5
+        cache_size: Rendered images kept (per format); 0 disables the cache
+        """
+        self.sticker_size = sticker_size
+        self.labels = labels
+        self.colors = list(colors)
+        self.cache_size = cache_size
+        self.width = NET_COLUMNS * sticker_size + 2
+        self.height = NET_ROWS * sticker_size + 2
+        self._template = self._build_template()
+        self._palette = b''.join(_hex_rgb(color) for color in self.colors) + b'\x00\x00\x00\xff\xff\xff'
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _build_template(self):
+        size = self.sticker_size
+        parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" '
+                 f'height="{self.height}" viewBox="0 0 {self.width} {self.height}">'
+                 f'<g stroke="#000" stroke-width="1.5">']
+        for face, (column, row) in enumerate(NET_POSITIONS):
+            for index in range(9):
+                r, c = divmod(index, 3)
+                parts.append(f'<rect x="{(column + c) * size + 1}" y="{(row + r) * size + 1}" '
+                             f'width="{size}" height="{size}" fill="%s"/>')
+        parts.append('</g>')
+        if self.labels:
+            for face, (column, row) in enumerate(NET_POSITIONS):
+                parts.append(f'<text x="{(column + 1.5) * size + 1}" y="{(row + 1.5) * size + 1}" '
+                             f'font-family="sans-serif" font-size="{size // 2}" text-anchor="middle" '
+                             f'dominant-baseline="central">{FACE_LETTERS[face]}</text>')
+        parts.append('</svg>')
+        return ''.join(parts)
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _cached(self, kind, stickers, render):
+        key = (kind, stickers)
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+        # Render outside the lock; two threads may race on the same state,
+        # which only costs one redundant render
+        result = render(stickers)
+        if self.cache_size:
+            with self._lock:
+                self._cache[key] = result
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._cache), 'max_size': self.cache_size}
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    @staticmethod
+    def etag(state):
+        """Content hash of a state, usable as an HTTP ETag"""
+        return hashlib.blake2b(as_state(state).stickers, digest_size=8).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def render(self, state):
+        """SVG markup of a state's net"""
+        return self._cached('svg', as_state(state).stickers, self._render_svg)
+
+    def _render_svg(self, stickers):
+        colors = self.colors
+        return self._template % tuple([colors[c] for c in stickers])
+
+    def render_png(self, state):
+        """PNG bytes of a state's net (white background, black grid)"""
+        return self._cached('png', as_state(state).stickers, self._render_png)
+
+    def _render_png(self, stickers):
+        size = self.sticker_size
+        width = NET_COLUMNS * size + 1
+        # Palette image: indices 0-5 are the sticker colours
+        black, white = bytes([6]), bytes([7])
+
+        # Colour code (or None for empty cells) of every net cell
+        grid = [[None] * NET_COLUMNS for _ in range(NET_ROWS)]
+        for face, (column, row) in enumerate(NET_POSITIONS):
+            for index in range(9):
+                r, c = divmod(index, 3)
+                grid[row + r][column + c] = stickers[face * 9 + index]
+
+        rows = []
+        for cells in grid:
+            line = b''.join(black + bytes([cell]) * (size - 1) if cell is not None else white * size
+                            for cell in cells) + black
+            border = b''.join(black * size if cell is not None else white * size
+                              for cell in cells) + black
+            rows.append(b'\x00' + border)
+            rows.extend([b'\x00' + line] * (size - 1))
+        rows.append(b'\x00' + black * width)
+        header = struct.pack('>IIBBBBB', width, len(rows), 8, 3, 0, 0, 0)
+        return (b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', header) + _png_chunk(b'PLTE', self._palette)
+                + _png_chunk(b'IDAT', zlib.compress(b''.join(rows), 6)) + _png_chunk(b'IEND', b''))
+
+    def render_many(self, states, png=False, workers=None):
+        """Render many states across a thread pool; results in input order"""
+        render = self.render_png if png else self.render
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(render, states))
+
+    def save(self, state, path):
+        """Write a state's net to path (.svg or .png)"""
+        if path.lower().endswith('.png'):
+            with open(path, 'wb') as f:
+                f.write(self.render_png(state))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.render(state))
+
+
+_DEFAULT_RENDERER = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_renderer():
+    """Shared default renderer (created on first use)"""
+    global _DEFAULT_RENDERER
+    with _DEFAULT_LOCK:
+        if _DEFAULT_RENDERER is None:
+            _DEFAULT_RENDERER = SVGRenderer()
+        return _DEFAULT_RENDERER
+
+
+def render_svg(state):
+    """SVG markup of a state's net with the default renderer"""
+    return get_renderer().render(state)
+
+
+def render_png(state):
+    """PNG bytes of a state's net with the default renderer"""
+    return get_renderer().render_png(state)
+
+
+def demo_svg():
+    """Render a batch of random states and report throughput"""
+    import time
+    from utils.scramble import Scrambler
+
+    print("🖼️  SVG net renderer")
+    print("=" * 45)
+    scrambler = Scrambler(seed=4)
+    states = [scrambler.random_state() for _ in range(2000)]
+    renderer = SVGRenderer(labels=True)
+
+    for png in (False, True):
+        kind = 'PNG' if png else 'SVG'
+        start = time.monotonic()
+        images = renderer.render_many(states, png=png)
+        elapsed = time.monotonic() - start
+        print(f"⏱️  {kind}: {len(images)} states in {elapsed:.2f}s ({len(images) / elapsed:,.0f}/s, "
+              f"{len(images[0]):,} bytes each)")
+
+    start = time.monotonic()
+    renderer.render_many(states)
+    print(f"⚡ Cached SVG pass: {time.monotonic() - start:.3f}s, {renderer.cache_info()}")
+
+
+if __name__ == "__main__":
+    demo_svg()
@@ -4,36 +4,124 @@
 """
 Rubik's Cube Visualization using matplotlib
 Provides 2D and 3D visualization of cube states
+
+The module-level tables are read-only. pyplot itself keeps global figure
+state and is not thread-safe: render from worker threads with
+CubeRenderer3D on an axes of a matplotlib.figure.Figure, or with
+utils/svg.py.
 """
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from mpl_toolkits.mplot3d import Axes3D
+from matplotlib.colors import to_rgba_array
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from types import MappingProxyType
 import numpy as np
 import sys
 import os
 
-# Add the project root to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    # Run as a script: make the project root importable (imported as
+    # utils.visual, sys.path is left alone)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube.state import as_state
+from cube.moves import apply_moves
 
 # Color mapping for cube faces
-COLORS = {
+COLORS = MappingProxyType({
     0: '#FFFFFF',  # White (Up)
     1: '#FF0000',  # Red (Right)
     2: '#00FF00',  # Green (Front)
     3: '#FFFF00',  # Yellow (Down)
     4: '#FFA500',  # Orange (Left)
     5: '#0000FF'   # Blue (Back)
-}
+})
 
-FACE_NAMES = {
+FACE_NAMES = MappingProxyType({
     0: 'Up (White)',
     1: 'Right (Red)',
     2: 'Front (Green)',
     3: 'Down (Yellow)',
     4: 'Left (Orange)',
     5: 'Back (Blue)'
-}
+})
+
+# RGBA row per colour code, so a whole state maps to face colours in one lookup
+COLOR_RGBA = to_rgba_array([COLORS[color] for color in range(6)])
+COLOR_RGBA.flags.writeable = False
+
+# 3D placement of each face in a [0, 3]^3 cube (x: L->R, y: F->B, z: D->U):
+# top-left corner of sticker 0, then the directions of increasing column
+# and row, matching the reading order of the 2D net
+_FACE_FRAMES = [
+    ((0, 3, 3), (1, 0, 0), (0, -1, 0)),     # Up, back edge at the top
+    ((3, 0, 3), (0, 1, 0), (0, 0, -1)),     # Right
+    ((0, 0, 3), (1, 0, 0), (0, 0, -1)),     # Front
+    ((0, 0, 0), (1, 0, 0), (0, 1, 0)),      # Down, front edge at the top
+    ((0, 3, 3), (0, -1, 0), (0, 0, -1)),    # Left
+    ((3, 3, 3), (-1, 0, 0), (0, 0, -1)),    # Back
+]
+
+
+def _sticker_vertices():
+    """(54, 4, 3) array: the corners of every sticker, in state order"""
+    vertices = np.empty((54, 4, 3))
+    for face, (origin, col, row) in enumerate(_FACE_FRAMES):
+        origin, col, row = np.array(origin), np.array(col), np.array(row)
+        for index in range(9):
+            r, c = divmod(index, 3)
+            corner = origin + c * col + r * row
+            vertices[face * 9 + index] = [corner, corner + col, corner + col + row, corner + row]
+    return vertices
+
+
+STICKER_VERTICES = _sticker_vertices()
+STICKER_VERTICES.flags.writeable = False
+
+
+class CubeRenderer3D:
+    """
+    3D view of all 54 stickers as a single Poly3DCollection
+
+    The geometry is built once; update() only rewrites the collection's
+    face colours and set_view() only moves the camera, so both are cheap
+    re-renders of the same figure.
+    """
+
+    def __init__(self, ax=None, title=None):
+        if ax is None:
+            self.fig = plt.figure(figsize=(10, 8))
+            ax = self.fig.add_subplot(111, projection='3d')
+        else:
+            self.fig = ax.figure
+        self.ax = ax
+        self.collection = Poly3DCollection(STICKER_VERTICES, linewidths=1.5, edgecolors='black')
+        self.collection.set_facecolor(COLOR_RGBA[np.arange(54) // 9])
+        ax.add_collection3d(self.collection)
+        ax.set_xlim([0, 3])
+        ax.set_ylim([0, 3])
+        ax.set_zlim([0, 3])
+        ax.set_box_aspect((1, 1, 1))
+        ax.set_axis_off()
+        ax.view_init(elev=20, azim=-60)
+        if title:
+            ax.set_title(title, fontsize=16, fontweight='bold')
+
+    def update(self, cube_state, title=None):
+        """Recolour the stickers for a new state"""
+        stickers = np.frombuffer(as_state(cube_state).stickers, dtype=np.uint8)
+        self.collection.set_facecolor(COLOR_RGBA[stickers])
+        if title is not None:
+            self.ax.set_title(title, fontsize=16, fontweight='bold')
+        self.fig.canvas.draw_idle()
+
+    def set_view(self, elev=None, azim=None):
+        """Move the camera (degrees); None keeps the current angle"""
+        self.ax.view_init(elev=self.ax.elev if elev is None else elev,
+                          azim=self.ax.azim if azim is None else azim)
+        self.fig.canvas.draw_idle()
+
 
 class CubeVisualizer:
     def __init__(self):
@@ -45,10 +133,11 @@ class CubeVisualizer:
         Plot the cube as a 2D net (unfolded cube)
         
         Args:
-            cube_state: List of 6 faces, each face is a list of 9 stickers
+            cube_state: CubeState (or list of 6 faces of 9 stickers)
             title: Title for the plot
             save_path: Optional path to save the figure
         """
+        cube_state = as_state(cube_state)
         self.fig, self.ax = plt.subplots(1, 1, figsize=(12, 9))
         self.ax.set_xlim(0, 12)
         self.ax.set_ylim(0, 9)
@@ -128,30 +217,13 @@ class CubeVisualizer:
         Plot the cube in 3D
         
         Args:
-            cube_state: List of 6 faces, each face is a list of 9 stickers
+            cube_state: CubeState (or list of 6 faces of 9 stickers)
             title: Title for the plot
             save_path: Optional path to save the figure
         """
-        self.fig = plt.figure(figsize=(10, 8))
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        
-        # Define the 6 faces of the cube with their positions and orientations
-        self._draw_3d_cube_faces(cube_state)
-        
-        # Set equal aspect ratio and remove axes
-        self.ax.set_xlabel('X')
-        self.ax.set_ylabel('Y')
-        self.ax.set_zlabel('Z')
-        
-        # Set viewing angle
-        self.ax.view_init(elev=20, azim=45)
-        
-        # Set limits
-        self.ax.set_xlim([0, 3])
-        self.ax.set_ylim([0, 3])
-        self.ax.set_zlim([0, 3])
-        
-        plt.title(title, fontsize=16, fontweight='bold')
+        renderer = CubeRenderer3D(title=title)
+        renderer.update(cube_state)
+        self.fig, self.ax = renderer.fig, renderer.ax
         plt.tight_layout()
         
         if save_path:
@@ -160,57 +232,28 @@ class CubeVisualizer:
         plt.show()
         return self.fig
     
-    def _draw_3d_cube_faces(self, cube_state):
-        """Draw all 6 faces of the 3D cube"""
-        # Face definitions: (face_index, normal_vector, corner_positions)
-        faces_3d = [
-            # Up face (z=3)
-            (0, [0, 0, 1], [(0, 0, 3), (3, 0, 3), (3, 3, 3), (0, 3, 3)]),
-            # Down face (z=0)  
-            (3, [0, 0, -1], [(0, 0, 0), (0, 3, 0), (3, 3, 0), (3, 0, 0)]),
-            # Front face (y=0)
-            (2, [0, -1, 0], [(0, 0, 0), (3, 0, 0), (3, 0, 3), (0, 0, 3)]),
-            # Back face (y=3)
-            (5, [0, 1, 0], [(3, 3, 0), (0, 3, 0), (0, 3, 3), (3, 3, 3)]),
-            # Left face (x=0)
-            (4, [-1, 0, 0], [(0, 3, 0), (0, 0, 0), (0, 0, 3), (0, 3, 3)]),
-            # Right face (x=3)
-            (1, [1, 0, 0], [(3, 0, 0), (3, 3, 0), (3, 3, 3), (3, 0, 3)])
-        ]
-        
-        for face_idx, normal, corners in faces_3d:
-            self._draw_3d_face(cube_state[face_idx], face_idx, corners)
-    
-    def _draw_3d_face(self, face, face_idx, corners):
-        """Draw a single face in 3D"""
-        # For simplicity, we'll just color the entire face with the center sticker color
-        # In a more advanced implementation, you could draw individual stickers
-        
-        center_sticker = face[4]  # Center sticker (index 4)
-        color = COLORS[center_sticker]
-        
-        # Create face vertices
-        verts = [corners]
-        
-        # Add face to 3D plot
-        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-        face_collection = Poly3DCollection(verts, alpha=0.8, linewidths=2, edgecolors='black')
-        face_collection.set_facecolor(color)
-        self.ax.add_collection3d(face_collection)
-    
-    def animate_solve(self, initial_state, moves, title="Solving Animation"):
+    def animate_solve(self, initial_state, moves, title="Solving Animation", interval=0.5):
         """
-        Animate the solving process (placeholder for future implementation)
+        Animate the solving process in 3D, one move per frame
         
         Args:
             initial_state: Starting cube state
             moves: List of moves to apply
             title: Title for the animation
+            interval: Seconds per frame
         """
-        print(f"Animation placeholder: {title}")
-        print(f"Initial state: {initial_state}")
-        print(f"Moves to animate: {moves}")
-        # TODO: Implement step-by-step animation
+        renderer = CubeRenderer3D(title=title)
+        self.fig, self.ax = renderer.fig, renderer.ax
+        state = as_state(initial_state)
+        renderer.update(state, f"{title} (0/{len(moves)})")
+        plt.pause(interval)
+        for step, move in enumerate(moves, 1):
+            state = apply_moves(state, [move])
+            # Same figure and collection: only colours and camera change
+            renderer.update(state, f"{title} ({step}/{len(moves)}: {move})")
+            renderer.set_view(azim=renderer.ax.azim + 360 / max(len(moves), 1) / 4)
+            plt.pause(interval)
+        return self.fig
     
     def compare_states(self, state1, state2, titles=["State 1", "State 2"]):
         """
@@ -221,6 +264,7 @@ class CubeVisualizer:
             state2: Second cube state
             titles: Titles for each state
         """
+        state1, state2 = as_state(state1), as_state(state2)
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 9))
         
         # Plot first state